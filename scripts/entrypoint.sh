@@ -1,18 +1,22 @@
 #!/bin/sh
 
+# Record when the container started, to report cold-start times (core/startup.py)
+export CONTAINER_STARTED_AT="$(date +%s.%N)"
+
 # Set working directory
 cd src
 
 if [ "$ENVIRONMENT" = "development" ]; then
     # Run Django development server
     python -Xfrozen_modules=off manage.py runserver 0.0.0.0:8000
+elif [ "$1" = "release" ]; then
+    # One-off release step, run once per deployment before the new containers
+    # start: migrate database
+    exec python manage.py migrate --noinput
 else
-    # Migrate database
-    python manage.py migrate
-
-    # Collect static files
-    python manage.py collectstatic --noinput
-
-    # Run Gunicorn production server
-    gunicorn core.wsgi:application --bind 0.0.0.0:8000
-fi
\ No newline at end of file
+    # Static files are collected when the image is built, and migrations are
+    # applied by the release step; Gunicorn only checks that they are applied
+    # and refuses to start otherwise. Run Gunicorn production server,
+    # configured in core/gunicorn_config.py
+    exec gunicorn -c python:core.gunicorn_config
+fi
@@ -0,0 +1,40 @@
+#!/bin/sh
+#
+# Measure the cold start of the image: the time from starting a container to
+# its first served request. Usage:
+#
+#   scripts/measure_cold_start.sh <image> [docker run options...]
+#
+# The container's own report, logged by core/startup.py and sent back in the
+# first response's Server-Timing header, excludes the time Docker takes to
+# create the container; this measures from the outside.
+
+set -eu
+
+image="$1"
+shift
+
+start="$(date +%s.%N)"
+container="$(docker run --detach --publish 8000 "$@" "$image")"
+port="$(docker port "$container" 8000 | head -n 1 | cut -d : -f 2)"
+
+headers="$(mktemp)"
+trap 'docker rm --force "$container" > /dev/null; rm -f "$headers"' EXIT
+
+# Any response, even an error, means a worker served the request
+until curl --silent --output /dev/null --dump-header "$headers" \
+    "http://localhost:$port/"; do
+    if [ "$(docker inspect --format '{{.State.Running}}' "$container")" != "true" ]; then
+        echo "The container exited before serving a request:" >&2
+        docker logs "$container" >&2
+        exit 1
+    fi
+
+    sleep 0.05
+done
+
+end="$(date +%s.%N)"
+
+elapsed="$(awk "BEGIN { printf \"%.3f\", $end - $start }")"
+echo "First request served ${elapsed}s after docker run."
+grep -i '^server-timing' "$headers" || true
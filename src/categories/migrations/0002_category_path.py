@@ -0,0 +1,40 @@
+# Generated by Django 5.1.3 on 2026-10-19 09:12
+
+from django.db import migrations, models
+
+
+def populate_category_paths(apps, schema_editor):
+    """Build the materialized path of every existing category, top-down."""
+    Category = apps.get_model("categories", "Category")
+
+    categories = list(Category.objects.only("id", "parent_id"))
+    children = {}
+
+    for category in categories:
+        children.setdefault(category.parent_id, []).append(category)
+
+    stack = [(category, "") for category in children.get(None, [])]
+
+    while stack:
+        category, parent_path = stack.pop()
+        category.path = f"{parent_path}{category.id.hex}/"
+        stack.extend((child, category.path) for child in children.get(category.id, []))
+
+    Category.objects.bulk_update(categories, ["path"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('categories', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='category',
+            name='path',
+            field=models.CharField(db_index=True, default='', editable=False, max_length=1024),
+            preserve_default=False,
+        ),
+        migrations.RunPython(populate_category_paths, migrations.RunPython.noop),
+    ]
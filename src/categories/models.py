@@ -1,9 +1,43 @@
 """Models for the categories app."""
 
+from __future__ import annotations
+
 import uuid
 
 from colorfield.fields import ColorField
-from django.db import models
+from django.db import models, transaction
+from django.db.models.functions import Concat, Substr
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from core.cache import bump_cache_version
+
+PATH_SEPARATOR = "/"
+
+CATEGORIES_CACHE_VERSION = "categories"
+
+
+class CategoryQuerySet(models.QuerySet):
+    """QuerySet for the Category model."""
+
+    def descendants_of(
+        self, category: Category, *, include_self: bool = False
+    ) -> CategoryQuerySet:
+        """Return the categories below the given category, in one indexed lookup."""
+        queryset = self.filter(path__startswith=category.path)
+
+        if not include_self:
+            queryset = queryset.exclude(pk=category.pk)
+
+        return queryset
+
+    def ancestors_of(
+        self, category: Category, *, include_self: bool = False
+    ) -> CategoryQuerySet:
+        """Return the categories above the given category, in one primary-key lookup."""
+        ancestor_ids = category.path_ids if include_self else category.path_ids[:-1]
+
+        return self.filter(pk__in=ancestor_ids)
 
 
 class Category(models.Model):
@@ -17,6 +51,8 @@ class Category(models.Model):
         - icon: ImageField representing the category's icon
         - background_color: ColorField representing the category's background color
         - parent: ForeignKey to the category's parent category
+        - path: CharField holding the materialized path of ids from the root category
+          down to this one, e.g. "<root id>/<parent id>/<id>/"
         - created_at: DateTimeField representing when the category was created
         - updated_at: DateTimeField representing when the category was last updated
 
@@ -40,10 +76,21 @@ class Category(models.Model):
         related_name="subcategories",
     )
 
+    path = models.CharField(max_length=1024, db_index=True, editable=False)
+
     created_at = models.DateTimeField(auto_now_add=True)
 
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = CategoryQuerySet.as_manager()
+
+    @property
+    def path_ids(self) -> list[uuid.UUID]:
+        """Return the ids from the root category down to this one."""
+        return [
+            uuid.UUID(segment) for segment in self.path.split(PATH_SEPARATOR) if segment
+        ]
+
     @property
     def is_main_category(self) -> bool:
         """Return True if this is a main category (has no parent)."""
@@ -57,3 +104,76 @@ class Category(models.Model):
     def __str__(self) -> str:
         """Return the name of the category."""
         return self.name
+
+    def build_path(self) -> str:
+        """Return the materialized path for the category's current parent."""
+        parent_path = ""
+
+        if self.parent_id is not None:
+            parent_path = (
+                Category.objects.filter(pk=self.parent_id)
+                .values_list("path", flat=True)
+                .get()
+            )
+
+        return f"{parent_path}{self.pk.hex}{PATH_SEPARATOR}"
+
+    def save(self, *args, **kwargs) -> None:  # noqa: ANN002, ANN003
+        """
+        Save the category, keeping its path and its descendants' paths in sync.
+
+        Paths are read from the database rather than from cached instances, so a
+        stale in-memory parent cannot produce a wrong path. When the category moves,
+        every descendant is rewritten with a single UPDATE.
+        """
+        update_fields = kwargs.get("update_fields")
+
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, "path"}
+
+        with transaction.atomic():
+            old_path = (
+                Category.objects.filter(pk=self.pk)
+                .values_list("path", flat=True)
+                .first()
+            )
+
+            self.path = self.build_path()
+
+            super().save(*args, **kwargs)
+
+            if old_path and old_path != self.path:
+                Category.objects.filter(path__startswith=old_path).exclude(
+                    pk=self.pk
+                ).update(
+                    path=Concat(
+                        models.Value(self.path),
+                        Substr("path", len(old_path) + 1),
+                        output_field=models.CharField(),
+                    )
+                )
+
+
+@receiver(pre_delete, sender=Category)
+def detach_subcategory_paths(sender, instance, **kwargs) -> None:  # noqa: ANN001, ANN003, ARG001
+    """
+    Re-root the paths of a deleted category's descendants.
+
+    The parent foreign key is SET_NULL, so the deleted category's children become
+    top-level categories; stripping its path prefix keeps every descendant's path
+    consistent with that.
+    """
+    path = (
+        Category.objects.filter(pk=instance.pk).values_list("path", flat=True).first()
+    )
+
+    if path:
+        Category.objects.filter(path__startswith=path).exclude(pk=instance.pk).update(
+            path=Substr("path", len(path) + 1)
+        )
+
+
+@receiver([post_save, post_delete], sender=Category)
+def invalidate_categories_cache(sender, **kwargs) -> None:  # noqa: ANN001, ANN003, ARG001
+    """Invalidate cached category payloads in every worker."""
+    bump_cache_version(CATEGORIES_CACHE_VERSION)
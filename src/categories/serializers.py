@@ -8,6 +8,21 @@ from categories.models import Category
 class CategorySerializer(serializers.ModelSerializer):
     """Serializer for the Category model."""
 
+    CIRCULAR_PARENT_ERROR = (
+        "A category cannot be moved under itself or its subcategories."
+    )
+
+    def validate_parent(self, value: Category | None) -> Category | None:
+        """Validate that the parent is not the category itself or a descendant."""
+        if (
+            value is not None
+            and self.instance is not None
+            and value.path.startswith(self.instance.path)
+        ):
+            raise serializers.ValidationError(self.CIRCULAR_PARENT_ERROR)
+
+        return value
+
     class Meta:
         """Meta class for the Category serializer."""
 
@@ -2,7 +2,11 @@
 
 import pytest
 
-from categories.tests.test_helpers import create_emoji_test_category
+from categories.models import Category
+from categories.tests.test_helpers import (
+    create_emoji_test_category,
+    create_test_category,
+)
 
 
 @pytest.mark.django_db
@@ -78,3 +82,94 @@ def test_category_model_parent() -> None:
     assert subcategory_2.updated_at
     assert subcategory_2.is_main_category is False
     assert str(main_category) == main_category.name
+
+
+@pytest.mark.django_db
+def test_category_model_path() -> None:
+    """Test that the materialized path lists the ids from the root down."""
+    # Arrange
+    main_category = create_test_category(name="Entertainment")
+    subcategory = create_test_category(name="Movies")
+
+    # Act
+    subcategory.parent = main_category
+    subcategory.save()
+
+    # Assert
+    assert main_category.path == f"{main_category.id.hex}/"
+    assert subcategory.path == f"{main_category.id.hex}/{subcategory.id.hex}/"
+    assert subcategory.path_ids == [main_category.id, subcategory.id]
+
+
+@pytest.mark.django_db
+def test_category_model_descendants_and_ancestors() -> None:
+    """Test that descendants and ancestors are found from the path."""
+    # Arrange
+    food = create_test_category(name="Food")
+    restaurants = create_test_category(name="Restaurants")
+    takeaway = create_test_category(name="Takeaway")
+    create_test_category(name="Games")
+
+    restaurants.parent = food
+    restaurants.save()
+    takeaway.parent = restaurants
+    takeaway.save()
+
+    # Act
+    descendants = Category.objects.descendants_of(food)
+    subtree = Category.objects.descendants_of(food, include_self=True)
+    ancestors = Category.objects.ancestors_of(takeaway)
+
+    # Assert
+    assert set(descendants) == {restaurants, takeaway}
+    assert set(subtree) == {food, restaurants, takeaway}
+    assert set(ancestors) == {food, restaurants}
+
+
+@pytest.mark.django_db
+def test_category_model_move_updates_descendant_paths() -> None:
+    """Test that moving a category rewrites its descendants' paths."""
+    # Arrange
+    food = create_test_category(name="Food")
+    leisure = create_test_category(name="Leisure")
+    restaurants = create_test_category(name="Restaurants")
+    takeaway = create_test_category(name="Takeaway")
+
+    restaurants.parent = food
+    restaurants.save()
+    takeaway.parent = restaurants
+    takeaway.save()
+
+    # Act
+    restaurants.parent = leisure
+    restaurants.save()
+    takeaway.refresh_from_db()
+
+    # Assert
+    assert takeaway.path == f"{leisure.path}{restaurants.id.hex}/{takeaway.id.hex}/"
+    assert set(Category.objects.descendants_of(leisure)) == {restaurants, takeaway}
+    assert not Category.objects.descendants_of(food).exists()
+
+
+@pytest.mark.django_db
+def test_category_model_delete_parent_reroots_descendants() -> None:
+    """Test that deleting a parent makes its children top-level categories."""
+    # Arrange
+    food = create_test_category(name="Food")
+    restaurants = create_test_category(name="Restaurants")
+    takeaway = create_test_category(name="Takeaway")
+
+    restaurants.parent = food
+    restaurants.save()
+    takeaway.parent = restaurants
+    takeaway.save()
+
+    # Act
+    food.delete()
+    restaurants.refresh_from_db()
+    takeaway.refresh_from_db()
+
+    # Assert
+    assert restaurants.parent is None
+    assert restaurants.path == f"{restaurants.id.hex}/"
+    assert takeaway.path == f"{restaurants.id.hex}/{takeaway.id.hex}/"
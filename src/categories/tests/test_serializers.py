@@ -150,3 +150,43 @@ def test_emoji_max_length_invalid() -> None:
     assert serializer.errors == {
         "emoji": ["Ensure this field has no more than 2 characters."]
     }
+
+
+@pytest.mark.django_db
+def test_parent_descendant_invalid() -> None:
+    """Test that a category cannot be moved under one of its subcategories."""
+    # Arrange
+    main_category = create_test_category(name="Entertainment")
+    subcategory = create_test_category(name="Movies")
+
+    subcategory.parent = main_category
+    subcategory.save()
+
+    data = {}
+    data["parent"] = str(subcategory.id)
+
+    # Act
+    serializer = CategorySerializer(main_category, data=data, partial=True)
+    is_valid = serializer.is_valid()
+
+    # Assert
+    assert not is_valid
+    assert serializer.errors == {"parent": [CategorySerializer.CIRCULAR_PARENT_ERROR]}
+
+
+@pytest.mark.django_db
+def test_parent_self_invalid() -> None:
+    """Test that a category cannot be its own parent."""
+    # Arrange
+    category = create_test_category(name="Entertainment")
+
+    data = {}
+    data["parent"] = str(category.id)
+
+    # Act
+    serializer = CategorySerializer(category, data=data, partial=True)
+    is_valid = serializer.is_valid()
+
+    # Assert
+    assert not is_valid
+    assert serializer.errors == {"parent": [CategorySerializer.CIRCULAR_PARENT_ERROR]}
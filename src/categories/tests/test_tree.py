@@ -0,0 +1,69 @@
+"""Test the category tree helpers."""
+
+from categories.tree import build_category_tree
+
+
+def test_build_category_tree_nests_subcategories() -> None:
+    """Test that categories are nested under their parents."""
+    # Arrange
+    categories = [
+        {"id": "1", "name": "Entertainment", "parent": None},
+        {"id": "2", "name": "Movies", "parent": "1"},
+        {"id": "3", "name": "Cinema", "parent": "2"},
+        {"id": "4", "name": "Food", "parent": None},
+    ]
+
+    # Act
+    tree = build_category_tree(categories)
+
+    # Assert
+    assert [node["name"] for node in tree] == ["Entertainment", "Food"]
+    assert tree[0]["subcategories"][0]["name"] == "Movies"
+    assert tree[0]["subcategories"][0]["subcategories"][0]["name"] == "Cinema"
+    assert tree[1]["subcategories"] == []
+
+
+def test_build_category_tree_child_before_parent() -> None:
+    """Test that the input order does not matter."""
+    # Arrange
+    categories = [
+        {"id": "2", "name": "Movies", "parent": "1"},
+        {"id": "1", "name": "Entertainment", "parent": None},
+    ]
+
+    # Act
+    tree = build_category_tree(categories)
+
+    # Assert
+    assert len(tree) == 1
+    assert tree[0]["subcategories"][0]["name"] == "Movies"
+
+
+def test_build_category_tree_subtree() -> None:
+    """Test that a subtree can be selected by its root id."""
+    # Arrange
+    categories = [
+        {"id": "1", "name": "Entertainment", "parent": None},
+        {"id": "2", "name": "Movies", "parent": "1"},
+        {"id": "3", "name": "Cinema", "parent": "2"},
+    ]
+
+    # Act
+    tree = build_category_tree(categories, root_id="2")
+
+    # Assert
+    assert len(tree) == 1
+    assert tree[0]["name"] == "Movies"
+    assert tree[0]["subcategories"][0]["name"] == "Cinema"
+
+
+def test_build_category_tree_unknown_root() -> None:
+    """Test that an unknown root id returns an empty tree."""
+    # Arrange
+    categories = [{"id": "1", "name": "Entertainment", "parent": None}]
+
+    # Act
+    tree = build_category_tree(categories, root_id="missing")
+
+    # Assert
+    assert tree == []
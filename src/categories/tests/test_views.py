@@ -1,5 +1,7 @@
 """Test the Category views."""
 
+from collections.abc import Callable
+
 import pytest
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test import Client
@@ -472,3 +474,193 @@ class TestDeleteCategoryView:
 
         # Assert
         assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+class TestConditionalGetCategoryView:
+    """Test ETag and If-None-Match handling for categories."""
+
+    @pytest.mark.django_db
+    def test_list_categories_not_modified(self, client: Client) -> None:
+        """Test that listing categories with a matching ETag returns 304."""
+        # Arrange
+        user = create_test_user()
+        create_emoji_test_category(name="Entertainment", emoji="🎬")
+
+        client.force_login(user)
+        etag = client.get("/api/categories/")["ETag"]
+
+        # Act
+        response = client.get("/api/categories/", headers={"If-None-Match": etag})
+
+        # Assert
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response["ETag"] == etag
+
+    @pytest.mark.django_db
+    def test_retrieve_category_modified_after_update(self, client: Client) -> None:
+        """Test that a category ETag changes once the category is updated."""
+        # Arrange
+        user = create_test_user()
+        category = create_emoji_test_category(name="Entertainment", emoji="🎬")
+
+        client.force_login(user)
+        etag = client.get(f"/api/categories/{category.id}/")["ETag"]
+
+        category.name = "Movies"
+        category.save()
+
+        # Act
+        response = client.get(
+            f"/api/categories/{category.id}/", headers={"If-None-Match": etag}
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response["ETag"] != etag
+        assert response.json()["name"] == "Movies"
+
+    @pytest.mark.django_db
+    def test_list_categories_modified_after_delete(self, client: Client) -> None:
+        """Test that the list ETag changes once a category is deleted."""
+        # Arrange
+        user = create_test_user()
+        create_emoji_test_category(name="Entertainment", emoji="🎬")
+        category = create_emoji_test_category(name="Food", emoji="🍕")
+
+        client.force_login(user)
+        etag = client.get("/api/categories/")["ETag"]
+
+        category.delete()
+
+        # Act
+        response = client.get("/api/categories/", headers={"If-None-Match": etag})
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.json()) == 1
+
+
+class TestCategoryTreeView:
+    """Test the category tree endpoints."""
+
+    @pytest.mark.django_db
+    def test_tree_success(
+        self, client: Client, django_assert_num_queries: Callable
+    ) -> None:
+        """Test that the full tree is returned with subcategories nested."""
+        # Arrange
+        user = create_test_user()
+        entertainment = create_emoji_test_category(name="Entertainment", emoji="🍿")
+        movies = create_emoji_test_category(name="Movies", emoji="🎥")
+        create_emoji_test_category(name="Food", emoji="🍕")
+
+        movies.parent = entertainment
+        movies.save()
+
+        client.force_login(user)
+
+        # Act
+        # session, user, ETag aggregate and one query for every category.
+        with django_assert_num_queries(4):
+            response = client.get("/api/categories/tree/")
+
+        response_data = response.json()
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert [node["name"] for node in response_data] == ["Entertainment", "Food"]
+        assert response_data[0]["subcategories"][0]["name"] == "Movies"
+        assert response_data[0]["subcategories"][0]["subcategories"] == []
+
+    @pytest.mark.django_db
+    def test_subtree_success(self, client: Client) -> None:
+        """Test that the subtree under a category is returned."""
+        # Arrange
+        user = create_test_user()
+        entertainment = create_emoji_test_category(name="Entertainment", emoji="🍿")
+        movies = create_emoji_test_category(name="Movies", emoji="🎥")
+
+        movies.parent = entertainment
+        movies.save()
+
+        client.force_login(user)
+
+        # Act
+        response = client.get(f"/api/categories/{entertainment.id}/tree/")
+        response_data = response.json()
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response_data["id"] == str(entertainment.id)
+        assert response_data["subcategories"][0]["id"] == str(movies.id)
+
+    @pytest.mark.django_db
+    def test_subtree_not_found(self, client: Client) -> None:
+        """Test that the subtree of a non-existent category returns 404."""
+        # Arrange
+        user = create_test_user()
+        client.force_login(user)
+
+        # Act
+        response = client.get("/api/categories/nonexistent-id/tree/")
+
+        # Assert
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    @pytest.mark.django_db
+    def test_tree_not_modified(self, client: Client) -> None:
+        """Test that requesting the tree with a matching ETag returns 304."""
+        # Arrange
+        user = create_test_user()
+        create_emoji_test_category(name="Entertainment", emoji="🍿")
+
+        client.force_login(user)
+        etag = client.get("/api/categories/tree/")["ETag"]
+
+        # Act
+        response = client.get("/api/categories/tree/", headers={"If-None-Match": etag})
+
+        # Assert
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+class TestCachedCategoryListView:
+    """Test the cached category list."""
+
+    @pytest.mark.django_db
+    def test_list_categories_invalidated_on_delete(self, client: Client) -> None:
+        """Test that deleting a category invalidates the cached list."""
+        # Arrange
+        user = create_test_user()
+        create_emoji_test_category(name="Entertainment", emoji="🎬")
+        category = create_emoji_test_category(name="Food", emoji="🍕")
+
+        client.force_login(user)
+        client.get("/api/categories/")
+
+        # Act
+        client.delete(f"/api/categories/{category.id}/")
+        response = client.get("/api/categories/")
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["name"] for item in response.json()] == ["Entertainment"]
+
+    @pytest.mark.django_db
+    def test_list_categories_not_modified_has_cache_headers(
+        self, client: Client
+    ) -> None:
+        """Test that a 304 for the category list carries the cache headers."""
+        # Arrange
+        user = create_test_user()
+        create_emoji_test_category(name="Entertainment", emoji="🎬")
+
+        client.force_login(user)
+        etag = client.get("/api/categories/")["ETag"]
+
+        # Act
+        response = client.get("/api/categories/", headers={"If-None-Match": etag})
+
+        # Assert
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert "max-age=" in response["Cache-Control"]
@@ -0,0 +1,37 @@
+"""Helpers for assembling the category hierarchy."""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+def build_category_tree(
+    categories: list[dict[str, Any]], root_id: str | None = None
+) -> list[dict[str, Any]]:
+    """
+    Nest serialized categories under their parents in a single linear pass.
+
+    Each category gains a ``subcategories`` list. Returns the top-level categories,
+    or only the category with ``root_id`` (and its subtree) when one is given; an
+    unknown ``root_id`` returns an empty list. Categories whose parent is not in
+    ``categories`` are treated as top-level.
+    """
+    nodes = {
+        str(category["id"]): {**category, "subcategories": []}
+        for category in categories
+    }
+
+    roots = []
+
+    for node in nodes.values():
+        parent_id = str(node["parent"]) if node["parent"] is not None else None
+
+        if parent_id in nodes:
+            nodes[parent_id]["subcategories"].append(node)
+        else:
+            roots.append(node)
+
+    if root_id is not None:
+        return [nodes[root_id]] if root_id in nodes else []
+
+    return roots
@@ -1,14 +1,58 @@
 """Views for the categories app."""
 
 from rest_framework import viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.response import Response
 
-from categories.models import Category
+from categories.models import CATEGORIES_CACHE_VERSION, Category
 from categories.serializers import CategorySerializer
+from categories.tree import build_category_tree
+from core.cache import CachedReferenceDataMixin
+from core.conditional import etag_matches, make_etag, not_modified_response
+from core.replicas import ReplicaReadMixin
 
 
-class CategoryViewSet(viewsets.ModelViewSet):
+class CategoryViewSet(
+    ReplicaReadMixin, CachedReferenceDataMixin, viewsets.ModelViewSet
+):
     """ViewSet for the Category model."""
 
+    cache_version_name = CATEGORIES_CACHE_VERSION
+
     queryset = Category.objects.all()
     serializer_class = CategorySerializer
     pagination_class = None
+
+    def _tree_response(self, root_id: str | None = None) -> Response:
+        """Return the nested category hierarchy, loaded in a single query."""
+        queryset = Category.objects.order_by("name")
+        variant = self.get_etag_variant()
+        etag = make_etag(
+            self.get_collection_etag_version(queryset), "tree", root_id, variant
+        )
+
+        if etag_matches(self.request.headers.get("If-None-Match"), etag):
+            return not_modified_response(etag)
+
+        categories = self.get_cached_payload(
+            "tree",
+            lambda: list(self.get_serializer(queryset, many=True).data),
+        )
+        tree = build_category_tree(categories, root_id=root_id)
+
+        if root_id is not None and not tree:
+            raise NotFound
+
+        return Response(tree if root_id is None else tree[0], headers={"ETag": etag})
+
+    @action(detail=False, methods=["get"], url_path="tree")
+    def tree(self, request: Request) -> Response:  # noqa: ARG002
+        """Return every top-level category with its subcategories nested inside."""
+        return self._tree_response()
+
+    @action(detail=True, methods=["get"], url_path="tree")
+    def subtree(self, request: Request, pk: str) -> Response:  # noqa: ARG002
+        """Return a category with its subcategories nested inside."""
+        return self._tree_response(root_id=pk)
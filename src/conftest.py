@@ -0,0 +1,21 @@
+"""Shared pytest fixtures."""
+
+from collections.abc import Iterator
+
+import pytest
+
+from core.cache import payload_cache
+from currency.conversion import rate_table_cache
+from expenses.settle_up import settle_up_cache
+
+
+@pytest.fixture(autouse=True)
+def _clear_payload_cache() -> Iterator[None]:
+    """Start every test with empty process-level payload caches."""
+    payload_cache.clear()
+    rate_table_cache.clear()
+    settle_up_cache.clear()
+    yield
+    payload_cache.clear()
+    rate_table_cache.clear()
+    settle_up_cache.clear()
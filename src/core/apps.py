@@ -0,0 +1,10 @@
+"""App configuration for the core app."""
+
+from django.apps import AppConfig
+
+
+class CoreConfig(AppConfig):
+    """App configuration for the core app."""
+
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "core"
@@ -0,0 +1,188 @@
+"""Versioned in-process caching of serialized payloads."""
+
+from __future__ import annotations
+
+import threading
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils.cache import patch_cache_control
+from rest_framework.response import Response
+
+from core.conditional import (
+    ConditionalGetMixin,
+    etag_matches,
+    not_modified_response,
+)
+from core.models import CacheVersion
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+    from django.db import models
+    from rest_framework.request import Request
+
+
+def get_cache_version(name: str) -> int:
+    """Return the current version of the named cached data."""
+    version = (
+        CacheVersion.objects.filter(name=name).values_list("version", flat=True).first()
+    )
+
+    return version or 0
+
+
+def bump_cache_version(name: str) -> None:
+    """Invalidate the named cached data in every worker by bumping its version."""
+    updated = CacheVersion.objects.filter(name=name).update(version=F("version") + 1)
+
+    if not updated:
+        try:
+            with transaction.atomic():
+                CacheVersion.objects.create(name=name, version=1)
+        except IntegrityError:
+            CacheVersion.objects.filter(name=name).update(version=F("version") + 1)
+
+
+class VersionedPayloadCache:
+    """
+    A process-level cache whose entries are only valid for one data version.
+
+    Entries are keyed by the cached data's name plus an arbitrary key; when the
+    version stored in the database moves on, the next lookup rebuilds the entry.
+    The number of entries is bounded, evicting the oldest first.
+    """
+
+    def __init__(self, max_entries: int = 128) -> None:
+        """Create an empty cache."""
+        self.max_entries = max_entries
+        self._entries: dict[Hashable, tuple[int, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get_or_build(
+        self, key: Hashable, version: int, build: Callable[[], Any]
+    ) -> Any:  # noqa: ANN401
+        """Return the payload cached for the key at this version, or build it."""
+        entry = self._entries.get(key)
+
+        if entry is not None and entry[0] == version:
+            return entry[1]
+
+        payload = build()
+
+        with self._lock:
+            self._entries.pop(key, None)
+
+            while len(self._entries) >= self.max_entries:
+                self._entries.pop(next(iter(self._entries)))
+
+            self._entries[key] = (version, payload)
+
+        return payload
+
+    def clear(self) -> None:
+        """Remove every cached payload."""
+        with self._lock:
+            self._entries.clear()
+
+
+class LRUPayloadCache(VersionedPayloadCache):
+    """
+    A versioned payload cache that evicts the least recently used entry first.
+
+    Suited to per-object payloads, where a few hot objects are read over and
+    over among many cold ones.
+    """
+
+    def get_or_build(
+        self, key: Hashable, version: int, build: Callable[[], Any]
+    ) -> Any:  # noqa: ANN401
+        """Return the payload cached for the key at this version, or build it."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+
+            if entry is not None and entry[0] == version:
+                # Reinserting the entry moves it to the end of the eviction order
+                self._entries[key] = entry
+
+                return entry[1]
+
+        return super().get_or_build(key, version, build)
+
+
+payload_cache = VersionedPayloadCache()
+
+
+class CachedReferenceDataMixin(ConditionalGetMixin):
+    """
+    Serve a near-static collection from the process-level payload cache.
+
+    The collection's version (bumped on every save or delete) is read once per
+    request and used both for the list ETag and to validate the cached payload,
+    so an unchanged list costs one small query and no serialization. Responses
+    carry long-lived private Cache-Control headers.
+    """
+
+    cache_version_name: ClassVar[str]
+
+    @cached_property
+    def cache_version(self) -> int:
+        """Return the collection's current version, read once per request."""
+        return get_cache_version(self.cache_version_name)
+
+    def get_collection_etag_version(self, queryset: models.QuerySet) -> str:  # noqa: ARG002
+        """Return the collection's cache version as the ETag version token."""
+        return str(self.cache_version)
+
+    def get_cached_payload(self, key: Hashable, build: Callable[[], Any]) -> Any:  # noqa: ANN401
+        """
+        Return a payload for this collection from the process-level cache.
+
+        Keys are fixed names such as ``"list"`` and never include the query
+        string: these collections ignore query parameters, so one entry serves
+        every request rather than one per arbitrary parameter combination.
+        """
+        return payload_cache.get_or_build(
+            (self.cache_version_name, self.request.get_host(), key),
+            self.cache_version,
+            build,
+        )
+
+    def finalize_response(
+        self,
+        request: Request,
+        response: Response,
+        *args,  # noqa: ANN002
+        **kwargs,  # noqa: ANN003
+    ) -> Response:
+        """Add the long-lived cache headers to successful reads."""
+        response = super().finalize_response(request, response, *args, **kwargs)
+
+        if request.method in ("GET", "HEAD") and response.status_code in (200, 304):
+            patch_cache_control(
+                response,
+                private=True,
+                max_age=settings.REFERENCE_DATA_CACHE_MAX_AGE,
+            )
+
+        return response
+
+    def list(self, request: Request, *args, **kwargs) -> Response:  # noqa: ANN002, ANN003, ARG002
+        """List the collection from the payload cache, or return 304."""
+        queryset = self.get_queryset()
+        etag = self.get_collection_etag(queryset)
+
+        if etag_matches(request.headers.get("If-None-Match"), etag):
+            return not_modified_response(etag)
+
+        data = self.get_cached_payload(
+            "list",
+            lambda: list(
+                self.get_serializer(self.filter_queryset(queryset), many=True).data
+            ),
+        )
+
+        return Response(data, headers={"ETag": etag})
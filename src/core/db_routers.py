@@ -0,0 +1,29 @@
+"""Database routers."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from core.replicas import read_database
+
+
+class ReplicaRouter:
+    """
+    Send reads to the database chosen for the current request, writes to default.
+
+    Reads only go to the replica inside ``replica_reads()`` and in the safe
+    requests ``ReplicaReadMixin`` sends there; everything else, including reads
+    inside write requests and transactions, stays on the primary.
+    """
+
+    def db_for_read(self, model: type, **hints: Any) -> str | None:  # noqa: ANN401, ARG002
+        """Return the database reads of the current context go to."""
+        return read_database.get()
+
+    def db_for_write(self, model: type, **hints: Any) -> str:  # noqa: ANN401, ARG002
+        """Send every write to the primary."""
+        return "default"
+
+    def allow_relation(self, obj1: object, obj2: object, **hints: Any) -> bool:  # noqa: ANN401, ARG002
+        """Allow relations between objects read from any copy of the database."""
+        return True
@@ -0,0 +1,168 @@
+"""
+Gunicorn configuration for production.
+
+Run with ``gunicorn -c python:core.gunicorn_config`` from ``src``. Every setting
+can be overridden with the environment variables below; worker and thread
+counts default to sizes derived from the CPUs available to the container.
+
+- GUNICORN_WORKER_CLASS: ``gthread`` (default), ``sync`` or ``uvicorn`` (ASGI,
+  requires the uvicorn package)
+- WEB_CONCURRENCY: number of worker processes
+- GUNICORN_THREADS: threads per ``gthread`` worker, also the size of each
+  worker's database connection pool unless ``DB_POOL_MAX_SIZE`` is set
+- GUNICORN_MAX_REQUESTS / GUNICORN_MAX_REQUESTS_JITTER: recycle a worker after
+  this many requests, to bound memory growth
+- GUNICORN_TIMEOUT / GUNICORN_GRACEFUL_TIMEOUT / GUNICORN_KEEPALIVE: seconds
+- GUNICORN_PRELOAD: load the app in the master before forking (default true)
+- GUNICORN_CHECK_MIGRATIONS: refuse to start while migrations are unapplied
+  (default true); they are applied by the release step, not on boot
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from gunicorn.arbiter import Arbiter
+    from gunicorn.workers.base import Worker
+
+WORKER_CLASSES = {
+    "sync": "sync",
+    "gthread": "gthread",
+    "uvicorn": "uvicorn.workers.UvicornWorker",
+}
+
+
+def available_cpus() -> int:
+    """Return the number of CPUs this process may run on, honouring CPU affinity."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+
+    return os.cpu_count() or 1
+
+
+def default_workers(worker_class: str, cpus: int) -> int:
+    """
+    Return the default number of workers for a worker class.
+
+    Sync workers handle one request at a time, so there are ``2 * cpus + 1`` of
+    them to keep the CPUs busy while requests wait on the database. Threaded
+    and ASGI workers overlap that waiting themselves, so one per CPU, plus one
+    for gthread to cover the GIL, is enough.
+    """
+    if worker_class == "sync":
+        return 2 * cpus + 1
+
+    if worker_class == "gthread":
+        return cpus + 1
+
+    return cpus
+
+
+def default_threads(worker_class: str) -> int:
+    """Return the default number of threads per worker for a worker class."""
+    return 4 if worker_class == "gthread" else 1
+
+
+def env_flag(name: str, *, default: bool) -> bool:
+    """Return a boolean environment variable."""
+    value = os.environ.get(name)
+
+    if value is None:
+        return default
+
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+_worker_class = os.environ.get("GUNICORN_WORKER_CLASS", "gthread")
+
+if _worker_class not in WORKER_CLASSES:
+    message = f"GUNICORN_WORKER_CLASS must be one of {', '.join(WORKER_CLASSES)}."
+    raise ValueError(message)
+
+wsgi_app = (
+    "core.asgi:application" if _worker_class == "uvicorn" else "core.wsgi:application"
+)
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:8000")
+worker_class = WORKER_CLASSES[_worker_class]
+workers = int(
+    os.environ.get(
+        "WEB_CONCURRENCY", str(default_workers(_worker_class, available_cpus()))
+    )
+)
+# Each worker sizes its database pool from this count once forked (core.warmup)
+threads = int(os.environ.get("GUNICORN_THREADS", str(default_threads(_worker_class))))
+
+preload_app = env_flag("GUNICORN_PRELOAD", default=True)
+check_migrations = env_flag("GUNICORN_CHECK_MIGRATIONS", default=True)
+max_requests = int(os.environ.get("GUNICORN_MAX_REQUESTS", "1000"))
+max_requests_jitter = int(os.environ.get("GUNICORN_MAX_REQUESTS_JITTER", "100"))
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", "30"))
+graceful_timeout = int(os.environ.get("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+# Longer than the load balancer's idle timeout, so it closes idle connections first
+keepalive = int(os.environ.get("GUNICORN_KEEPALIVE", "75"))
+
+accesslog = "-"
+errorlog = "-"
+
+
+def on_starting(server: Arbiter) -> None:
+    """Stop the server before it listens if the database is not migrated."""
+    if not check_migrations:
+        return
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+
+    import django  # noqa: PLC0415
+    from django.apps import apps  # noqa: PLC0415
+
+    # Already done by the preload; without it the master sets Django up here
+    if not apps.ready:
+        django.setup()
+
+    from core.startup import unapplied_migrations  # noqa: PLC0415
+
+    try:
+        pending = unapplied_migrations()
+    except Exception:
+        server.log.exception("Could not check the database's migrations.")
+        sys.exit(1)
+
+    if pending:
+        server.log.error(
+            "Unapplied migrations: %s. Run the release step first.", ", ".join(pending)
+        )
+        sys.exit(1)
+
+
+def when_ready(server: Arbiter) -> None:
+    """Import the app's modules in the master, to share them with every worker."""
+    if server.cfg.preload_app:
+        from core.warmup import load_url_modules  # noqa: PLC0415
+
+        load_url_modules()
+
+    from core.startup import seconds_since_start  # noqa: PLC0415
+
+    elapsed = seconds_since_start()
+
+    if elapsed is not None:
+        server.log.info("Ready to serve %.3fs after the container started.", elapsed)
+
+
+def post_fork(server: Arbiter, worker: Worker) -> None:  # noqa: ARG001
+    """Warm a new worker's caches when the app was preloaded before the fork."""
+    if server.cfg.preload_app:
+        from core.warmup import warm_worker  # noqa: PLC0415
+
+        warm_worker(server.cfg.threads)
+
+
+def post_worker_init(worker: Worker) -> None:
+    """Warm a worker's caches once it loaded the app itself, without preload."""
+    if not worker.cfg.preload_app:
+        from core.warmup import warm_worker  # noqa: PLC0415
+
+        warm_worker(worker.cfg.threads)
@@ -0,0 +1,163 @@
+"""Idempotency-Key support for create endpoints."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.exceptions import APIException, ValidationError
+from rest_framework.response import Response
+
+from core.models import IdempotencyKey
+
+if TYPE_CHECKING:
+    from django.contrib.auth.base_user import AbstractBaseUser
+    from rest_framework.request import Request
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+
+# Set on replayed responses, so clients can tell a replay from a fresh create
+REPLAYED_HEADER = "Idempotent-Replayed"
+
+
+class IdempotencyKeyReusedError(APIException):
+    """Raised when a key is sent again with a different request."""
+
+    status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+    default_detail = "This Idempotency-Key was already used for a different request."
+    default_code = "idempotency_key_reused"
+
+
+class IdempotencyKeyInProgressError(APIException):
+    """Raised when a key is sent again while its first request is still running."""
+
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = "A request with this Idempotency-Key is still being processed."
+    default_code = "idempotency_key_in_progress"
+
+
+def request_fingerprint(request: Request) -> str:
+    """Return a hash of a request's method, path and data."""
+    data = request.data
+
+    if hasattr(data, "lists"):
+        data = dict(data.lists())
+
+    payload = json.dumps(
+        [request.method, request.path, data], sort_keys=True, default=str
+    )
+
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def claim_idempotency_key(
+    user: AbstractBaseUser, key: str, fingerprint: str
+) -> tuple[IdempotencyKey, bool]:
+    """
+    Claim a key for a request, or return the row of an earlier request with it.
+
+    Claiming is one insert on the unique (user, key) index; the earlier row is
+    only read when the insert conflicts. A row older than
+    ``IDEMPOTENCY_KEY_TTL``, or one still without a response after
+    ``IDEMPOTENCY_KEY_LEASE`` because its request died, is reclaimed with a
+    conditional update, so only one of several concurrent retries can reclaim
+    it. Returns the row and whether it was claimed.
+    """
+    now = timezone.now()
+
+    try:
+        with transaction.atomic():
+            return (
+                IdempotencyKey.objects.create(
+                    user=user, key=key, fingerprint=fingerprint
+                ),
+                True,
+            )
+    except IntegrityError:
+        pass
+
+    existing = IdempotencyKey.objects.filter(user=user, key=key).first()
+
+    if existing is None:
+        # The request holding the key failed and released it in the meantime
+        raise IdempotencyKeyInProgressError
+
+    expired = Q(created_at__lt=now - timedelta(seconds=settings.IDEMPOTENCY_KEY_TTL))
+    abandoned = Q(
+        status_code__isnull=True,
+        created_at__lt=now - timedelta(seconds=settings.IDEMPOTENCY_KEY_LEASE),
+    )
+
+    reclaimed = IdempotencyKey.objects.filter(
+        expired | abandoned, pk=existing.pk
+    ).update(
+        fingerprint=fingerprint, status_code=None, response_body=None, created_at=now
+    )
+
+    if reclaimed:
+        existing.refresh_from_db()
+
+    return existing, bool(reclaimed)
+
+
+class IdempotentCreateMixin:
+    """
+    Make create idempotent for requests sent with an ``Idempotency-Key`` header.
+
+    The first request with a key runs the view and stores its response; retries
+    with the same key and the same request within ``IDEMPOTENCY_KEY_TTL``
+    replay that response without running the view again. Keys are scoped to the
+    user. A request that fails with an error releases its key, so it can be
+    retried once fixed.
+    """
+
+    INVALID_KEY_ERROR = "Idempotency-Key must be between 1 and 255 characters."
+
+    def create(self, request: Request, *args, **kwargs) -> Response:  # noqa: ANN002, ANN003
+        """Create an object, or replay the response to an earlier identical request."""
+        key = request.headers.get(IDEMPOTENCY_KEY_HEADER)
+
+        if key is None:
+            return super().create(request, *args, **kwargs)
+
+        if not key or len(key) > IdempotencyKey._meta.get_field("key").max_length:  # noqa: SLF001
+            raise ValidationError({IDEMPOTENCY_KEY_HEADER: self.INVALID_KEY_ERROR})
+
+        fingerprint = request_fingerprint(request)
+        stored, claimed = claim_idempotency_key(request.user, key, fingerprint)
+
+        if not claimed:
+            return self.replay(stored, fingerprint)
+
+        try:
+            response = super().create(request, *args, **kwargs)
+        except Exception:
+            stored.delete()
+            raise
+
+        IdempotencyKey.objects.filter(pk=stored.pk).update(
+            status_code=response.status_code, response_body=response.data
+        )
+
+        return response
+
+    def replay(self, stored: IdempotencyKey, fingerprint: str) -> Response:
+        """Return the stored response of an earlier request with the same key."""
+        if stored.fingerprint != fingerprint:
+            raise IdempotencyKeyReusedError
+
+        if stored.status_code is None:
+            raise IdempotencyKeyInProgressError
+
+        return Response(
+            stored.response_body,
+            status=stored.status_code,
+            headers={REPLAYED_HEADER: "true"},
+        )
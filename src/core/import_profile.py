@@ -0,0 +1,124 @@
+"""Profiling of the imports a server process makes at startup."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from collections import Counter
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+
+@dataclass(frozen=True)
+class ImportTime:
+    """
+    The time one module took to import.
+
+    Attributes:
+        module: The module's dotted name.
+        self_us: Microseconds spent importing the module itself.
+        cumulative_us: Microseconds including the modules it imported first.
+        depth: How deeply the import was nested, 0 for the modules imported
+            directly by the profiled code.
+
+    """
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(output: str) -> list[ImportTime]:
+    """Parse the report written to stderr by ``python -X importtime``."""
+    times = []
+
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+
+        self_us, cumulative_us, module = line.removeprefix("import time:").split("|")
+
+        if not self_us.strip().isdigit():
+            # The header line
+            continue
+
+        name = module.rstrip()
+        times.append(
+            ImportTime(
+                module=name.strip(),
+                self_us=int(self_us),
+                cumulative_us=int(cumulative_us),
+                depth=(len(name) - len(name.lstrip()) - 1) // 2,
+            )
+        )
+
+    return times
+
+
+def time_by_package(times: list[ImportTime]) -> Counter[str]:
+    """Return the import time, in microseconds, spent in each top-level package."""
+    totals: Counter[str] = Counter()
+
+    for time in times:
+        totals[time.module.partition(".")[0]] += time.self_us
+
+    return totals
+
+
+@dataclass(frozen=True)
+class ImportProfile:
+    """
+    The imports made by a fresh interpreter.
+
+    Attributes:
+        times: The time each module took, as reported by ``-X importtime``.
+            Modules imported with ``importlib.import_module``, such as Django's
+            app, admin and URL modules, are not reported; their time is counted
+            in the module that imported them.
+        modules: Every module imported, including those.
+
+    """
+
+    times: list[ImportTime]
+    modules: frozenset[str]
+
+
+def profile_imports(
+    module: str = "core.wsgi",
+    *,
+    load_urls: bool = False,
+    env: Mapping[str, str] | None = None,
+) -> ImportProfile:
+    """
+    Import a module in a fresh interpreter and return the imports it made.
+
+    With ``load_urls`` the URLconf is loaded too, importing the views a worker
+    otherwise imports on its first request. ``env`` replaces the environment,
+    so settings such as ``DJANGO_API_ONLY`` can be profiled.
+    """
+    code = f"import {module}"
+
+    if load_urls:
+        code += "; from django.urls import get_resolver; get_resolver().url_patterns"
+
+    code += "; import sys; print(*sys.modules, sep='\\n')"
+
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=settings.BASE_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    return ImportProfile(
+        times=parse_importtime(result.stderr),
+        modules=frozenset(result.stdout.split()),
+    )
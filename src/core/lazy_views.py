@@ -0,0 +1,34 @@
+"""Views whose modules are only imported when they are first requested."""
+
+from __future__ import annotations
+
+import functools
+from typing import TYPE_CHECKING, Any
+
+from django.utils.module_loading import import_string
+from django.views.decorators.csrf import csrf_exempt
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from django.http import HttpRequest, HttpResponse
+
+
+def lazy_view(view_path: str, **initkwargs: Any) -> Callable[..., HttpResponse]:  # noqa: ANN401
+    """
+    Return a view that imports the class-based view at ``view_path`` on first use.
+
+    For rarely used views with heavy imports, such as schema generation, so that
+    loading the URLconf does not import them into every worker. The view is
+    built once and reused; ``initkwargs`` are passed to its ``as_view``.
+    """
+
+    @functools.cache
+    def get_view() -> Callable[..., HttpResponse]:
+        return import_string(view_path).as_view(**initkwargs)
+
+    @csrf_exempt
+    def view(request: HttpRequest, *args, **kwargs) -> HttpResponse:  # noqa: ANN002, ANN003
+        return get_view()(request, *args, **kwargs)
+
+    return view
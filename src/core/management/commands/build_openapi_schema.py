@@ -0,0 +1,35 @@
+"""Management command to prebuild the OpenAPI schema."""
+
+from __future__ import annotations
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from core.schema import generate_schema, write_prebuilt_schema
+
+
+class Command(BaseCommand):
+    """
+    Generate the OpenAPI schema and write it to ``OPENAPI_SCHEMA_FILE``.
+
+    Run when the image is built, so the schema is read from the file instead of
+    generated in every process. The file is stamped with ``APP_VERSION`` and
+    only served while the running code has that version.
+    """
+
+    help = "Prebuild the OpenAPI schema for the current APP_VERSION."
+
+    def handle(self, *args, **options) -> None:  # noqa: ANN002, ANN003, ARG002
+        """Generate the schema and write it to the schema file."""
+        if not settings.APP_VERSION:
+            self.stderr.write(
+                self.style.WARNING(
+                    "APP_VERSION is not set, so the schema file will not be served."
+                )
+            )
+
+        write_prebuilt_schema(settings.OPENAPI_SCHEMA_FILE, generate_schema())
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Schema written to {settings.OPENAPI_SCHEMA_FILE}.")
+        )
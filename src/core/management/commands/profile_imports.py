@@ -0,0 +1,68 @@
+"""Management command to profile the imports of a server process."""
+
+from __future__ import annotations
+
+import os
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from core.import_profile import profile_imports, time_by_package
+
+
+class Command(BaseCommand):
+    """
+    Report how long each module takes to import when a worker loads the app.
+
+    The module is imported in a fresh interpreter with ``python -X importtime``,
+    as this process has imported everything already. Modules Django imports
+    dynamically, such as the apps' models, are counted in the module that
+    imported them. Run it with ``DJANGO_API_ONLY=true`` to profile API-only
+    workers.
+    """
+
+    help = "Report the import time per module and package of core.wsgi."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add the command's arguments."""
+        parser.add_argument(
+            "--module", default="core.wsgi", help="Module to profile the import of."
+        )
+        parser.add_argument(
+            "--urls",
+            action="store_true",
+            help="Also load the URLconf, as a worker does on its first request.",
+        )
+        parser.add_argument(
+            "--limit", type=int, default=25, help="Number of modules listed."
+        )
+
+    def handle(self, *args, **options) -> None:  # noqa: ANN002, ANN003, ARG002
+        """Profile the import and report the slowest modules and packages."""
+        profile = profile_imports(
+            options["module"], load_urls=options["urls"], env=os.environ
+        )
+        times = profile.times
+        total = sum(time.self_us for time in times)
+
+        self.stdout.write(f"{'cumulative ms':>14} {'self ms':>9}  module")
+
+        for time in sorted(times, key=lambda time: -time.cumulative_us)[
+            : options["limit"]
+        ]:
+            self.stdout.write(
+                f"{time.cumulative_us / 1000:>14.1f} {time.self_us / 1000:>9.1f}  "
+                f"{'  ' * time.depth}{time.module}"
+            )
+
+        self.stdout.write(f"\n{'self ms':>14} {'share':>9}  package")
+
+        for package, self_us in time_by_package(times).most_common(options["limit"]):
+            self.stdout.write(
+                f"{self_us / 1000:>14.1f} {self_us / total:>9.1%}  {package}"
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{len(profile.modules)} modules imported in {total / 1000:.1f} ms."
+            )
+        )
@@ -0,0 +1,47 @@
+"""Management command to delete expired idempotency keys."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser
+from django.utils import timezone
+
+from core.models import IdempotencyKey
+
+
+class Command(BaseCommand):
+    """
+    Delete the idempotency keys older than ``IDEMPOTENCY_KEY_TTL``.
+
+    Expired keys are found on the ``created_at`` index and deleted in batches,
+    each one DELETE statement, so pruning a large backlog never holds locks on
+    many rows at once.
+    """
+
+    help = "Delete expired idempotency keys."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add the command's arguments."""
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=10_000,
+            help="Number of keys deleted per statement.",
+        )
+
+    def handle(self, *args, **options) -> None:  # noqa: ANN002, ANN003, ARG002
+        """Delete the expired keys batch by batch."""
+        cutoff = timezone.now() - timedelta(seconds=settings.IDEMPOTENCY_KEY_TTL)
+        expired = IdempotencyKey.objects.filter(created_at__lt=cutoff)
+        deleted = 0
+
+        while batch := list(
+            expired.order_by("created_at").values_list("pk", flat=True)[
+                : options["batch_size"]
+            ]
+        ):
+            deleted += IdempotencyKey.objects.filter(pk__in=batch).delete()[0]
+
+        self.stdout.write(self.style.SUCCESS(f"{deleted} idempotency keys pruned."))
@@ -0,0 +1,138 @@
+"""Models for the core app."""
+
+import uuid
+from typing import ClassVar
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.db.models import F
+
+
+class VersionedModelMixin:
+    """
+    Bump a model's ``version`` field on every save of an existing row.
+
+    Every write path, including the admin and management commands, then moves
+    the version on, so ETags and If-Match checks built on it never miss a
+    change. The version is incremented in the UPDATE itself, so concurrent
+    saves cannot both write the same version, and read back afterwards.
+    """
+
+    def save(self, *args, **kwargs) -> None:  # noqa: ANN002, ANN003
+        """Save the object, bumping its version if it already exists."""
+        if self._state.adding:
+            super().save(*args, **kwargs)
+            return
+
+        if kwargs.get("update_fields") is not None:
+            kwargs["update_fields"] = {*kwargs["update_fields"], "version"}
+
+        self.version = F("version") + 1
+        super().save(*args, **kwargs)
+        self.refresh_from_db(fields=["version"])
+
+
+class CacheVersion(models.Model):
+    """
+    A version counter for cached data, shared by every worker through the database.
+
+    Attributes:
+        - id: UUID field representing the counter's unique identifier
+        - name: CharField representing the name of the cached data
+        - version: PositiveBigIntegerField bumped whenever the cached data changes
+        - updated_at: DateTimeField representing when the version was last bumped
+
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+
+    name = models.CharField(max_length=100, unique=True)
+
+    version = models.PositiveBigIntegerField(default=0)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self) -> str:
+        """Return the string representation of the cache version."""
+        return f"{self.name} (v{self.version})"
+
+
+class LastWrite(models.Model):
+    """
+    When a user last wrote, shared by every worker through the database.
+
+    Requests of users who wrote within ``REPLICA_PIN_SECONDS`` read from the
+    primary, so they see their own changes whatever client or worker they use.
+
+    Attributes:
+        - user: OneToOneField to the user, also the row's primary key
+        - written_at: DateTimeField representing when the user last wrote
+
+    """
+
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        primary_key=True,
+        on_delete=models.CASCADE,
+        related_name="last_write",
+    )
+
+    written_at = models.DateTimeField()
+
+    def __str__(self) -> str:
+        """Return the string representation of the last write."""
+        return f"{self.user_id} wrote at {self.written_at}"
+
+
+class IdempotencyKey(models.Model):
+    """
+    The stored outcome of a request sent with an ``Idempotency-Key`` header.
+
+    A row is claimed before the view runs, with no status code, and completed
+    with the response afterwards, so retries of the same request replay that
+    response instead of running the view again.
+
+    Attributes:
+        - id: UUID field representing the row's unique identifier
+        - user: ForeignKey to the user who sent the request
+        - key: CharField representing the client's idempotency key
+        - fingerprint: CharField holding a hash of the request's method, path and
+          body, used to reject a key reused for a different request
+        - status_code: PositiveSmallIntegerField representing the response's
+          status code, or None while the request is still being handled
+        - response_body: JSONField holding the response's data
+        - created_at: DateTimeField representing when the key was first used
+
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="idempotency_keys",
+    )
+
+    key = models.CharField(max_length=255)
+
+    fingerprint = models.CharField(max_length=64)
+
+    status_code = models.PositiveSmallIntegerField(null=True, blank=True)
+
+    response_body = models.JSONField(null=True, blank=True, encoder=DjangoJSONEncoder)
+
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        """Meta class for the IdempotencyKey model."""
+
+        constraints: ClassVar[list] = [
+            models.UniqueConstraint(
+                fields=["user", "key"], name="unique_idempotency_key_per_user"
+            )
+        ]
+
+    def __str__(self) -> str:
+        """Return the string representation of the idempotency key."""
+        return f"{self.user_id} - {self.key}"
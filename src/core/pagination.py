@@ -1,6 +1,23 @@
 """Pagination classes."""
 
-from rest_framework.pagination import PageNumberPagination
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+if TYPE_CHECKING:
+    from django.db.models import Model, QuerySet
+    from rest_framework.request import Request
+    from rest_framework.views import APIView
 
 
 class StandardResultsSetPagination(PageNumberPagination):
@@ -8,3 +25,132 @@ class StandardResultsSetPagination(PageNumberPagination):
 
     page_size = 10
     page_size_query_param = "limit"
+
+
+class KeysetPagination(BasePagination):
+    """
+    Cursor pagination that seeks straight to the next page with a key comparison.
+
+    Rows are ordered by the view's ``ordering`` (all descending), whose last
+    field must be unique. The cursor holds the last row's values, and the next
+    page is every row after it in that order, so reading page 1,000 costs the same
+    index range scan as reading page 1 and rows added meanwhile never shift pages.
+    """
+
+    INVALID_CURSOR_ERROR = "Invalid cursor."
+
+    ordering: ClassVar[tuple[str, ...]] = ("-created_at", "-id")
+    page_size = 20
+    max_page_size = 100
+    page_size_query_param = "limit"
+    cursor_query_param = "cursor"
+
+    def paginate_queryset(
+        self,
+        queryset: QuerySet,
+        request: Request,
+        view: APIView | None = None,
+    ) -> list[Model]:
+        """Return one page of rows after the cursor."""
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.ordering = getattr(view, "ordering", self.ordering)
+        fields = [field.lstrip("-") for field in self.ordering]
+
+        queryset = queryset.order_by(*self.ordering)
+        cursor = self.decode_cursor(request)
+
+        if cursor is not None:
+            try:
+                queryset = queryset.filter(self.after(fields, cursor))
+            except (DjangoValidationError, TypeError, ValueError) as error:
+                raise NotFound(self.INVALID_CURSOR_ERROR) from error
+
+        rows = list(queryset[: self.page_size + 1])
+        self.has_next = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+
+        self.next_cursor = None
+
+        if self.has_next:
+            self.next_cursor = [self.get_value(rows[-1], field) for field in fields]
+
+        return rows
+
+    def after(self, fields: list[str], cursor: list[Any]) -> Q:
+        """
+        Return a filter for the rows after the cursor in the descending ordering.
+
+        For ``(date, id)`` this is ``date <= d AND (date < d OR (date = d AND
+        id < i))``; the redundant bound on the first field lets the database
+        answer it with one range scan of a ``(date, id)`` index.
+        """
+        condition = Q()
+
+        for index, field in enumerate(fields):
+            equal = {fields[position]: cursor[position] for position in range(index)}
+            condition |= Q(**equal, **{f"{field}__lt": cursor[index]})
+
+        return Q(**{f"{fields[0]}__lte": cursor[0]}) & condition
+
+    def get_value(self, row: Model, field: str) -> str:
+        """Return a row's value for a cursor field as a string."""
+        value = getattr(row, field)
+
+        return value.isoformat() if hasattr(value, "isoformat") else str(value)
+
+    def get_page_size(self, request: Request) -> int:
+        """Return the requested page size, capped at the maximum."""
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+
+        return max(1, min(size, self.max_page_size))
+
+    def decode_cursor(self, request: Request) -> list[Any] | None:
+        """Decode the cursor query parameter, if any."""
+        encoded = request.query_params.get(self.cursor_query_param)
+
+        if not encoded:
+            return None
+
+        try:
+            cursor = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+        except (binascii.Error, ValueError) as error:
+            raise NotFound(self.INVALID_CURSOR_ERROR) from error
+
+        if not isinstance(cursor, list) or len(cursor) != len(self.ordering):
+            raise NotFound(self.INVALID_CURSOR_ERROR)
+
+        return cursor
+
+    def encode_cursor(self, cursor: list[Any]) -> str:
+        """Encode cursor values for the query string."""
+        return base64.urlsafe_b64encode(json.dumps(cursor).encode()).decode()
+
+    def get_next_link(self) -> str | None:
+        """Return the URL of the next page, or None on the last page."""
+        if self.next_cursor is None:
+            return None
+
+        return replace_query_param(
+            self.request.build_absolute_uri(),
+            self.cursor_query_param,
+            self.encode_cursor(self.next_cursor),
+        )
+
+    def get_paginated_response(self, data: list) -> Response:
+        """Return a page of results with the link to the next page."""
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_paginated_response_schema(self, schema: dict) -> dict:
+        """Return the schema of a paginated response."""
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
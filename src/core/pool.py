@@ -0,0 +1,60 @@
+"""Statistics of the database connection pools."""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING, Any
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+
+def summarize_pool_stats(stats: Mapping[str, int]) -> dict[str, Any]:
+    """
+    Summarize the counters of a psycopg pool.
+
+    ``in_use`` and ``waiting`` are current values; the request, wait and error
+    counters are cumulative since the worker started.
+    """
+    requests = stats.get("requests_num", 0)
+    wait_ms = stats.get("requests_wait_ms", 0)
+
+    return {
+        "min_size": stats.get("pool_min", 0),
+        "max_size": stats.get("pool_max", 0),
+        "size": stats.get("pool_size", 0),
+        "available": stats.get("pool_available", 0),
+        "in_use": stats.get("pool_size", 0) - stats.get("pool_available", 0),
+        "waiting": stats.get("requests_waiting", 0),
+        "requests": requests,
+        "requests_queued": stats.get("requests_queued", 0),
+        "requests_errors": stats.get("requests_errors", 0),
+        "average_acquire_ms": round(wait_ms / requests, 3) if requests else 0,
+        "connections_opened": stats.get("connections_num", 0),
+        "connections_lost": stats.get("connections_lost", 0),
+    }
+
+
+def get_pool_stats() -> dict[str, Any]:
+    """
+    Return the statistics of this worker's connection pool per database.
+
+    Every worker process has its own pools, so the process id is included to
+    tell workers apart; databases without a pool are reported as unpooled.
+    Only the primary and the replica in use are reported.
+    """
+    databases = {}
+
+    for alias in filter(None, (DEFAULT_DB_ALIAS, settings.REPLICA_DATABASE)):
+        pool = getattr(connections[alias], "pool", None)
+
+        databases[alias] = (
+            {"pooled": True, **summarize_pool_stats(pool.get_stats())}
+            if pool is not None
+            else {"pooled": False}
+        )
+
+    return {"pid": os.getpid(), "databases": databases}
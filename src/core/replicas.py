@@ -0,0 +1,126 @@
+"""Routing of safe reads to a read replica, with read-your-writes stickiness."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from core.models import LastWrite
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from django.contrib.auth.base_user import AbstractBaseUser
+    from django.http import HttpRequest, HttpResponse
+    from rest_framework.request import Request
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+# The database reads of the current request or task are sent to, None for default
+read_database: ContextVar[str | None] = ContextVar("read_database", default=None)
+
+
+@contextmanager
+def replica_reads() -> Iterator[None]:
+    """Send the ORM reads made inside the block to the replica, if one is set up."""
+    token = read_database.set(settings.REPLICA_DATABASE)
+
+    try:
+        yield
+    finally:
+        read_database.reset(token)
+
+
+def record_write(user: AbstractBaseUser) -> None:
+    """Record that a user just wrote, pinning their reads to the primary."""
+    now = timezone.now()
+
+    if LastWrite.objects.filter(user=user).update(written_at=now):
+        return
+
+    try:
+        with transaction.atomic():
+            LastWrite.objects.create(user=user, written_at=now)
+    except IntegrityError:
+        LastWrite.objects.filter(user=user).update(written_at=now)
+
+
+def is_pinned_to_primary(request: Request) -> bool:
+    """Return True if the user wrote recently and must read from the primary."""
+    if not request.user.is_authenticated:
+        return False
+
+    return LastWrite.objects.filter(
+        user=request.user,
+        written_at__gt=timezone.now() - timedelta(seconds=settings.REPLICA_PIN_SECONDS),
+    ).exists()
+
+
+class ReplicaReadMixin:
+    """
+    Serve a view set's safe requests from the read replica.
+
+    Users who wrote within the last ``REPLICA_PIN_SECONDS``, as recorded by
+    ``PrimaryPinMiddleware``, keep reading from the primary, so they always see
+    their own changes. The check needs the authenticated user, so it is made
+    once the request is authenticated, and authentication and permission
+    checks always read from the primary.
+    """
+
+    def initial(self, request: Request, *args, **kwargs) -> None:  # noqa: ANN002, ANN003
+        """Authenticate the request, then send its reads to the replica if safe."""
+        super().initial(request, *args, **kwargs)
+
+        if (
+            settings.REPLICA_DATABASE
+            and request.method in SAFE_METHODS
+            and not is_pinned_to_primary(request)
+        ):
+            self.replica_token = read_database.set(settings.REPLICA_DATABASE)
+
+    def dispatch(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:  # noqa: ANN002, ANN003
+        """Handle the request, going back to the primary afterwards."""
+        self.replica_token = None
+
+        try:
+            return super().dispatch(request, *args, **kwargs)
+        finally:
+            if self.replica_token is not None:
+                read_database.reset(self.replica_token)
+
+
+class PrimaryPinMiddleware:
+    """
+    Pin a user to the primary database for a short while after they write.
+
+    Successful unsafe requests record the user's last write in the database,
+    which ``ReplicaReadMixin`` honours, so a user never reads from a replica
+    that has not yet replicated their own write. The pin is kept per user
+    rather than per client, so it also holds for token-authenticated clients,
+    which keep no cookies, and across the user's devices.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        """Wrap the next handler."""
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        """Handle the request, pinning the user after a successful write."""
+        response = self.get_response(request)
+
+        # Django REST framework sets the user it authenticated on the request
+        if (
+            settings.REPLICA_DATABASE
+            and request.method not in SAFE_METHODS
+            and response.status_code < 400  # noqa: PLR2004
+            and request.user.is_authenticated
+        ):
+            record_write(request.user)
+
+        return response
@@ -0,0 +1,137 @@
+"""OpenAPI schema generated once per code version and served from memory."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import TYPE_CHECKING, Any
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils import translation
+from django.utils.cache import patch_cache_control
+from drf_spectacular.settings import spectacular_settings
+from drf_spectacular.views import SpectacularAPIView
+
+from core.cache import VersionedPayloadCache
+from core.conditional import etag_matches, make_etag, not_modified_response
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from rest_framework.request import Request
+    from rest_framework.response import Response
+
+# Rendered schemas per API version, language and format. The code, and so the
+# schema, cannot change during a process's life, so entries never go stale.
+schema_cache = VersionedPayloadCache(max_entries=32)
+
+
+def generate_schema(
+    request: Request | None = None, api_version: str | None = None
+) -> dict[str, Any]:
+    """Introspect the views and serializers to generate the public schema."""
+    generator = spectacular_settings.DEFAULT_GENERATOR_CLASS(api_version=api_version)
+
+    return generator.get_schema(request=request, public=True)
+
+
+def write_prebuilt_schema(path: Path, schema: dict[str, Any]) -> None:
+    """Write a schema to a file, stamped with the code version it describes."""
+    path.write_text(
+        json.dumps({"app_version": settings.APP_VERSION, "schema": schema}),
+        encoding="utf-8",
+    )
+
+
+def load_prebuilt_schema() -> dict[str, Any] | None:
+    """
+    Return the schema written at build time, if it describes the running code.
+
+    The file is ignored when it is missing, when ``APP_VERSION`` is not set, or
+    when it was built for another version, so a stale file is never served.
+    """
+    path = settings.OPENAPI_SCHEMA_FILE
+
+    if not settings.APP_VERSION or not path.is_file():
+        return None
+
+    prebuilt = json.loads(path.read_text(encoding="utf-8"))
+
+    if prebuilt.get("app_version") != settings.APP_VERSION:
+        return None
+
+    return prebuilt["schema"]
+
+
+class CachedSchemaView(SpectacularAPIView):
+    """
+    Serve the OpenAPI schema, generating and rendering it once per process.
+
+    The default schema is read from the file prebuilt at image build time when
+    it matches the running code, and generated on the first request otherwise.
+    Responses carry an ETag, so the Swagger and Redoc pages revalidate their
+    copy with a 304 instead of downloading the schema again.
+    """
+
+    def _get_schema_response(self, request: Request) -> HttpResponse | Response:
+        """Return the cached schema in the negotiated format, or a 304."""
+        if not self.serve_public or self.urlconf or self.patterns:
+            return super()._get_schema_response(request)
+
+        version = (
+            self.api_version or request.version or self._get_version_parameter(request)
+        )
+        content, content_type, etag = schema_cache.get_or_build(
+            (version, translation.get_language(), request.accepted_media_type),
+            0,
+            lambda: self.render_schema(request, version),
+        )
+
+        if etag_matches(request.headers.get("If-None-Match"), etag):
+            return not_modified_response(etag)
+
+        response = HttpResponse(
+            content,
+            content_type=content_type,
+            headers={
+                "ETag": etag,
+                "Content-Disposition": (
+                    f'inline; filename="{self._get_filename(request, version)}"'
+                ),
+            },
+        )
+        patch_cache_control(response, no_cache=True)
+
+        return response
+
+    def render_schema(
+        self, request: Request, version: str | None
+    ) -> tuple[bytes, str, str]:
+        """Return the rendered schema, its content type and its ETag."""
+        schema = None
+
+        if version is None and translation.get_language() == settings.LANGUAGE_CODE:
+            schema = load_prebuilt_schema()
+
+        if schema is None:
+            schema = generate_schema(request, version)
+
+        renderer = request.accepted_renderer
+        content = renderer.render(
+            schema, request.accepted_media_type, self.get_renderer_context()
+        )
+
+        if isinstance(content, str):
+            content = content.encode(renderer.charset)
+
+        content_type = renderer.media_type
+
+        if renderer.charset:
+            content_type += f"; charset={renderer.charset}"
+
+        return (
+            content,
+            content_type,
+            make_etag(settings.APP_VERSION or "0", hashlib.sha256(content).hexdigest()),
+        )
@@ -0,0 +1,102 @@
+"""Shared serializer helpers."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from rest_framework.permissions import SAFE_METHODS
+
+if TYPE_CHECKING:
+    from django.db import models
+    from rest_framework import serializers
+    from rest_framework.request import Request
+
+
+def parse_list_param(request: Request | None, name: str) -> list[str] | None:
+    """Return a comma-separated query parameter as a list, or None if it is absent."""
+    if request is None or name not in request.query_params:
+        return None
+
+    return [
+        value.strip()
+        for value in request.query_params[name].split(",")
+        if value.strip()
+    ]
+
+
+class DynamicFieldsMixin:
+    """
+    Let clients trim and expand a model serializer's output with query parameters.
+
+    ``?fields=id,title`` limits the response to the listed fields and
+    ``?expand=currency`` replaces a related primary key with the nested object.
+    Expandable fields are declared on the serializer as
+    ``{field_name: (serializer_class, kwargs)}``; views should load them with
+    ``get_eager_queryset`` so expansion adds no per-row queries.
+
+    Both only apply to reads: on writes an expanded field would replace a
+    writable primary key with a read-only object.
+    """
+
+    expandable_fields: ClassVar[dict[str, tuple[type[serializers.Serializer], dict]]]
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+        """Apply the ``fields`` and ``expand`` query parameters."""
+        super().__init__(*args, **kwargs)
+
+        request = self.context.get("request")
+
+        if request is None or request.method not in SAFE_METHODS:
+            return
+
+        requested_fields = parse_list_param(request, "fields")
+
+        if requested_fields is not None:
+            for field_name in set(self.fields) - set(requested_fields):
+                self.fields.pop(field_name)
+
+        for field_name in self.get_expanded_fields(request):
+            if field_name in self.fields:
+                serializer_class, serializer_kwargs = self.expandable_fields[field_name]
+                self.fields[field_name] = serializer_class(
+                    read_only=True, **serializer_kwargs
+                )
+
+    @classmethod
+    def get_expanded_fields(cls, request: Request | None) -> list[str]:
+        """Return the requested fields that can be expanded."""
+        if request is None or request.method not in SAFE_METHODS:
+            return []
+
+        expand = parse_list_param(request, "expand") or []
+
+        return [
+            field_name for field_name in expand if field_name in cls.expandable_fields
+        ]
+
+    @classmethod
+    def get_eager_queryset(
+        cls, queryset: models.QuerySet, request: Request | None
+    ) -> models.QuerySet:
+        """
+        Return the queryset with every related field the response needs preloaded.
+
+        Related objects are joined with ``select_related`` and collections are
+        fetched with ``prefetch_related``; primary-key only collections are still
+        prefetched so listing them does not query once per row.
+        """
+        requested_fields = parse_list_param(request, "fields")
+        expanded_fields = cls.get_expanded_fields(request)
+
+        for field_name in cls.Meta.fields:
+            if requested_fields is not None and field_name not in requested_fields:
+                continue
+
+            field = queryset.model._meta.get_field(field_name)  # noqa: SLF001
+
+            if field.many_to_many or field.one_to_many:
+                queryset = queryset.prefetch_related(field_name)
+            elif field.is_relation and field_name in expanded_fields:
+                queryset = queryset.select_related(field_name)
+
+        return queryset
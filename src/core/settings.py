@@ -55,14 +55,20 @@ INSTALLED_APPS = [
     "django.contrib.staticfiles",
     "rest_framework",
     "drf_spectacular",
+    "core",
     "users",
     "colorfield",
     "auth0authorization",
     "groups",
     "currency",
     "categories",
+    "expenses",
 ]
 
+# Serve only the JSON API: workers leave out the admin and the OpenAPI schema,
+# and the modules only they need (see core/urls.py)
+API_ONLY = os.environ.get("DJANGO_API_ONLY", "").lower() in ("1", "true", "yes", "on")
+
 REST_FRAMEWORK = {
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.IsAuthenticated",),
     "DEFAULT_AUTHENTICATION_CLASSES": (
@@ -74,6 +80,35 @@ REST_FRAMEWORK = {
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
 }
 
+if API_ONLY:
+    INSTALLED_APPS.remove("django.contrib.admin")
+    INSTALLED_APPS.remove("drf_spectacular")
+
+    # Routers read every view's schema class while building the URLconf, and
+    # DRF's own is imported already, unlike drf_spectacular's
+    REST_FRAMEWORK["DEFAULT_SCHEMA_CLASS"] = "rest_framework.schemas.openapi.AutoSchema"
+
+# Max age, in seconds, clients may cache reference data (categories, currencies) for
+REFERENCE_DATA_CACHE_MAX_AGE = int(
+    os.environ.get("REFERENCE_DATA_CACHE_MAX_AGE", str(60 * 60 * 24))
+)
+
+# How long, in seconds, a response is replayed for retries with the same Idempotency-Key
+IDEMPOTENCY_KEY_TTL = int(os.environ.get("IDEMPOTENCY_KEY_TTL", str(60 * 60 * 24)))
+
+# How long, in seconds, a key stays claimed by a request that has not finished;
+# after that a retry takes it over, so a request that died never blocks its key
+IDEMPOTENCY_KEY_LEASE = int(os.environ.get("IDEMPOTENCY_KEY_LEASE", "300"))
+
+# Version of the running code, such as its git commit, set when the image is built
+APP_VERSION = os.environ.get("APP_VERSION", "")
+
+# OpenAPI schema prebuilt for APP_VERSION by the build_openapi_schema command
+OPENAPI_SCHEMA_FILE = BASE_DIR / "openapi-schema.json"
+
+# Currency every exchange rate is quoted against (the ECB publishes rates against EUR)
+EXCHANGE_RATE_BASE_CURRENCY = os.environ.get("EXCHANGE_RATE_BASE_CURRENCY", "EUR")
+
 STORAGES = {
     "default": {
         "BACKEND": "storages.backends.s3.S3Storage",
@@ -99,6 +134,7 @@ JWT_AUTH = {
 }
 
 MIDDLEWARE = [
+    "core.startup.ColdStartTimingMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -108,10 +144,23 @@ MIDDLEWARE = [
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
+    "core.replicas.PrimaryPinMiddleware",
 ]
 
 ROOT_URLCONF = "core.urls"
 
+# Log the app's own INFO messages, such as cold-start times, to the console
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "console": {"class": "logging.StreamHandler"},
+    },
+    "loggers": {
+        "core": {"handlers": ["console"], "level": "INFO"},
+    },
+}
+
 TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
@@ -134,6 +183,17 @@ WSGI_APPLICATION = "core.wsgi.application"
 # Database
 # https://docs.djangoproject.com/en/5.1/ref/settings/#databases
 
+# Threads per Gunicorn worker; every thread holds at most one connection at a time.
+# Workers started with core.gunicorn_config size their pools from their own count;
+# the default matches its gthread default and covers the threaded runserver.
+GUNICORN_THREADS = int(os.environ.get("GUNICORN_THREADS", "4"))
+
+# Connections per pool, overriding the size derived from the thread count
+DB_POOL_MAX_SIZE = os.environ.get("DB_POOL_MAX_SIZE")
+
+# Connections each pool keeps open; the pool's max_size is never below it
+DB_POOL_MIN_SIZE = int(os.environ.get("DB_POOL_MIN_SIZE", "1"))
+
 DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.postgresql",
@@ -142,15 +202,61 @@ DATABASES = {
         "PASSWORD": os.environ.get("DB_PASSWORD"),
         "HOST": os.environ.get("DB_HOST"),
         "PORT": os.environ.get("DB_PORT"),
+        # Pooled connections are checked before they are handed out
+        "CONN_HEALTH_CHECKS": True,
+        "OPTIONS": {
+            # A psycopg connection pool per worker process, so requests reuse open
+            # connections instead of paying for connection setup and TLS each time.
+            # The pool never needs more connections than the worker has threads.
+            "pool": {
+                "name": "default",
+                "min_size": DB_POOL_MIN_SIZE,
+                "max_size": max(
+                    int(DB_POOL_MAX_SIZE or GUNICORN_THREADS), DB_POOL_MIN_SIZE
+                ),
+                # Seconds a request waits for a free connection before failing
+                "timeout": float(os.environ.get("DB_POOL_TIMEOUT", "10")),
+                # Seconds before idle connections above min_size are closed
+                "max_idle": float(os.environ.get("DB_POOL_MAX_IDLE", "300")),
+                # Seconds before a connection is replaced, to rebalance after failover
+                "max_lifetime": float(os.environ.get("DB_POOL_MAX_LIFETIME", "3600")),
+            },
+        },
     }
 }
 
+# A read replica serving the safe requests of some view sets (core.replicas)
+REPLICA_DATABASE = "replica" if os.environ.get("DB_REPLICA_HOST") else None
+
+if REPLICA_DATABASE:
+    DATABASES[REPLICA_DATABASE] = {
+        **DATABASES["default"],
+        "HOST": os.environ.get("DB_REPLICA_HOST"),
+        "PORT": os.environ.get("DB_REPLICA_PORT", DATABASES["default"]["PORT"]),
+        "OPTIONS": {
+            "pool": {**DATABASES["default"]["OPTIONS"]["pool"], "name": "replica"}
+        },
+    }
+
+DATABASE_ROUTERS = ["core.db_routers.ReplicaRouter"]
+
+# Seconds a client reads from the primary after a write, longer than replication lag
+REPLICA_PIN_SECONDS = int(os.environ.get("REPLICA_PIN_SECONDS", "10"))
+
 if "pytest" in sys.modules:
     DATABASES["default"] = {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": ":memory:",  # Use in-memory SQLite database
     }
 
+    # A separate database that is never replicated to, so tests can simulate
+    # replication lag; routing to it is off unless a test sets REPLICA_DATABASE
+    DATABASES["replica"] = {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": ":memory:",
+    }
+    REPLICA_DATABASE = None
+
     STORAGES["default"]["BACKEND"] = "django.core.files.storage.InMemoryStorage"
     STORAGES["staticfiles"]["BACKEND"] = "django.core.files.storage.InMemoryStorage"
 
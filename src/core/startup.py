@@ -0,0 +1,101 @@
+"""Boot-time checks and cold-start timing of server processes."""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from typing import TYPE_CHECKING
+
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.migrations.loader import MigrationLoader
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from django.http import HttpRequest, HttpResponse
+
+logger = logging.getLogger(__name__)
+
+# Set by scripts/entrypoint.sh to the Unix time the container started at
+STARTED_AT_ENV = "CONTAINER_STARTED_AT"
+
+
+def seconds_since_start() -> float | None:
+    """Return the seconds since the container started, if its start was recorded."""
+    started_at = os.environ.get(STARTED_AT_ENV)
+
+    if not started_at:
+        return None
+
+    try:
+        return time.time() - float(started_at)
+    except ValueError:
+        return None
+
+
+def unapplied_migrations(database: str = DEFAULT_DB_ALIAS) -> list[str]:
+    """
+    Return the migrations not applied to a database yet.
+
+    This is the check ``migrate --check`` makes, without starting another
+    interpreter: the migration files are read from disk and compared with one
+    query on the migrations table. Unlike ``migrate``'s plan, a migration is
+    listed even when a later one of its app was applied.
+    """
+    connection = connections[database]
+
+    try:
+        loader = MigrationLoader(connection)
+    finally:
+        # Nothing opened here may be inherited by forked workers
+        if hasattr(connection, "close_pool"):
+            connection.close_pool()
+        else:
+            connection.close()
+
+    pending = {}
+
+    for leaf in loader.graph.leaf_nodes():
+        for key in loader.graph.forwards_plan(leaf):
+            if key not in loader.applied_migrations:
+                pending.setdefault(key)
+
+    return [f"{app_label}.{name}" for app_label, name in pending]
+
+
+class ColdStartTimingMiddleware:
+    """
+    Report how long after the container started a process served its first request.
+
+    The time is logged once per process and returned to the client as a
+    ``Server-Timing`` header on that response, so cold starts can be measured
+    from both sides. It must be the first middleware to include every other
+    one's work.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        """Initialize the middleware."""
+        self.get_response = get_response
+        self.reported = False
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        """Time the first request of the process."""
+        response = self.get_response(request)
+
+        if self.reported:
+            return response
+
+        self.reported = True
+        elapsed = seconds_since_start()
+
+        if elapsed is not None:
+            logger.info(
+                "Cold start: first request served %.3fs after the container "
+                "started (pid %s).",
+                elapsed,
+                os.getpid(),
+            )
+            response["Server-Timing"] = f"cold-start;dur={elapsed * 1000:.0f}"
+
+        return response
@@ -0,0 +1,88 @@
+"""Test the versioned payload cache."""
+
+import pytest
+
+from core.cache import (
+    LRUPayloadCache,
+    VersionedPayloadCache,
+    bump_cache_version,
+    get_cache_version,
+)
+
+
+@pytest.mark.django_db
+def test_cache_version_starts_at_zero() -> None:
+    """Test that data that has never changed is at version 0."""
+    # Arrange
+
+    # Act
+    version = get_cache_version("example")
+
+    # Assert
+    assert version == 0
+
+
+@pytest.mark.django_db
+def test_bump_cache_version() -> None:
+    """Test that bumping a version increments it."""
+    # Arrange
+    bump_cache_version("example")
+
+    # Act
+    bump_cache_version("example")
+
+    # Assert
+    assert get_cache_version("example") == 2  # noqa: PLR2004
+    assert get_cache_version("other") == 0
+
+
+def test_payload_cache_reuses_payload_for_same_version() -> None:
+    """Test that a payload is only built once per version."""
+    # Arrange
+    cache = VersionedPayloadCache()
+    builds = []
+
+    def build() -> list[int]:
+        builds.append(1)
+        return [len(builds)]
+
+    # Act
+    first = cache.get_or_build("key", 1, build)
+    second = cache.get_or_build("key", 1, build)
+    third = cache.get_or_build("key", 2, build)
+
+    # Assert
+    assert first == second == [1]
+    assert third == [2]
+    assert len(builds) == 2  # noqa: PLR2004
+
+
+def test_payload_cache_evicts_oldest_entry() -> None:
+    """Test that the cache never holds more than its maximum number of entries."""
+    # Arrange
+    cache = VersionedPayloadCache(max_entries=2)
+
+    # Act
+    cache.get_or_build("a", 1, lambda: "a")
+    cache.get_or_build("b", 1, lambda: "b")
+    cache.get_or_build("c", 1, lambda: "c")
+    rebuilt = cache.get_or_build("a", 1, lambda: "rebuilt")
+
+    # Assert
+    assert rebuilt == "rebuilt"
+
+
+def test_lru_payload_cache_evicts_least_recently_used_entry() -> None:
+    """Test that reading an entry keeps it in the cache over older ones."""
+    # Arrange
+    cache = LRUPayloadCache(max_entries=2)
+    cache.get_or_build("a", 1, lambda: "a")
+    cache.get_or_build("b", 1, lambda: "b")
+
+    # Act
+    cache.get_or_build("a", 1, lambda: "rebuilt")
+    cache.get_or_build("c", 1, lambda: "c")
+
+    # Assert
+    assert cache.get_or_build("a", 1, lambda: "rebuilt") == "a"
+    assert cache.get_or_build("b", 1, lambda: "rebuilt") == "rebuilt"
@@ -0,0 +1,219 @@
+"""Test Idempotency-Key support for create endpoints."""
+
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.test import Client
+from django.utils import timezone
+from rest_framework import status
+
+from core.models import IdempotencyKey
+from core.test_helpers import create_test_user
+from currency.tests.test_helpers import create_test_currency
+from groups.models import Group, GroupMember
+from groups.tests.groups.test_helpers import create_test_group
+
+
+def group_payload(title: str = "Trip") -> dict:
+    """Return a payload creating a group."""
+    return {"title": title, "currency": str(create_test_currency().id)}
+
+
+@pytest.mark.django_db
+def test_retry_replays_first_response(client: Client) -> None:
+    """Test that a retry with the same key replays the response without a create."""
+    # Arrange
+    client.force_login(create_test_user())
+    payload = group_payload()
+    first = client.post(
+        "/api/groups/", payload, "application/json", HTTP_IDEMPOTENCY_KEY="abc"
+    )
+
+    # Act
+    retry = client.post(
+        "/api/groups/", payload, "application/json", HTTP_IDEMPOTENCY_KEY="abc"
+    )
+
+    # Assert
+    assert first.status_code == retry.status_code == status.HTTP_201_CREATED
+    assert retry.json() == first.json()
+    assert retry["Idempotent-Replayed"] == "true"
+    assert Group.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_key_reused_for_different_request(client: Client) -> None:
+    """Test that a key sent with a different request is rejected."""
+    # Arrange
+    client.force_login(create_test_user())
+    client.post(
+        "/api/groups/", group_payload(), "application/json", HTTP_IDEMPOTENCY_KEY="abc"
+    )
+
+    # Act
+    response = client.post(
+        "/api/groups/",
+        group_payload("Other"),
+        "application/json",
+        HTTP_IDEMPOTENCY_KEY="abc",
+    )
+
+    # Assert
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert Group.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_key_in_progress(client: Client) -> None:
+    """Test that a retry while the first request is running is a conflict."""
+    # Arrange
+    user = create_test_user()
+    client.force_login(user)
+    payload = group_payload()
+    client.post("/api/groups/", payload, "application/json", HTTP_IDEMPOTENCY_KEY="abc")
+    IdempotencyKey.objects.update(status_code=None, response_body=None)
+
+    # Act
+    response = client.post(
+        "/api/groups/", payload, "application/json", HTTP_IDEMPOTENCY_KEY="abc"
+    )
+
+    # Assert
+    assert response.status_code == status.HTTP_409_CONFLICT
+
+
+@pytest.mark.django_db
+def test_abandoned_key_is_reclaimed(client: Client) -> None:
+    """Test that a key whose request died is taken over once its lease ends."""
+    # Arrange
+    client.force_login(create_test_user())
+    payload = group_payload()
+    client.post("/api/groups/", payload, "application/json", HTTP_IDEMPOTENCY_KEY="abc")
+    # The first request died after claiming the key, so its group was rolled back
+    Group.objects.all().delete()
+    IdempotencyKey.objects.update(
+        status_code=None,
+        response_body=None,
+        created_at=timezone.now() - timedelta(minutes=10),
+    )
+
+    # Act
+    response = client.post(
+        "/api/groups/", payload, "application/json", HTTP_IDEMPOTENCY_KEY="abc"
+    )
+
+    # Assert
+    assert response.status_code == status.HTTP_201_CREATED
+    assert "Idempotent-Replayed" not in response
+    assert IdempotencyKey.objects.get().status_code == status.HTTP_201_CREATED
+
+
+@pytest.mark.django_db
+def test_failed_request_releases_key(client: Client) -> None:
+    """Test that a request failing validation can be retried with the same key."""
+    # Arrange
+    client.force_login(create_test_user())
+    failed = client.post(
+        "/api/groups/",
+        {"title": "Trip"},
+        "application/json",
+        HTTP_IDEMPOTENCY_KEY="abc",
+    )
+
+    # Act
+    response = client.post(
+        "/api/groups/", group_payload(), "application/json", HTTP_IDEMPOTENCY_KEY="abc"
+    )
+
+    # Assert
+    assert failed.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.status_code == status.HTTP_201_CREATED
+    assert "Idempotent-Replayed" not in response
+
+
+@pytest.mark.django_db
+def test_expired_key_is_reclaimed(client: Client) -> None:
+    """Test that a key older than the replay window starts a new request."""
+    # Arrange
+    client.force_login(create_test_user())
+    payload = group_payload()
+    client.post("/api/groups/", payload, "application/json", HTTP_IDEMPOTENCY_KEY="abc")
+    IdempotencyKey.objects.update(created_at=timezone.now() - timedelta(days=2))
+
+    # Act
+    response = client.post(
+        "/api/groups/",
+        group_payload("Next trip"),
+        "application/json",
+        HTTP_IDEMPOTENCY_KEY="abc",
+    )
+
+    # Assert
+    assert response.status_code == status.HTTP_201_CREATED
+    assert "Idempotent-Replayed" not in response
+    assert Group.objects.count() == 2  # noqa: PLR2004
+
+
+@pytest.mark.django_db
+def test_keys_are_scoped_to_user(client: Client) -> None:
+    """Test that two users can use the same key."""
+    # Arrange
+    payload = group_payload()
+    client.force_login(create_test_user())
+    client.post("/api/groups/", payload, "application/json", HTTP_IDEMPOTENCY_KEY="abc")
+    client.force_login(create_test_user(username="other", email="other@email.com"))
+
+    # Act
+    response = client.post(
+        "/api/groups/", payload, "application/json", HTTP_IDEMPOTENCY_KEY="abc"
+    )
+
+    # Assert
+    assert "Idempotent-Replayed" not in response
+    assert Group.objects.count() == 2  # noqa: PLR2004
+
+
+@pytest.mark.django_db
+def test_group_member_retry_replays_first_response(client: Client) -> None:
+    """Test that retrying a group member create does not fail the uniqueness check."""
+    # Arrange
+    group = create_test_group()
+    user = create_test_user(username="friend", email="friend@email.com")
+    payload = {"group": str(group.id), "user": str(user.pk)}
+    client.force_login(group.created_by)
+    first = client.post(
+        "/api/group-members/", payload, "application/json", HTTP_IDEMPOTENCY_KEY="m1"
+    )
+
+    # Act
+    retry = client.post(
+        "/api/group-members/", payload, "application/json", HTTP_IDEMPOTENCY_KEY="m1"
+    )
+
+    # Assert
+    assert first.status_code == retry.status_code == status.HTTP_201_CREATED
+    assert retry.json() == first.json()
+    assert GroupMember.objects.filter(group=group, user=user).count() == 1
+
+
+@pytest.mark.django_db
+def test_prune_idempotency_keys() -> None:
+    """Test that only expired keys are pruned."""
+    # Arrange
+    user = create_test_user()
+    IdempotencyKey.objects.bulk_create(
+        IdempotencyKey(user=user, key=str(index), fingerprint="") for index in range(5)
+    )
+    IdempotencyKey.objects.filter(key__in=["0", "1", "2"]).update(
+        created_at=timezone.now() - timedelta(days=2)
+    )
+    stdout = StringIO()
+
+    # Act
+    call_command("prune_idempotency_keys", "--batch-size", "2", stdout=stdout)
+
+    # Assert
+    assert "3 idempotency keys pruned." in stdout.getvalue()
+    assert set(IdempotencyKey.objects.values_list("key", flat=True)) == {"3", "4"}
@@ -0,0 +1,76 @@
+"""Test the import profiling and the lazily imported views."""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+import pytest
+from django.urls import reverse
+
+from core.import_profile import (
+    ImportTime,
+    parse_importtime,
+    profile_imports,
+    time_by_package,
+)
+
+if TYPE_CHECKING:
+    from django.test import Client
+
+IMPORTTIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |     django.utils
+import time:       300 |        420 |   django.conf
+import time:        80 |        500 | django
+import time:      1000 |       1000 | core.wsgi
+"""
+
+
+def test_parse_importtime() -> None:
+    """Test that the importtime report is parsed with each import's nesting."""
+    # Act
+    times = parse_importtime(IMPORTTIME_OUTPUT)
+
+    # Assert
+    assert times == [
+        ImportTime("django.utils", 120, 120, 2),
+        ImportTime("django.conf", 300, 420, 1),
+        ImportTime("django", 80, 500, 0),
+        ImportTime("core.wsgi", 1000, 1000, 0),
+    ]
+
+
+def test_time_by_package() -> None:
+    """Test that the time spent in each module is added up per package."""
+    # Act
+    totals = time_by_package(parse_importtime(IMPORTTIME_OUTPUT))
+
+    # Assert
+    assert totals == {"django": 500, "core": 1000}
+
+
+def test_api_only_skips_admin_and_schema_imports() -> None:
+    """Test that API-only workers import neither the admin nor schema generation."""
+    # Arrange
+    env = {**os.environ, "DJANGO_API_ONLY": "true"}
+
+    # Act
+    full = profile_imports(load_urls=True).modules
+    api_only = profile_imports(load_urls=True, env=env).modules
+
+    # Assert
+    assert {"groups.admin", "drf_spectacular.openapi"} <= full
+    assert not {"groups.admin", "drf_spectacular.openapi"} & api_only
+    assert "drf_spectacular.views" not in full | api_only
+
+
+@pytest.mark.django_db
+def test_lazy_schema_view_is_served(client: Client) -> None:
+    """Test that the lazily imported schema view serves the schema."""
+    # Act
+    response = client.get(reverse("schema"))
+
+    # Assert
+    assert response.status_code == 200  # noqa: PLR2004
+    assert b"openapi" in response.content
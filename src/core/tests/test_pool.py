@@ -0,0 +1,62 @@
+"""Test the connection pool statistics."""
+
+import pytest
+from django.test import Client
+from rest_framework import status
+
+from core.pool import summarize_pool_stats
+from core.test_helpers import create_test_user
+
+
+def test_summarize_pool_stats() -> None:
+    """Test that in-use connections and acquire latency are derived from counters."""
+    # Arrange
+    stats = {
+        "pool_min": 1,
+        "pool_max": 4,
+        "pool_size": 4,
+        "pool_available": 1,
+        "requests_waiting": 2,
+        "requests_num": 8,
+        "requests_wait_ms": 20,
+    }
+
+    # Act
+    summary = summarize_pool_stats(stats)
+
+    # Assert
+    assert summary["in_use"] == 3  # noqa: PLR2004
+    assert summary["waiting"] == 2  # noqa: PLR2004
+    assert summary["average_acquire_ms"] == 2.5  # noqa: PLR2004
+    assert summarize_pool_stats({})["average_acquire_ms"] == 0
+
+
+@pytest.mark.django_db
+def test_pool_stats_view(client: Client) -> None:
+    """Test that staff can read the pool statistics of the worker."""
+    # Arrange
+    user = create_test_user()
+    user.is_staff = True
+    user.save()
+
+    client.force_login(user)
+
+    # Act
+    response = client.get("/api/pool-stats/")
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["databases"] == {"default": {"pooled": False}}
+
+
+@pytest.mark.django_db
+def test_pool_stats_view_requires_staff(client: Client) -> None:
+    """Test that other users cannot read the pool statistics."""
+    # Arrange
+    client.force_login(create_test_user())
+
+    # Act
+    response = client.get("/api/pool-stats/")
+
+    # Assert
+    assert response.status_code == status.HTTP_403_FORBIDDEN
@@ -0,0 +1,144 @@
+"""Test read replica routing with read-your-writes stickiness."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from django.contrib.auth import get_user_model
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.db_routers import ReplicaRouter
+from core.models import LastWrite
+from core.replicas import replica_reads
+from core.test_helpers import create_test_user
+from currency.models import Currency
+from currency.tests.test_helpers import create_test_currency
+from groups.models import Group, GroupMember
+from groups.tests.groups.test_helpers import create_test_group
+
+if TYPE_CHECKING:
+    from django.db.models import Model
+    from django.test import Client
+    from pytest_django.fixtures import SettingsWrapper
+
+pytestmark = pytest.mark.django_db(databases=["default", "replica"])
+
+
+@pytest.fixture(autouse=True)
+def _replica(settings: SettingsWrapper) -> None:
+    """Route safe reads to the test replica, which is never replicated to."""
+    settings.REPLICA_DATABASE = "replica"
+
+
+def replicate(*models: type[Model]) -> None:
+    """Simulate replication catching up by copying rows to the replica."""
+    for model in models:
+        model.objects.using("replica").bulk_create(model.objects.using("default"))
+
+
+def test_router_reads_from_replica_only_when_asked() -> None:
+    """Test that reads go to the replica inside replica_reads and writes never do."""
+    # Arrange
+    router = ReplicaRouter()
+
+    # Act
+    with replica_reads():
+        inside = router.db_for_read(Group)
+
+    # Assert
+    assert inside == "replica"
+    assert router.db_for_read(Group) is None
+    assert router.db_for_write(Group) == "default"
+
+
+def test_safe_requests_read_from_replica(client: Client) -> None:
+    """Test that a list is served from the replica, lag included."""
+    # Arrange
+    user = create_test_user()
+    replicate(get_user_model())
+    group = create_test_group(created_by=user)
+
+    client.force_login(user)
+
+    # Act
+    lagging = client.get("/api/groups/")
+    replicate(Currency, Group, GroupMember)
+    caught_up = client.get("/api/groups/")
+
+    # Assert
+    assert lagging.status_code == status.HTTP_200_OK
+    assert lagging.json()["count"] == 0
+    assert [row["id"] for row in caught_up.json()["results"]] == [str(group.id)]
+
+
+def test_writes_pin_client_to_primary(client: Client) -> None:
+    """Test that a client reads its own write while the replica lags."""
+    # Arrange
+    user = create_test_user()
+    currency = create_test_currency()
+    replicate(get_user_model(), Currency)
+
+    client.force_login(user)
+
+    # Act
+    created = client.post(
+        "/api/groups/",
+        {"title": "Trip", "currency": str(currency.id)},
+        "application/json",
+    )
+    response = client.get(f"/api/groups/{created.json()['id']}/")
+
+    # Assert
+    assert created.status_code == status.HTTP_201_CREATED
+    assert LastWrite.objects.filter(user=user).exists()
+    assert response.status_code == status.HTTP_200_OK
+    assert not Group.objects.using("replica").exists()
+
+
+def test_writes_pin_user_without_cookies() -> None:
+    """Test that a token client, which keeps no cookies, reads its own write."""
+    # Arrange
+    user = create_test_user()
+    currency = create_test_currency()
+    replicate(get_user_model(), Currency)
+
+    writer = APIClient()
+    writer.force_authenticate(user)
+    created = writer.post(
+        "/api/groups/", {"title": "Trip", "currency": str(currency.id)}, format="json"
+    )
+
+    # A new client, carrying nothing from the write
+    reader = APIClient()
+    reader.force_authenticate(user)
+
+    # Act
+    response = reader.get(f"/api/groups/{created.json()['id']}/")
+
+    # Assert
+    assert created.status_code == status.HTTP_201_CREATED
+    assert response.status_code == status.HTTP_200_OK
+
+
+def test_pin_expires(client: Client, settings: SettingsWrapper) -> None:
+    """Test that reads go back to the replica once the pin has expired."""
+    # Arrange
+    settings.REPLICA_PIN_SECONDS = 0
+    user = create_test_user()
+    currency = create_test_currency()
+    replicate(get_user_model(), Currency)
+
+    client.force_login(user)
+    client.post(
+        "/api/groups/",
+        {"title": "Trip", "currency": str(currency.id)},
+        "application/json",
+    )
+
+    # Act
+    response = client.get("/api/groups/")
+
+    # Assert
+    assert response.json()["count"] == 0
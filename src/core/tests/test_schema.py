@@ -0,0 +1,133 @@
+"""Test the cached OpenAPI schema."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+
+from core import schema
+from core.schema import schema_cache
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from django.test import Client
+    from pytest_django.fixtures import SettingsWrapper
+
+JSON_SCHEMA = "application/vnd.oai.openapi+json"
+
+
+@pytest.fixture(autouse=True)
+def clear_schema_cache() -> Iterator[None]:
+    """Start every test without a cached schema."""
+    schema_cache.clear()
+    yield
+    schema_cache.clear()
+
+
+@pytest.fixture
+def schema_file(settings: SettingsWrapper, tmp_path: Path) -> Path:
+    """Point the prebuilt schema file at a temporary path, for version "v1"."""
+    settings.APP_VERSION = "v1"
+    settings.OPENAPI_SCHEMA_FILE = tmp_path / "openapi-schema.json"
+
+    return settings.OPENAPI_SCHEMA_FILE
+
+
+@pytest.fixture
+def generations(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    """Count the schemas generated."""
+    calls = []
+    generate = schema.generate_schema
+
+    def counting_generate(*args, **kwargs) -> dict:  # noqa: ANN002, ANN003
+        calls.append(1)
+        return generate(*args, **kwargs)
+
+    monkeypatch.setattr(schema, "generate_schema", counting_generate)
+
+    return calls
+
+
+@pytest.mark.django_db
+def test_schema_generated_once(client: Client, generations: list[int]) -> None:
+    """Test that the schema is generated on the first request only."""
+    # Act
+    first = client.get(reverse("schema"))
+    second = client.get(reverse("schema"))
+
+    # Assert
+    assert first.status_code == second.status_code == 200  # noqa: PLR2004
+    assert first.content == second.content
+    assert first["ETag"] == second["ETag"]
+    assert len(generations) == 1
+
+
+@pytest.mark.django_db
+def test_schema_cached_per_format(client: Client, generations: list[int]) -> None:
+    """Test that each format is rendered and tagged separately."""
+    # Act
+    yaml = client.get(reverse("schema"))
+    json_ = client.get(reverse("schema"), HTTP_ACCEPT=JSON_SCHEMA)
+
+    # Assert
+    assert json_["Content-Type"] == JSON_SCHEMA
+    assert json.loads(json_.content)["openapi"]
+    assert yaml["ETag"] != json_["ETag"]
+    assert len(generations) == 2  # noqa: PLR2004
+
+
+@pytest.mark.django_db
+def test_schema_not_modified(client: Client) -> None:
+    """Test that a client's current copy of the schema is answered with a 304."""
+    # Arrange
+    etag = client.get(reverse("schema"))["ETag"]
+
+    # Act
+    response = client.get(reverse("schema"), HTTP_IF_NONE_MATCH=etag)
+
+    # Assert
+    assert response.status_code == 304  # noqa: PLR2004
+    assert response["ETag"] == etag
+
+
+@pytest.mark.django_db
+def test_prebuilt_schema_served(
+    client: Client, schema_file: Path, generations: list[int]
+) -> None:
+    """Test that the schema built for the running version is served as is."""
+    # Arrange
+    call_command("build_openapi_schema")
+    generations.clear()
+
+    # Act
+    response = client.get(reverse("schema"), HTTP_ACCEPT=JSON_SCHEMA)
+
+    # Assert
+    assert response.status_code == 200  # noqa: PLR2004
+    assert response["ETag"].startswith('"v1-')
+    assert json.loads(response.content) == json.loads(schema_file.read_text())["schema"]
+    assert generations == []
+
+
+@pytest.mark.django_db
+def test_prebuilt_schema_of_another_version_ignored(
+    client: Client, schema_file: Path, generations: list[int]
+) -> None:
+    """Test that a schema built for another version is regenerated."""
+    # Arrange
+    schema_file.write_text(
+        json.dumps({"app_version": "v0", "schema": {"openapi": "stale"}})
+    )
+
+    # Act
+    response = client.get(reverse("schema"), HTTP_ACCEPT=JSON_SCHEMA)
+
+    # Assert
+    assert json.loads(response.content)["openapi"] != "stale"
+    assert len(generations) == 1
@@ -0,0 +1,69 @@
+"""Test the boot-time checks and cold-start timing."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+from django.db import connection
+from django.db.migrations.recorder import MigrationRecorder
+from django.http import HttpRequest, HttpResponse
+
+from core.startup import STARTED_AT_ENV, ColdStartTimingMiddleware, unapplied_migrations
+
+
+@pytest.mark.django_db
+def test_unapplied_migrations_none_when_migrated() -> None:
+    """Test that a migrated database has no unapplied migrations."""
+    # Act
+    pending = unapplied_migrations()
+
+    # Assert
+    assert pending == []
+
+
+@pytest.mark.django_db
+def test_unapplied_migrations_lists_missing_migrations() -> None:
+    """Test that migrations missing from the database are listed."""
+    # Arrange
+    MigrationRecorder(connection).record_unapplied("core", "0002_idempotency_key")
+
+    # Act
+    pending = unapplied_migrations()
+
+    # Assert
+    assert pending == ["core.0002_idempotency_key"]
+
+
+def test_cold_start_reported_on_first_request_only(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test that the first request of a process reports the cold-start time."""
+    # Arrange
+    monkeypatch.setenv(STARTED_AT_ENV, str(time.time() - 2))
+    middleware = ColdStartTimingMiddleware(lambda request: HttpResponse())  # noqa: ARG005
+    caplog.set_level("INFO", logger="core.startup")
+
+    # Act
+    first = middleware(HttpRequest())
+    second = middleware(HttpRequest())
+
+    # Assert
+    assert first["Server-Timing"].startswith("cold-start;dur=2")
+    assert "Server-Timing" not in second
+    assert caplog.text.count("Cold start") == 1
+
+
+def test_cold_start_not_reported_without_start_time(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that nothing is reported when the container's start was not recorded."""
+    # Arrange
+    monkeypatch.delenv(STARTED_AT_ENV, raising=False)
+    middleware = ColdStartTimingMiddleware(lambda request: HttpResponse())  # noqa: ARG005
+
+    # Act
+    response = middleware(HttpRequest())
+
+    # Assert
+    assert "Server-Timing" not in response
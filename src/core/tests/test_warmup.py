@@ -0,0 +1,78 @@
+"""Test the warm-up of server processes."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from django.db import connection
+
+from core.warmup import size_connection_pools, warm_worker
+from currency.conversion import RateTable, get_rate_table
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from pytest_django.fixtures import SettingsWrapper
+
+
+@pytest.mark.django_db
+def test_warm_worker_loads_rate_table(
+    django_assert_num_queries: Callable, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a warmed worker serves the rate table without loading it."""
+    # Arrange
+    loads = []
+    load = RateTable.load.__func__
+    monkeypatch.setattr(
+        RateTable, "load", classmethod(lambda cls: loads.append(1) or load(cls))
+    )
+
+    # Act
+    warm_worker()
+
+    # Assert
+    # Only the two cache versions are read
+    with django_assert_num_queries(2):
+        get_rate_table()
+
+    assert len(loads) == 1
+
+
+def test_warm_worker_survives_database_errors(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test that a failed warm-up is logged instead of stopping the worker."""
+
+    # Arrange
+    def fail() -> None:
+        message = "database unavailable"
+        raise RuntimeError(message)
+
+    monkeypatch.setattr("core.warmup.get_rate_table", fail)
+
+    # Act
+    warm_worker()
+
+    # Assert
+    assert "Could not warm the worker's caches." in caplog.text
+
+
+@pytest.mark.parametrize(("max_size_setting", "expected"), [(None, 8), ("2", 2)])
+def test_size_connection_pools(
+    monkeypatch: pytest.MonkeyPatch,
+    settings: SettingsWrapper,
+    max_size_setting: str | None,
+    expected: int,
+) -> None:
+    """Test that pools are sized to the worker's threads unless set explicitly."""
+    # Arrange
+    settings.DB_POOL_MAX_SIZE = max_size_setting
+    pool_options = {"min_size": 1, "max_size": 2}
+    monkeypatch.setitem(connection.settings_dict, "OPTIONS", {"pool": pool_options})
+
+    # Act
+    size_connection_pools(8)
+
+    # Assert
+    assert pool_options["max_size"] == expected
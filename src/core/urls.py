@@ -17,40 +17,50 @@ Including another URLconf
 
 """
 
-from django.contrib import admin
+from django.conf import settings
 from django.urls import include, path
-from drf_spectacular.views import (
-    SpectacularAPIView,
-    SpectacularRedocView,
-    SpectacularSwaggerView,
-)
 from rest_framework import routers
 
 from categories.router import router as categories_router
+from core.lazy_views import lazy_view
+from core.views import PoolStatsView
 from currency.router import currency_router
+from expenses.router import expenses_router
 from groups.router import group_members_router, groups_router
 
-admin.site.site_header = "Splitify Admin"
-
 api_router = routers.DefaultRouter()
 
 api_router.registry.extend(groups_router.registry)
 api_router.registry.extend(group_members_router.registry)
 api_router.registry.extend(categories_router.registry)
 api_router.registry.extend(currency_router.registry)
+api_router.registry.extend(expenses_router.registry)
 
 urlpatterns = [
-    path("admin/", admin.site.urls),
     path("api/", include(api_router.urls)),
-    path("api/schema/", SpectacularAPIView.as_view(), name="schema"),
-    path(
-        "api/schema/swagger-ui/",
-        SpectacularSwaggerView.as_view(url_name="schema"),
-        name="swagger-ui",
-    ),
-    path(
-        "api/schema/redoc/",
-        SpectacularRedocView.as_view(url_name="schema"),
-        name="redoc",
-    ),
+    path("api/pool-stats/", PoolStatsView.as_view(), name="pool-stats"),
 ]
+
+# API-only workers serve neither the admin nor the schema, and skip their imports
+if not settings.API_ONLY:
+    from django.contrib import admin
+
+    admin.site.site_header = "Splitify Admin"
+
+    urlpatterns += [
+        path("admin/", admin.site.urls),
+        # Schema generation is imported on the first request for the schema
+        path("api/schema/", lazy_view("core.schema.CachedSchemaView"), name="schema"),
+        path(
+            "api/schema/swagger-ui/",
+            lazy_view(
+                "drf_spectacular.views.SpectacularSwaggerView", url_name="schema"
+            ),
+            name="swagger-ui",
+        ),
+        path(
+            "api/schema/redoc/",
+            lazy_view("drf_spectacular.views.SpectacularRedocView", url_name="schema"),
+            name="redoc",
+        ),
+    ]
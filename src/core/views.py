@@ -0,0 +1,24 @@
+"""Core views."""
+
+from typing import ClassVar
+
+from rest_framework.permissions import IsAdminUser
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from core.pool import get_pool_stats
+
+
+class PoolStatsView(APIView):
+    """
+    Database connection pool statistics of the worker answering the request.
+
+    Staff only. Poll it repeatedly to sample every worker of an instance.
+    """
+
+    permission_classes: ClassVar = [IsAdminUser]
+
+    def get(self, request: Request) -> Response:  # noqa: ARG002
+        """Return the pool statistics."""
+        return Response(get_pool_stats())
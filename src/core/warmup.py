@@ -0,0 +1,61 @@
+"""Warm-up of server processes before they take traffic."""
+
+from __future__ import annotations
+
+import logging
+
+from django.conf import settings
+from django.db import connections
+from django.urls import get_resolver
+
+from currency.conversion import get_rate_table
+
+logger = logging.getLogger(__name__)
+
+
+def load_url_modules() -> None:
+    """
+    Import every view, serializer and model module reachable from the URLconf.
+
+    Django imports them on the first request otherwise. Done in the server's
+    master process before forking, the imported modules are shared by every
+    worker through copy-on-write memory.
+    """
+    get_resolver().url_patterns  # noqa: B018
+
+
+def size_connection_pools(threads: int) -> None:
+    """
+    Size a worker's database pools to its number of threads.
+
+    Every thread holds at most one connection at a time, so a pool never needs
+    more. Pools sized with ``DB_POOL_MAX_SIZE`` are left alone. Must run before
+    the worker's first query, as pools are created on first use.
+    """
+    if settings.DB_POOL_MAX_SIZE:
+        return
+
+    for alias in connections:
+        pool_options = connections[alias].settings_dict["OPTIONS"].get("pool")
+
+        if isinstance(pool_options, dict):
+            pool_options["max_size"] = max(threads, pool_options.get("min_size", 1))
+
+
+def warm_worker(threads: int = 1) -> None:
+    """
+    Open a worker's database connection and load its process-level caches.
+
+    The pools are sized to the worker's ``threads`` first. Failures are logged
+    rather than raised, so a database that is briefly unavailable slows the
+    first requests down instead of stopping the worker from booting.
+    """
+    size_connection_pools(threads)
+
+    try:
+        get_rate_table()
+    except Exception:
+        logger.warning("Could not warm the worker's caches.", exc_info=True)
+    finally:
+        # Return the connection to this worker's pool, or close it without one
+        connections.close_all()
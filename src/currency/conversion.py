@@ -0,0 +1,217 @@
+"""Batched conversion of amounts between currencies."""
+
+from __future__ import annotations
+
+from decimal import ROUND_HALF_EVEN, Decimal, localcontext
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.db.models import OuterRef, Q, Subquery
+
+from core.cache import VersionedPayloadCache, get_cache_version
+from currency.models import (
+    CURRENCIES_CACHE_VERSION,
+    EXCHANGE_RATES_CACHE_VERSION,
+    Currency,
+    ExchangeRate,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+    from datetime import date
+
+# Enough significant digits that multiplying an amount by two rates and dividing
+# is exact before the final rounding to a whole number of minor units.
+CONVERSION_PRECISION = 60
+
+
+class UnknownCurrencyError(Exception):
+    """Raised when converting from or to a currency that does not exist."""
+
+
+class ExchangeRateNotFoundError(Exception):
+    """Raised when there is no exchange rate for a currency on or before a date."""
+
+
+class RateTable:
+    """
+    An in-memory table of every currency's minor unit and latest exchange rate.
+
+    Rates are quoted against a single base currency. Only the latest rate of
+    each currency is held in memory; the rate for a past day, the latest one
+    published on or before it, is read from the database when asked for.
+    """
+
+    def __init__(
+        self,
+        base_currency: str,
+        decimal_places: dict[str, int],
+        latest_rates: dict[str, Decimal],
+    ) -> None:
+        """Create a rate table from each currency's minor unit and latest rate."""
+        self.base_currency = base_currency
+        self.decimal_places = decimal_places
+        self.latest_rates = latest_rates
+
+    @classmethod
+    def load(cls) -> RateTable:
+        """Load every currency and its latest exchange rate in two queries."""
+        decimal_places = dict(Currency.objects.values_list("code", "decimal_places"))
+        latest_dates = (
+            ExchangeRate.objects.filter(currency=OuterRef("currency"))
+            .order_by("-date")
+            .values("date")[:1]
+        )
+        latest_rates = dict(
+            ExchangeRate.objects.filter(date=Subquery(latest_dates)).values_list(
+                "currency__code", "rate"
+            )
+        )
+
+        return cls(settings.EXCHANGE_RATE_BASE_CURRENCY, decimal_places, latest_rates)
+
+    def get_decimal_places(self, code: str) -> int:
+        """Return the exponent of a currency's minor unit."""
+        try:
+            return self.decimal_places[code]
+        except KeyError:
+            message = f"Unknown currency {code}."
+            raise UnknownCurrencyError(message) from None
+
+    def get_rate(self, code: str, on: date | None = None) -> Decimal:
+        """Return the rate against the base currency on a day, or the latest rate."""
+        return self.get_rates({(code, on)})[code, on]
+
+    def get_rates(
+        self, keys: Iterable[tuple[str, date | None]]
+    ) -> dict[tuple[str, date | None], Decimal]:
+        """
+        Return the rates against the base currency of many currencies and days.
+
+        Keys without a day get the latest rate from memory; the rates of past
+        days are read together in one query.
+        """
+        rates = {}
+        past_days = set()
+
+        for code, day in keys:
+            if code == self.base_currency:
+                rates[code, day] = Decimal(1)
+            elif day is None:
+                if code not in self.latest_rates:
+                    message = f"No exchange rate for {code} on or before today."
+                    raise ExchangeRateNotFoundError(message)
+
+                rates[code, day] = self.latest_rates[code]
+            else:
+                past_days.add((code, day))
+
+        if past_days:
+            rates.update(load_rates_on(past_days))
+
+        return rates
+
+
+def load_rates_on(keys: set[tuple[str, date]]) -> dict[tuple[str, date], Decimal]:
+    """
+    Return the rate of each currency on each day, in one query.
+
+    The query selects, for every key, the latest rate published on or before
+    the day, each found with one lookup on the (currency, date) index.
+    """
+    condition = Q()
+
+    for code, day in keys:
+        condition |= Q(
+            pk__in=ExchangeRate.objects.filter(currency__code=code, date__lte=day)
+            .order_by("-date")
+            .values("pk")[:1]
+        )
+
+    series: dict[str, list[tuple[date, Decimal]]] = {}
+
+    for code, day, rate in ExchangeRate.objects.filter(condition).values_list(
+        "currency__code", "date", "rate"
+    ):
+        series.setdefault(code, []).append((day, rate))
+
+    rates = {}
+
+    for code, day in keys:
+        # The latest row fetched for the currency on or before the day is its
+        # rate; rows fetched for earlier days of the same currency are older
+        published = [row for row in series.get(code, ()) if row[0] <= day]
+
+        if not published:
+            message = f"No exchange rate for {code} on or before {day}."
+            raise ExchangeRateNotFoundError(message)
+
+        rates[code, day] = max(published)[1]
+
+    return rates
+
+
+# The rate table, kept apart from the shared payload cache so other payloads
+# cannot evict it
+rate_table_cache = VersionedPayloadCache(max_entries=1)
+
+
+def get_rate_table() -> RateTable:
+    """Return this process's rate table, reloaded when rates or currencies change."""
+    version = (
+        get_cache_version(EXCHANGE_RATES_CACHE_VERSION),
+        get_cache_version(CURRENCIES_CACHE_VERSION),
+    )
+
+    return rate_table_cache.get_or_build("rate_table", version, RateTable.load)
+
+
+def convert_amounts(
+    amounts: Sequence[int],
+    currencies: Sequence[str],
+    to_currency: str,
+    dates: Sequence[date | None] | None = None,
+    table: RateTable | None = None,
+) -> list[int]:
+    """
+    Convert many amounts, given in minor units, into another currency's minor units.
+
+    ``amounts``, ``currencies`` and ``dates`` are parallel sequences; a missing
+    date (or ``dates`` of None) uses the latest rate. Each distinct currency and
+    date is looked up once, the past ones in a single query, and results are
+    rounded half-to-even to whole minor units from an exact intermediate value.
+    """
+    if table is None:
+        table = get_rate_table()
+
+    if dates is None:
+        dates = [None] * len(amounts)
+
+    if not len(amounts) == len(currencies) == len(dates):
+        message = "amounts, currencies and dates must have the same length."
+        raise ValueError(message)
+
+    to_places = table.get_decimal_places(to_currency)
+    keys = set(zip(currencies, dates, strict=True))
+    places = {code: table.get_decimal_places(code) for code, _ in keys}
+    rates = table.get_rates(keys | {(to_currency, day) for _, day in keys})
+    factors: dict[tuple[str, date | None], tuple[Decimal, Decimal]] = {}
+    results = []
+
+    with localcontext() as context:
+        context.prec = CONVERSION_PRECISION
+
+        for code, day in keys:
+            scale = Decimal(10) ** (to_places - places[code])
+            factors[code, day] = (
+                rates[to_currency, day] * scale,
+                rates[code, day],
+            )
+
+        for amount, code, day in zip(amounts, currencies, dates, strict=True):
+            numerator, denominator = factors[code, day]
+            converted = Decimal(amount) * numerator / denominator
+
+            results.append(int(converted.to_integral_value(rounding=ROUND_HALF_EVEN)))
+
+    return results
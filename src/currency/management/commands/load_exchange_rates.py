@@ -0,0 +1,217 @@
+"""Management command to bulk load historical exchange rates from a CSV file."""
+
+from __future__ import annotations
+
+import csv
+import io
+import sys
+import time
+import uuid
+from datetime import date
+from decimal import Decimal, InvalidOperation
+from typing import TYPE_CHECKING
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import connection, transaction
+from django.utils import timezone
+
+from core.cache import bump_cache_version
+from currency.models import EXCHANGE_RATES_CACHE_VERSION, Currency, ExchangeRate
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+# Values the ECB uses for days a currency has no rate
+MISSING_RATE_VALUES = {"", "N/A", "NA", "-"}
+
+COLUMNS = ("id", "currency_id", "date", "rate", "created_at", "updated_at")
+
+
+class Command(BaseCommand):
+    """
+    Load exchange rates from a CSV file in the ECB layout.
+
+    The file has a ``Date`` column followed by one column per currency code, with
+    one row per day. It is streamed row by row, currency codes are resolved
+    against ``Currency.code`` and rates are written in large batches, using COPY
+    into a staging table on PostgreSQL. Rates are upserted on (currency, date), so
+    re-running the command is safe; on PostgreSQL only rows whose rate changed are
+    rewritten.
+    """
+
+    help = "Bulk load historical exchange rates from a CSV file in the ECB layout."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add the command's arguments."""
+        parser.add_argument("path", help="Path to the CSV file, or - for stdin.")
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=20_000,
+            help="Number of rates written per batch.",
+        )
+
+    def handle(self, *args, **options) -> None:  # noqa: ANN002, ANN003, ARG002
+        """Stream the file and write its rates in batches."""
+        batch_size = options["batch_size"]
+        started = time.perf_counter()
+        written = 0
+        read = 0
+
+        with self.open_input(options["path"]) as file:
+            reader = csv.reader(file)
+            currencies = self.resolve_header(next(reader, None))
+
+            batch: list[tuple] = []
+
+            for row in self.iter_rates(reader, currencies):
+                batch.append(row)
+                read += 1
+
+                if len(batch) >= batch_size:
+                    written += self.write_batch(batch)
+                    batch = []
+                    self.report(read, written, started)
+
+            if batch:
+                written += self.write_batch(batch)
+
+        bump_cache_version(EXCHANGE_RATES_CACHE_VERSION)
+
+        self.report(read, written, started)
+        self.stdout.write(self.style.SUCCESS("Exchange rates loaded."))
+
+    def open_input(self, path: str) -> io.TextIOBase:
+        """Open the input file for streaming."""
+        if path == "-":
+            return io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8-sig")
+
+        try:
+            return open(path, encoding="utf-8-sig", newline="")  # noqa: PTH123
+        except OSError as error:
+            raise CommandError(str(error)) from error
+
+    def resolve_header(
+        self, header: list[str] | None
+    ) -> list[tuple[str, uuid.UUID | None]]:
+        """Map each rate column to its code and currency id, None to skip it."""
+        if not header or header[0].strip().lower() != "date":
+            message = "Expected a header row starting with a Date column."
+            raise CommandError(message)
+
+        codes = [code.strip().upper() for code in header[1:]]
+        known = dict(Currency.objects.filter(code__in=codes).values_list("code", "id"))
+
+        unknown = sorted({code for code in codes if code and code not in known})
+
+        if unknown:
+            self.stderr.write(f"Skipping unknown currencies: {', '.join(unknown)}")
+
+        return [(code, known.get(code)) for code in codes]
+
+    def iter_rates(
+        self,
+        reader: Iterator[list[str]],
+        currencies: list[tuple[str, uuid.UUID | None]],
+    ) -> Iterator[tuple]:
+        """
+        Yield one row per published rate, ready to be written.
+
+        Rates must be finite and positive: conversions divide by them.
+        """
+        now = timezone.now()
+
+        for line_number, row in enumerate(reader, start=2):
+            if not row or not row[0].strip():
+                continue
+
+            try:
+                day = date.fromisoformat(row[0].strip())
+            except ValueError as error:
+                message = f"Line {line_number}: invalid date {row[0]!r}."
+                raise CommandError(message) from error
+
+            for (code, currency_id), value in zip(currencies, row[1:], strict=False):
+                value = value.strip()  # noqa: PLW2901
+
+                if currency_id is None or value.upper() in MISSING_RATE_VALUES:
+                    continue
+
+                try:
+                    rate = Decimal(value)
+                except InvalidOperation as error:
+                    message = f"Line {line_number}: invalid {code} rate {value!r}."
+                    raise CommandError(message) from error
+
+                if not rate.is_finite() or rate <= 0:
+                    message = (
+                        f"Line {line_number}: {code} rate {value!r} must be a "
+                        "positive number."
+                    )
+                    raise CommandError(message)
+
+                yield (uuid.uuid4(), currency_id, day, rate, now, now)
+
+    def write_batch(self, batch: list[tuple]) -> int:
+        """Upsert a batch of rates in one transaction, returning the rows written."""
+        with transaction.atomic():
+            if connection.vendor == "postgresql":
+                return self.copy_batch(batch)
+
+            ExchangeRate.objects.bulk_create(
+                [ExchangeRate(**dict(zip(COLUMNS, row, strict=True))) for row in batch],
+                update_conflicts=True,
+                unique_fields=["currency", "date"],
+                update_fields=["rate", "updated_at"],
+            )
+
+            return len(batch)
+
+    def copy_batch(self, batch: list[tuple]) -> int:
+        """Upsert a batch with COPY into a staging table and one INSERT ... SELECT."""
+        table = ExchangeRate._meta.db_table  # noqa: SLF001
+        columns = ", ".join(COLUMNS)
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerows(
+            (pk, currency_id, day.isoformat(), rate, now.isoformat(), now.isoformat())
+            for pk, currency_id, day, rate, now, _ in batch
+        )
+        buffer.seek(0)
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE TEMP TABLE exchange_rate_staging (LIKE {table}) ON COMMIT DROP"
+            )
+
+            copy_sql = (
+                f"COPY exchange_rate_staging ({columns}) FROM STDIN WITH (FORMAT csv)"
+            )
+            raw_cursor = cursor.cursor
+
+            if hasattr(raw_cursor, "copy_expert"):
+                raw_cursor.copy_expert(copy_sql, buffer)
+            else:
+                with raw_cursor.copy(copy_sql) as copy:
+                    copy.write(buffer.getvalue())
+
+            cursor.execute(
+                f"INSERT INTO {table} ({columns}) "  # noqa: S608
+                f"SELECT {columns} FROM exchange_rate_staging "
+                "ON CONFLICT (currency_id, date) DO UPDATE "
+                "SET rate = EXCLUDED.rate, updated_at = EXCLUDED.updated_at "
+                f"WHERE {table}.rate IS DISTINCT FROM EXCLUDED.rate"
+            )
+
+            return cursor.rowcount
+
+    def report(self, read: int, written: int, started: float) -> None:
+        """Report progress and throughput."""
+        elapsed = time.perf_counter() - started
+        throughput = read / elapsed if elapsed else 0
+
+        self.stdout.write(
+            f"{read} rates read, {written} written in {elapsed:.1f}s "
+            f"({throughput:,.0f} rates/s)"
+        )
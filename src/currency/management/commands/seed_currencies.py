@@ -0,0 +1,94 @@
+"""Management command to seed the ISO 4217 currency catalogue."""
+
+from __future__ import annotations
+
+import csv
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import transaction
+
+from core.cache import bump_cache_version
+from currency.models import CURRENCIES_CACHE_VERSION, Currency
+
+CATALOGUE_PATH = Path(__file__).resolve().parents[2] / "data" / "iso4217.csv"
+
+SEEDED_FIELDS = ("name", "symbol", "decimal_places")
+
+
+class Command(BaseCommand):
+    """
+    Load the ISO 4217 currency catalogue in one bulk operation.
+
+    Existing currencies are read with one query and compared with the catalogue;
+    only new or changed currencies are written, with a single upsert on the unique
+    ``code`` column inside one transaction. Unchanged rows keep their ``updated_at``
+    and the currency cache is only invalidated when something was written.
+    """
+
+    help = "Create or update currencies from the ISO 4217 catalogue."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add the command's arguments."""
+        parser.add_argument(
+            "--file",
+            default=str(CATALOGUE_PATH),
+            help="CSV catalogue with code, name, symbol and decimal_places columns.",
+        )
+
+    def handle(self, *args, **options) -> None:  # noqa: ANN002, ANN003, ARG002
+        """Upsert the new and changed currencies."""
+        catalogue = self.read_catalogue(options["file"])
+
+        with transaction.atomic():
+            existing = {
+                currency.code: currency
+                for currency in Currency.objects.filter(code__in=catalogue).only(
+                    "code", *SEEDED_FIELDS
+                )
+            }
+
+            changed = [
+                Currency(code=code, **values)
+                for code, values in catalogue.items()
+                if code not in existing
+                or any(
+                    getattr(existing[code], field) != values[field]
+                    for field in SEEDED_FIELDS
+                )
+            ]
+
+            Currency.objects.bulk_create(
+                changed,
+                update_conflicts=True,
+                unique_fields=["code"],
+                update_fields=[*SEEDED_FIELDS, "updated_at"],
+            )
+
+            if changed:
+                bump_cache_version(CURRENCIES_CACHE_VERSION)
+
+        created = sum(1 for currency in changed if currency.code not in existing)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{created} currencies created, {len(changed) - created} updated, "
+                f"{len(catalogue) - len(changed)} unchanged."
+            )
+        )
+
+    def read_catalogue(self, path: str) -> dict[str, dict]:
+        """Read the catalogue into a mapping of code to field values."""
+        try:
+            with Path(path).open(encoding="utf-8", newline="") as file:
+                return {
+                    row["code"].strip().upper(): {
+                        "name": row["name"].strip(),
+                        "symbol": row["symbol"].strip(),
+                        "decimal_places": int(row["decimal_places"]),
+                    }
+                    for row in csv.DictReader(file)
+                }
+        except (OSError, KeyError, ValueError) as error:
+            message = f"Could not read the currency catalogue: {error}"
+            raise CommandError(message) from error
@@ -1,8 +1,17 @@
 """Models for the currency app."""
 
 import uuid
+from typing import ClassVar
 
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from core.cache import bump_cache_version
+
+CURRENCIES_CACHE_VERSION = "currencies"
+
+EXCHANGE_RATES_CACHE_VERSION = "exchange_rates"
 
 
 class Currency(models.Model):
@@ -14,6 +23,8 @@ class Currency(models.Model):
         - name: CharField representing the currency's name
         - symbol: CharField representing the currency's symbol
         - code: CharField representing the currency's code
+        - decimal_places: PositiveSmallIntegerField representing the number of digits
+          after the decimal separator, i.e. the exponent of the currency's minor unit
         - created_at: DateTimeField representing when the currency was created
         - updated_at: DateTimeField representing when the currency was last updated
 
@@ -27,6 +38,8 @@ class Currency(models.Model):
 
     code = models.CharField(max_length=5, unique=True)
 
+    decimal_places = models.PositiveSmallIntegerField(default=2)
+
     created_at = models.DateTimeField(auto_now_add=True)
 
     updated_at = models.DateTimeField(auto_now=True)
@@ -34,3 +47,58 @@ class Currency(models.Model):
     def __str__(self) -> str:
         """Return the string representation of the currency."""
         return f"{self.name} ({self.symbol})"
+
+
+class ExchangeRate(models.Model):
+    """
+    The rate of a currency against the base currency on a given day.
+
+    Attributes:
+        - id: UUID field representing the exchange rate's unique identifier
+        - currency: ForeignKey to the currency the rate is for
+        - date: DateField representing the day the rate applies from
+        - rate: DecimalField representing how many units of the currency one unit
+          of the base currency (settings.EXCHANGE_RATE_BASE_CURRENCY) buys
+        - created_at: DateTimeField representing when the rate was created
+        - updated_at: DateTimeField representing when the rate was last updated
+
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+
+    currency = models.ForeignKey(
+        Currency, on_delete=models.CASCADE, related_name="exchange_rates"
+    )
+
+    date = models.DateField()
+
+    rate = models.DecimalField(max_digits=24, decimal_places=10)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        """Meta class for the ExchangeRate model."""
+
+        constraints: ClassVar[list] = [
+            models.UniqueConstraint(
+                fields=["currency", "date"], name="unique_exchange_rate_per_day"
+            )
+        ]
+
+    def __str__(self) -> str:
+        """Return the string representation of the exchange rate."""
+        return f"{self.currency.code} {self.rate} ({self.date})"
+
+
+@receiver([post_save, post_delete], sender=Currency)
+def invalidate_currencies_cache(sender, **kwargs) -> None:  # noqa: ANN001, ANN003, ARG001
+    """Invalidate cached currency payloads in every worker."""
+    bump_cache_version(CURRENCIES_CACHE_VERSION)
+
+
+@receiver([post_save, post_delete], sender=ExchangeRate)
+def invalidate_exchange_rates_cache(sender, **kwargs) -> None:  # noqa: ANN001, ANN003, ARG001
+    """Invalidate the in-memory exchange rate table in every worker."""
+    bump_cache_version(EXCHANGE_RATES_CACHE_VERSION)
@@ -12,4 +12,29 @@ class CurrencySerializer(serializers.ModelSerializer):
         """Meta class."""
 
         model = Currency
-        fields = ("id", "name", "symbol", "code", "created_at", "updated_at")
+        fields = (
+            "id",
+            "name",
+            "symbol",
+            "code",
+            "decimal_places",
+            "created_at",
+            "updated_at",
+        )
+
+
+class ConversionItemSerializer(serializers.Serializer):
+    """An amount, in minor units, to convert."""
+
+    amount = serializers.IntegerField()
+    currency = serializers.CharField(max_length=5)
+    date = serializers.DateField(required=False, allow_null=True, default=None)
+
+
+class ConversionRequestSerializer(serializers.Serializer):
+    """A batch of amounts to convert into one currency."""
+
+    MAX_ITEMS = 10_000
+
+    to = serializers.CharField(max_length=5)
+    items = ConversionItemSerializer(many=True, allow_empty=False, max_length=MAX_ITEMS)
@@ -0,0 +1,160 @@
+"""Test the currency management commands."""
+
+from collections.abc import Callable
+from datetime import date
+from decimal import Decimal
+from io import StringIO
+from pathlib import Path
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from core.cache import get_cache_version
+from currency.models import (
+    CURRENCIES_CACHE_VERSION,
+    EXCHANGE_RATES_CACHE_VERSION,
+    Currency,
+    ExchangeRate,
+)
+from currency.tests.test_helpers import create_test_currency
+
+ECB_CSV = """Date,USD,JPY,GBP,XYZ,
+2024-01-03,1.0919,155.52,0.86408,1.5,
+2024-01-02,1.0956,155.81,N/A,1.5,
+"""
+
+
+def write_rates_file(tmp_path: Path, content: str = ECB_CSV) -> str:
+    """Write a rates file in the ECB layout and return its path."""
+    path = tmp_path / "eurofxref-hist.csv"
+    path.write_text(content, encoding="utf-8")
+
+    return str(path)
+
+
+@pytest.mark.django_db
+def test_load_exchange_rates(tmp_path: Path) -> None:
+    """Test that rates are loaded for known currencies, skipping missing values."""
+    # Arrange
+    usd = create_test_currency()
+    create_test_currency(name="Japanese Yen", code="JPY", symbol="¥")
+    create_test_currency(name="Pound Sterling", code="GBP", symbol="£")
+    path = write_rates_file(tmp_path)
+    stdout, stderr = StringIO(), StringIO()
+
+    # Act
+    call_command("load_exchange_rates", path, stdout=stdout, stderr=stderr)
+
+    # Assert
+    assert ExchangeRate.objects.count() == 5  # noqa: PLR2004
+    assert ExchangeRate.objects.get(currency=usd, date=date(2024, 1, 2)).rate == (
+        Decimal("1.0956")
+    )
+    assert "5 rates read" in stdout.getvalue()
+    assert "rates/s" in stdout.getvalue()
+    assert "XYZ" in stderr.getvalue()
+    assert get_cache_version(EXCHANGE_RATES_CACHE_VERSION) > 0
+
+
+@pytest.mark.django_db
+def test_load_exchange_rates_is_idempotent(tmp_path: Path) -> None:
+    """Test that re-running the command updates rates instead of duplicating them."""
+    # Arrange
+    usd = create_test_currency()
+    path = write_rates_file(tmp_path)
+
+    call_command("load_exchange_rates", path, stdout=StringIO(), stderr=StringIO())
+
+    revised = write_rates_file(tmp_path, "Date,USD\n2024-01-03,1.1000\n")
+
+    # Act
+    call_command(
+        "load_exchange_rates",
+        revised,
+        "--batch-size=1",
+        stdout=StringIO(),
+        stderr=StringIO(),
+    )
+
+    # Assert
+    assert ExchangeRate.objects.count() == 2  # noqa: PLR2004
+    assert ExchangeRate.objects.get(currency=usd, date=date(2024, 1, 3)).rate == (
+        Decimal("1.1000")
+    )
+
+
+@pytest.mark.django_db
+def test_load_exchange_rates_invalid_header(tmp_path: Path) -> None:
+    """Test that a file without a Date column is rejected."""
+    # Arrange
+    path = write_rates_file(tmp_path, "Day,USD\n2024-01-03,1.0919\n")
+
+    # Act / Assert
+    with pytest.raises(CommandError):
+        call_command("load_exchange_rates", path, stdout=StringIO())
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("value", ["0", "-1.5", "NaN", "Infinity"])
+def test_load_exchange_rates_rejects_invalid_rates(tmp_path: Path, value: str) -> None:
+    """Test that rates conversions could not divide by are rejected."""
+    # Arrange
+    create_test_currency()
+    path = write_rates_file(tmp_path, f"Date,USD\n2024-01-03,1.1\n2024-01-02,{value}\n")
+
+    # Act / Assert
+    with pytest.raises(CommandError, match=f"Line 3: USD rate '{value}'"):
+        call_command("load_exchange_rates", path, stdout=StringIO())
+
+    assert not ExchangeRate.objects.exists()
+
+
+@pytest.mark.django_db
+def test_seed_currencies_creates_catalogue() -> None:
+    """Test that the ISO 4217 catalogue is loaded."""
+    # Arrange
+    stdout = StringIO()
+
+    # Act
+    call_command("seed_currencies", stdout=stdout)
+
+    # Assert
+    yen = Currency.objects.get(code="JPY")
+    dinar = Currency.objects.get(code="KWD")
+
+    assert Currency.objects.count() > 150  # noqa: PLR2004
+    assert yen.decimal_places == 0
+    assert dinar.decimal_places == 3  # noqa: PLR2004
+    assert "0 updated" in stdout.getvalue()
+
+
+@pytest.mark.django_db
+def test_seed_currencies_only_writes_changes(
+    django_assert_num_queries: Callable,
+) -> None:
+    """Test that re-seeding leaves unchanged currencies and their cache untouched."""
+    # Arrange
+    call_command("seed_currencies", stdout=StringIO())
+
+    pound = Currency.objects.get(code="GBP")
+    Currency.objects.filter(code="USD").update(name="United States Dollar")
+    usd_updated_at = Currency.objects.get(code="USD").updated_at
+    version = get_cache_version(CURRENCIES_CACHE_VERSION)
+    stdout = StringIO()
+
+    # Act
+    call_command("seed_currencies", stdout=stdout)
+
+    # Assert
+    pound.refresh_from_db()
+    usd = Currency.objects.get(code="USD")
+
+    assert usd.name == "US Dollar"
+    assert usd.updated_at > usd_updated_at
+    assert Currency.objects.get(code="GBP").updated_at == pound.updated_at
+    assert get_cache_version(CURRENCIES_CACHE_VERSION) == version + 1
+    assert "0 currencies created, 1 updated" in stdout.getvalue()
+
+    with django_assert_num_queries(3):
+        # savepoint, select, release: nothing is written when nothing changed.
+        call_command("seed_currencies", stdout=StringIO())
@@ -0,0 +1,185 @@
+"""Test the currency conversion engine."""
+
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
+import pytest
+
+from currency.conversion import (
+    ExchangeRateNotFoundError,
+    RateTable,
+    UnknownCurrencyError,
+    convert_amounts,
+    get_rate_table,
+)
+from currency.models import Currency
+from currency.tests.test_helpers import create_test_currency, create_test_exchange_rate
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def create_rate_table() -> RateTable:
+    """Create currencies and rates quoted against EUR, and load their rate table."""
+    create_test_currency(name="Euro", code="EUR", symbol="€")
+    usd = create_test_currency()
+    gbp = create_test_currency(name="Pound Sterling", code="GBP", symbol="£")
+    jpy = create_test_currency(name="Japanese Yen", code="JPY", symbol="¥")
+    Currency.objects.filter(pk=jpy.pk).update(decimal_places=0)
+
+    create_test_exchange_rate(usd, rate="1.10", on=date(2024, 1, 1))
+    create_test_exchange_rate(usd, rate="1.20", on=date(2024, 1, 3))
+    create_test_exchange_rate(gbp, rate="0.85", on=date(2024, 1, 1))
+    create_test_exchange_rate(jpy, rate="160", on=date(2024, 1, 1))
+
+    return RateTable.load()
+
+
+@pytest.mark.django_db
+def test_convert_amounts_batch() -> None:
+    """Test that a batch of amounts is converted into minor units."""
+    # Arrange
+    table = create_rate_table()
+
+    # Act
+    converted = convert_amounts(
+        [1000, 1100, 5000, 100],
+        ["EUR", "USD", "GBP", "JPY"],
+        "EUR",
+        [None, date(2024, 1, 2), None, None],
+        table=table,
+    )
+
+    # Assert
+    assert converted == [1000, 1000, 5882, 62]
+
+
+@pytest.mark.django_db
+def test_convert_amounts_uses_latest_rate_on_or_before_date() -> None:
+    """Test that the rate for a day is the latest one published on or before it."""
+    # Arrange
+    table = create_rate_table()
+
+    # Act
+    converted = convert_amounts(
+        [1000, 1000, 1000],
+        ["EUR", "EUR", "EUR"],
+        "USD",
+        [date(2024, 1, 2), date(2024, 1, 3), None],
+        table=table,
+    )
+
+    # Assert
+    assert converted == [1100, 1200, 1200]
+
+
+@pytest.mark.django_db
+def test_convert_amounts_between_minor_units() -> None:
+    """Test converting between currencies with different minor units."""
+    # Arrange
+    table = create_rate_table()
+
+    # Act
+    converted = convert_amounts([1000], ["EUR"], "JPY", table=table)
+
+    # Assert
+    assert converted == [1600]
+
+
+def test_convert_amounts_rounds_half_to_even() -> None:
+    """Test that exact halves are rounded to the even minor unit."""
+    # Arrange
+    table = RateTable(
+        base_currency="EUR",
+        decimal_places={"EUR": 2, "XTS": 2},
+        latest_rates={"XTS": Decimal("0.5")},
+    )
+
+    # Act
+    converted = convert_amounts([1, 3, -1], ["EUR", "EUR", "EUR"], "XTS", table=table)
+
+    # Assert
+    assert converted == [0, 2, 0]
+
+
+@pytest.mark.django_db
+def test_convert_amounts_unknown_currency() -> None:
+    """Test that converting an unknown currency fails."""
+    # Arrange
+    table = create_rate_table()
+
+    # Act / Assert
+    with pytest.raises(UnknownCurrencyError):
+        convert_amounts([100], ["XXX"], "EUR", table=table)
+
+
+@pytest.mark.django_db
+def test_convert_amounts_missing_rate() -> None:
+    """Test that converting before the first published rate fails."""
+    # Arrange
+    table = create_rate_table()
+
+    # Act / Assert
+    with pytest.raises(ExchangeRateNotFoundError):
+        convert_amounts([100], ["USD"], "EUR", [date(2023, 12, 31)], table=table)
+
+
+@pytest.mark.django_db
+def test_rate_table_reloads_when_rates_change() -> None:
+    """Test that the in-memory rate table is reloaded after a rate is saved."""
+    # Arrange
+    create_test_currency(name="Euro", code="EUR", symbol="€")
+    usd = create_test_currency()
+    rate = create_test_exchange_rate(usd, rate="1.1", on=date(2024, 1, 1))
+
+    first_table = get_rate_table()
+
+    # Act
+    rate.rate = Decimal("1.2")
+    rate.save()
+
+    second_table = get_rate_table()
+
+    # Assert
+    assert get_rate_table() is second_table
+    assert first_table.get_rate("USD") == Decimal("1.1")
+    assert second_table.get_rate("USD") == Decimal("1.2")
+
+
+@pytest.mark.django_db
+def test_rate_table_holds_latest_rates_only() -> None:
+    """Test that only each currency's latest rate is loaded into memory."""
+    # Act
+    table = create_rate_table()
+
+    # Assert
+    assert table.latest_rates == {
+        "USD": Decimal("1.2"),
+        "GBP": Decimal("0.85"),
+        "JPY": Decimal(160),
+    }
+
+
+@pytest.mark.django_db
+def test_convert_amounts_reads_past_rates_in_one_query(
+    django_assert_num_queries: Callable,
+) -> None:
+    """Test that the rates of every past day converted are read together."""
+    # Arrange
+    table = create_rate_table()
+
+    # Act
+    with django_assert_num_queries(1):
+        converted = convert_amounts(
+            [1100, 1200, 850, 1100],
+            ["USD", "USD", "GBP", "USD"],
+            "EUR",
+            [date(2024, 1, 2), date(2024, 1, 5), date(2024, 1, 5), date(2024, 1, 2)],
+            table=table,
+        )
+
+    # Assert
+    assert converted == [1000, 1000, 1000, 1000]
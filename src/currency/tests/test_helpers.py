@@ -1,6 +1,11 @@
 """Helper functions for testing the currency app."""
 
-from currency.models import Currency
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+
+from currency.models import Currency, ExchangeRate
 
 
 def create_test_currency(
@@ -12,3 +17,14 @@ def create_test_currency(
     currency, _ = Currency.objects.get_or_create(name=name, code=code, symbol=symbol)
 
     return currency
+
+
+def create_test_exchange_rate(
+    currency: Currency,
+    rate: Decimal | str = "1.1",
+    on: date | None = None,
+) -> ExchangeRate:
+    """Create a test exchange rate against the base currency."""
+    return ExchangeRate.objects.create(
+        currency=currency, rate=Decimal(rate), date=on or date(2024, 1, 2)
+    )
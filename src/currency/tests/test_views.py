@@ -2,13 +2,19 @@
 Test views for currency app.
 """
 
+from collections.abc import Callable
+from datetime import date
+
 import pytest
 from django.test import Client
 from rest_framework import status
 
 from core.test_helpers import create_test_user
 from currency.models import Currency
-from currency.tests.test_helpers import create_test_currency
+from currency.tests.test_helpers import (
+    create_test_currency,
+    create_test_exchange_rate,
+)
 
 
 class TestUnauthenticatedCurrencyView:
@@ -417,3 +423,205 @@ class TestDeleteCurrencyView:
 
         # Assert
         assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+class TestConditionalGetCurrencyView:
+    """
+    Test ETag and If-None-Match handling for currencies.
+    """
+
+    @pytest.mark.django_db
+    def test_retrieve_currency_not_modified(self, client: Client) -> None:
+        """
+        Test that retrieving a currency with a matching ETag returns 304.
+        """
+        # Arrange
+        user = create_test_user()
+        currency = create_test_currency(name="US Dollar", code="USD", symbol="$")
+
+        client.force_login(user)
+        etag = client.get(f"/api/currency/{currency.id}/")["ETag"]
+
+        # Act
+        response = client.get(
+            f"/api/currency/{currency.id}/", headers={"If-None-Match": etag}
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response["ETag"] == etag
+        assert response.content == b""
+
+    @pytest.mark.django_db
+    def test_list_currencies_modified_after_create(self, client: Client) -> None:
+        """
+        Test that the list ETag changes once a currency is added.
+        """
+        # Arrange
+        user = create_test_user()
+        create_test_currency(name="US Dollar", code="USD", symbol="$")
+
+        client.force_login(user)
+        etag = client.get("/api/currency/")["ETag"]
+
+        create_test_currency(name="Euro", code="EUR", symbol="€")
+
+        # Act
+        response = client.get("/api/currency/", headers={"If-None-Match": etag})
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response["ETag"] != etag
+        assert len(response.json()) == 2  # noqa: PLR2004
+
+
+class TestCachedCurrencyListView:
+    """
+    Test the cached currency list.
+    """
+
+    @pytest.mark.django_db
+    def test_list_currencies_served_from_cache(
+        self, client: Client, django_assert_num_queries: Callable
+    ) -> None:
+        """
+        Test that an unchanged list is served without querying currencies.
+        """
+        # Arrange
+        user = create_test_user()
+        create_test_currency(name="US Dollar", code="USD", symbol="$")
+
+        client.force_login(user)
+        client.get("/api/currency/")
+
+        # Act
+        # session, user and the cache version.
+        with django_assert_num_queries(3):
+            response = client.get("/api/currency/")
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()[0]["code"] == "USD"
+        assert "max-age=" in response["Cache-Control"]
+        assert "private" in response["Cache-Control"]
+
+    @pytest.mark.django_db
+    def test_list_currencies_cache_ignores_query_string(
+        self, client: Client, django_assert_num_queries: Callable
+    ) -> None:
+        """
+        Test that arbitrary query parameters share the cached list.
+        """
+        # Arrange
+        user = create_test_user()
+        create_test_currency(name="US Dollar", code="USD", symbol="$")
+
+        client.force_login(user)
+        client.get("/api/currency/")
+
+        # Act
+        # session, user and the cache version.
+        with django_assert_num_queries(3):
+            response = client.get("/api/currency/?cache-buster=1")
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()[0]["code"] == "USD"
+
+    @pytest.mark.django_db
+    def test_list_currencies_invalidated_on_update(self, client: Client) -> None:
+        """
+        Test that updating a currency invalidates the cached list.
+        """
+        # Arrange
+        user = create_test_user()
+        currency = create_test_currency(name="US Dollar", code="USD", symbol="$")
+
+        client.force_login(user)
+        client.get("/api/currency/")
+
+        currency.symbol = "US$"
+        currency.save()
+
+        # Act
+        response = client.get("/api/currency/")
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()[0]["symbol"] == "US$"
+
+
+class TestConvertCurrencyView:
+    """
+    Test the batch currency conversion endpoint.
+    """
+
+    @pytest.mark.django_db
+    def test_convert_success(self, client: Client) -> None:
+        """
+        Test that a batch of amounts is converted.
+        """
+        # Arrange
+        user = create_test_user()
+        create_test_currency(name="Euro", code="EUR", symbol="€")
+        usd = create_test_currency()
+        create_test_exchange_rate(usd, rate="1.25", on=date(2024, 1, 1))
+
+        payload = {
+            "to": "EUR",
+            "items": [
+                {"amount": 1250, "currency": "USD", "date": "2024-01-05"},
+                {"amount": 999, "currency": "EUR"},
+            ],
+        }
+
+        client.force_login(user)
+
+        # Act
+        response = client.post("/api/currency/convert/", payload, "application/json")
+        response_data = response.json()
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response_data["to"] == "EUR"
+        assert response_data["results"][0]["converted_amount"] == 1000  # noqa: PLR2004
+        assert response_data["results"][0]["date"] == "2024-01-05"
+        assert response_data["results"][1]["converted_amount"] == 999  # noqa: PLR2004
+
+    @pytest.mark.django_db
+    def test_convert_missing_rate_fails(self, client: Client) -> None:
+        """
+        Test that converting a currency without rates fails.
+        """
+        # Arrange
+        user = create_test_user()
+        create_test_currency(name="Euro", code="EUR", symbol="€")
+        create_test_currency()
+
+        payload = {"to": "EUR", "items": [{"amount": 100, "currency": "USD"}]}
+
+        client.force_login(user)
+
+        # Act
+        response = client.post("/api/currency/convert/", payload, "application/json")
+
+        # Assert
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "USD" in response.json()["detail"]
+
+    @pytest.mark.django_db
+    def test_convert_empty_items_fails(self, client: Client) -> None:
+        """
+        Test that a batch must contain at least one amount.
+        """
+        # Arrange
+        user = create_test_user()
+        payload = {"to": "EUR", "items": []}
+
+        client.force_login(user)
+
+        # Act
+        response = client.post("/api/currency/convert/", payload, "application/json")
+
+        # Assert
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
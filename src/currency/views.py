@@ -1,14 +1,61 @@
 """Currency views."""
 
-from rest_framework import viewsets
+from rest_framework import serializers, viewsets
+from rest_framework.decorators import action
+from rest_framework.request import Request
+from rest_framework.response import Response
 
-from currency.models import Currency
-from currency.serializers import CurrencySerializer
+from core.cache import CachedReferenceDataMixin
+from core.replicas import ReplicaReadMixin
+from currency.conversion import (
+    ExchangeRateNotFoundError,
+    UnknownCurrencyError,
+    convert_amounts,
+)
+from currency.models import CURRENCIES_CACHE_VERSION, Currency
+from currency.serializers import ConversionRequestSerializer, CurrencySerializer
 
 
-class CurrencyViewSet(viewsets.ModelViewSet):
+class CurrencyViewSet(
+    ReplicaReadMixin, CachedReferenceDataMixin, viewsets.ModelViewSet
+):
     """Currency view set."""
 
+    cache_version_name = CURRENCIES_CACHE_VERSION
     queryset = Currency.objects.all()
     serializer_class = CurrencySerializer
     pagination_class = None
+
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="convert",
+        serializer_class=ConversionRequestSerializer,
+    )
+    def convert(self, request: Request) -> Response:
+        """Convert a batch of amounts, in minor units, into one currency."""
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        to_currency = serializer.validated_data["to"]
+        items = serializer.validated_data["items"]
+
+        try:
+            converted = convert_amounts(
+                [item["amount"] for item in items],
+                [item["currency"] for item in items],
+                to_currency,
+                [item["date"] for item in items],
+            )
+        except (UnknownCurrencyError, ExchangeRateNotFoundError) as error:
+            raise serializers.ValidationError({"detail": str(error)}) from error
+
+        return Response(
+            {
+                "to": to_currency,
+                "results": [
+                    {**item, "converted_amount": amount}
+                    for item, amount in zip(items, converted, strict=True)
+                ],
+            }
+        )
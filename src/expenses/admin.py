@@ -0,0 +1,104 @@
+"""Admin configuration for the expenses app."""
+
+from typing import ClassVar
+
+from django.contrib import admin
+from django.db import models
+from django.http import HttpRequest
+
+from .models import (
+    Balance,
+    Expense,
+    ExpenseShare,
+    MonthlySpending,
+    RecurringExpense,
+    RecurringExpenseParticipant,
+    Settlement,
+)
+
+
+class LedgerReadOnlyMixin:
+    """
+    Make an admin view-only for rows the balance ledger is derived from.
+
+    Expenses, shares and settlements must be written through
+    ``expenses.services``, which updates the ledger, spending rollup and
+    ledger version in the same transaction; balances and rollups are only
+    written by them. Saving or deleting any of these rows directly would let
+    the ledger drift silently.
+    """
+
+    def has_add_permission(
+        self,
+        request: HttpRequest,  # noqa: ARG002
+        obj: models.Model | None = None,  # noqa: ARG002
+    ) -> bool:
+        """Disallow adding rows."""
+        return False
+
+    def has_change_permission(
+        self,
+        request: HttpRequest,  # noqa: ARG002
+        obj: models.Model | None = None,  # noqa: ARG002
+    ) -> bool:
+        """Disallow changing rows."""
+        return False
+
+    def has_delete_permission(
+        self,
+        request: HttpRequest,  # noqa: ARG002
+        obj: models.Model | None = None,  # noqa: ARG002
+    ) -> bool:
+        """Disallow deleting rows."""
+        return False
+
+    def get_readonly_fields(
+        self,
+        request: HttpRequest,  # noqa: ARG002
+        obj: models.Model | None = None,  # noqa: ARG002
+    ) -> list[str]:
+        """Show every field as read-only."""
+        return [field.name for field in self.model._meta.fields]  # noqa: SLF001
+
+
+class ExpenseShareInline(LedgerReadOnlyMixin, admin.TabularInline):
+    """Expense share inline."""
+
+    model = ExpenseShare
+
+
+class ExpenseAdmin(LedgerReadOnlyMixin, admin.ModelAdmin):
+    """Expense admin."""
+
+    inlines: ClassVar = [ExpenseShareInline]
+
+
+class SettlementAdmin(LedgerReadOnlyMixin, admin.ModelAdmin):
+    """Settlement admin."""
+
+
+class BalanceAdmin(LedgerReadOnlyMixin, admin.ModelAdmin):
+    """Balance admin."""
+
+
+class MonthlySpendingAdmin(LedgerReadOnlyMixin, admin.ModelAdmin):
+    """Monthly spending admin."""
+
+
+class RecurringExpenseParticipantInline(admin.TabularInline):
+    """Recurring expense participant inline."""
+
+    model = RecurringExpenseParticipant
+
+
+class RecurringExpenseAdmin(admin.ModelAdmin):
+    """Recurring expense admin."""
+
+    inlines: ClassVar = [RecurringExpenseParticipantInline]
+
+
+admin.site.register(Expense, ExpenseAdmin)
+admin.site.register(RecurringExpense, RecurringExpenseAdmin)
+admin.site.register(Balance, BalanceAdmin)
+admin.site.register(Settlement, SettlementAdmin)
+admin.site.register(MonthlySpending, MonthlySpendingAdmin)
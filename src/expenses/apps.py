@@ -0,0 +1,14 @@
+"""Expenses app."""
+
+from django.apps import AppConfig
+
+
+class ExpensesConfig(AppConfig):
+    """Expenses app config."""
+
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "expenses"
+
+    def ready(self) -> None:
+        """Connect the app's signal receivers that live outside its models."""
+        from expenses import spending  # noqa: F401, PLC0415
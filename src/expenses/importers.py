@@ -0,0 +1,328 @@
+"""Streaming import of expenses exported from other apps."""
+
+from __future__ import annotations
+
+import csv
+from dataclasses import dataclass, field
+from datetime import date
+from decimal import Decimal, InvalidOperation
+from typing import TYPE_CHECKING
+
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Q
+
+from categories.models import Category
+from currency.models import Currency
+from expenses.ledger import rebuild_group_balances
+from expenses.models import Expense, ExpenseShare, SplitType
+from expenses.spending import rebuild_group_spending
+from groups.models import Group
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+    from django.contrib.auth.base_user import AbstractBaseUser
+
+    from groups.models import GroupMember
+
+# Leading columns of a Splitwise export; every following column is one person
+SPLITWISE_COLUMNS = ("date", "description", "category", "cost", "currency")
+
+# Splitwise records settlements between people as expenses in this category
+PAYMENT_CATEGORY = "payment"
+
+# Only the first errors are kept, so a badly broken file does not use more memory
+MAX_REPORTED_ERRORS = 100
+
+
+class ImportFileError(ValueError):
+    """Raised when a file cannot be imported at all."""
+
+
+class RowError(ValueError):
+    """Raised when a single row cannot be imported."""
+
+
+@dataclass
+class ImportResult:
+    """The outcome of an import."""
+
+    imported: int = 0
+    skipped: int = 0
+    failed: int = 0
+    errors: list[dict] = field(default_factory=list)
+
+    def add_error(self, line: int, message: str) -> None:
+        """Record a row that could not be imported."""
+        self.failed += 1
+
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"line": line, "error": message})
+
+
+def parse_member_mappings(mappings: Iterable[str]) -> dict[str, str]:
+    """Parse ``NAME=USERNAME`` mappings of people in a file to group members."""
+    members = {}
+
+    for mapping in mappings:
+        name, separator, username = mapping.partition("=")
+
+        if not separator or not name.strip() or not username.strip():
+            message = f"Invalid member mapping {mapping!r}; expected NAME=USERNAME."
+            raise ImportFileError(message)
+
+        members[name.strip()] = username.strip()
+
+    return members
+
+
+class SplitwiseImporter:
+    """
+    Import expenses from a CSV file in the Splitwise export layout.
+
+    The file has ``Date``, ``Description``, ``Category``, ``Cost`` and
+    ``Currency`` columns followed by one column per person holding their net
+    amount for the expense: what they paid minus their share. The person with a
+    positive amount paid; everyone else with a non-zero amount owes their share.
+
+    People are matched to group members by username, full name or first name
+    (case-insensitive) unless mapped explicitly, and categories to categories by
+    name, preferring the group's own. Rows are streamed and written in chunks,
+    each chunk in one transaction with two bulk inserts, and the group's balances
+    and spending rollup are rebuilt once at the end, even if a chunk fails.
+    """
+
+    def __init__(
+        self,
+        group: Group,
+        created_by: AbstractBaseUser | None = None,
+        members: Mapping[str, str] | None = None,
+        batch_size: int = 1000,
+    ) -> None:
+        """Prepare an import into a group, with optional name to username overrides."""
+        self.group = group
+        self.created_by = created_by
+        self.member_overrides = {
+            name.strip().lower(): username for name, username in (members or {}).items()
+        }
+        self.batch_size = batch_size
+        self.currencies: dict[str, Currency] = {}
+        self.categories: dict[str, Category] = {}
+
+    def run(self, lines: Iterable[str]) -> ImportResult:
+        """Import every row, returning the counts and the rows that failed."""
+        reader = csv.reader(lines)
+        members = self.resolve_members(next(reader, None))
+        self.currencies = {
+            currency.code: currency for currency in Currency.objects.all()
+        }
+        self.categories = self.load_categories()
+
+        result = ImportResult()
+        batch: list[tuple[Expense, list[ExpenseShare]]] = []
+
+        try:
+            for line_number, row in enumerate(reader, start=2):
+                try:
+                    parsed = self.parse_row(row, members)
+                except RowError as error:
+                    result.add_error(line_number, str(error))
+                    continue
+
+                if parsed is None:
+                    result.skipped += 1
+                    continue
+
+                batch.append(parsed)
+
+                if len(batch) >= self.batch_size:
+                    result.imported += self.write_batch(batch)
+                    batch = []
+
+            if batch:
+                result.imported += self.write_batch(batch)
+        finally:
+            # The batches already written stay, so they must be in the balances
+            # and spending even when a later batch fails
+            if result.imported:
+                rebuild_group_balances(self.group.pk)
+                rebuild_group_spending(self.group.pk)
+
+        return result
+
+    def resolve_members(self, header: list[str] | None) -> list[GroupMember]:
+        """Map every person column to a group member."""
+        if not header or [
+            column.strip().lower() for column in header[: len(SPLITWISE_COLUMNS)]
+        ] != list(SPLITWISE_COLUMNS):
+            message = (
+                "Expected a header row starting with Date, Description, Category, "
+                "Cost and Currency columns."
+            )
+            raise ImportFileError(message)
+
+        names = [name.strip() for name in header[len(SPLITWISE_COLUMNS) :]]
+        lookup: dict[str, list[GroupMember]] = {}
+
+        for member in self.group.group_members.select_related("user"):
+            user = member.user
+            keys = {
+                user.username.lower(),
+                user.get_full_name().lower(),
+                user.first_name.lower(),
+            }
+
+            for key in keys - {""}:
+                lookup.setdefault(key, []).append(member)
+
+        resolved = []
+        unknown = []
+
+        for name in names:
+            key = self.member_overrides.get(name.lower(), name).lower()
+            matches = lookup.get(key, [])
+
+            if len(matches) != 1:
+                unknown.append(name)
+                continue
+
+            resolved.append(matches[0])
+
+        if unknown:
+            message = (
+                f"Could not match these people to group members: {', '.join(unknown)}."
+            )
+            raise ImportFileError(message)
+
+        return resolved
+
+    def load_categories(self) -> dict[str, Category]:
+        """Map lower-cased category names to categories, preferring the group's."""
+        categories = Category.objects.filter(
+            Q(associated_categories=self.group) | Q(parent__isnull=True)
+        ).annotate(
+            in_group=Exists(
+                Group.categories.through.objects.filter(
+                    group=self.group, category=OuterRef("pk")
+                )
+            )
+        )
+
+        # Later entries win, so the group's categories replace same-named roots
+        return {
+            category.name.lower(): category
+            for category in sorted(categories, key=lambda category: category.in_group)
+        }
+
+    def parse_row(
+        self, row: list[str], members: list[GroupMember]
+    ) -> tuple[Expense, list[ExpenseShare]] | None:
+        """Return an unsaved expense and its shares, or None to skip the row."""
+        if not row or not row[0].strip():
+            return None
+
+        if len(row) != len(SPLITWISE_COLUMNS) + len(members):
+            message = f"Expected {len(SPLITWISE_COLUMNS) + len(members)} columns."
+            raise RowError(message)
+
+        values = dict(
+            zip(SPLITWISE_COLUMNS, (value.strip() for value in row), strict=False)
+        )
+
+        if values["category"].lower() == PAYMENT_CATEGORY:
+            return None
+
+        try:
+            day = date.fromisoformat(values["date"])
+        except ValueError as error:
+            message = f"Invalid date {values['date']!r}."
+            raise RowError(message) from error
+
+        currency = self.currencies.get(values["currency"].upper())
+
+        if currency is None:
+            message = f"Unknown currency {values['currency']!r}."
+            raise RowError(message)
+
+        amount = self.to_minor_units(values["cost"], currency)
+        nets = [
+            self.to_minor_units(value, currency)
+            for value in row[len(SPLITWISE_COLUMNS) :]
+        ]
+        payer, share_amounts = self.split_nets(amount, nets)
+
+        expense = Expense(
+            group=self.group,
+            title=values["description"][:255] or "Imported expense",
+            amount=amount,
+            currency=currency,
+            category=self.categories.get(values["category"].lower()),
+            paid_by=members[payer],
+            split_type=SplitType.EXACT,
+            date=day,
+            created_by=self.created_by,
+        )
+
+        shares = [
+            ExpenseShare(expense=expense, member=member, value=share, amount=share)
+            for member, share in zip(members, share_amounts, strict=True)
+            if share
+        ]
+
+        return expense, shares
+
+    def split_nets(self, amount: int, nets: list[int]) -> tuple[int, list[int]]:
+        """
+        Return the payer's position and every person's share of the cost.
+
+        Each person's net amount is what they paid minus their share, so only the
+        payer's share differs from the negated net amount. The others cannot owe
+        more than the cost, as that would leave the payer a negative share.
+        """
+        if amount <= 0:
+            message = "The cost must be positive."
+            raise RowError(message)
+
+        if sum(nets) != 0:
+            message = "The amounts for each person do not add up to zero."
+            raise RowError(message)
+
+        payers = [index for index, net in enumerate(nets) if net > 0]
+
+        if len(payers) != 1:
+            message = "Exactly one person must have paid."
+            raise RowError(message)
+
+        payer = payers[0]
+
+        if nets[payer] > amount:
+            message = "The payer's amount is more than the cost."
+            raise RowError(message)
+
+        return payer, [
+            amount - net if index == payer else -net for index, net in enumerate(nets)
+        ]
+
+    def to_minor_units(self, value: str, currency: Currency) -> int:
+        """Convert an amount in major units to a whole number of minor units."""
+        try:
+            amount = Decimal(value.strip() or "0").scaleb(currency.decimal_places)
+        except InvalidOperation as error:
+            message = f"Invalid amount {value!r}."
+            raise RowError(message) from error
+
+        if amount != amount.to_integral_value():
+            message = f"{value} has more decimal places than {currency.code} allows."
+            raise RowError(message)
+
+        return int(amount)
+
+    @transaction.atomic
+    def write_batch(self, batch: list[tuple[Expense, list[ExpenseShare]]]) -> int:
+        """Write a chunk of expenses and their shares with two bulk inserts."""
+        Expense.objects.bulk_create([expense for expense, _ in batch])
+        ExpenseShare.objects.bulk_create(
+            [share for _, shares in batch for share in shares]
+        )
+
+        return len(batch)
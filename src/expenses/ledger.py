@@ -0,0 +1,259 @@
+"""Incrementally maintained balance ledger."""
+
+from __future__ import annotations
+
+import uuid
+from collections import defaultdict
+from typing import TYPE_CHECKING
+
+from django.db import connection, transaction
+from django.db.models import F, Q, Sum
+from django.db.models.functions import Abs, Coalesce
+from django.utils import timezone
+
+from expenses.models import Balance, Expense, ExpenseShare, Settlement
+from groups.models import Group
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from django.contrib.auth.base_user import AbstractBaseUser
+    from django.db.models import Model
+
+    # (group id, member id, currency id)
+    BalanceKey = tuple[uuid.UUID, uuid.UUID, uuid.UUID]
+
+
+def expense_deltas(
+    expense: Expense, shares: Iterable[tuple[uuid.UUID, int]], sign: int = 1
+) -> dict[BalanceKey, int]:
+    """
+    Return the balance changes an expense makes.
+
+    The payer is owed the full amount and every participant owes their share;
+    ``sign=-1`` returns the changes that undo the expense.
+    """
+    deltas: dict[BalanceKey, int] = defaultdict(int)
+
+    deltas[expense.group_id, expense.paid_by_id, expense.currency_id] += (
+        sign * expense.amount
+    )
+
+    for member_id, amount in shares:
+        deltas[expense.group_id, member_id, expense.currency_id] -= sign * amount
+
+    return deltas
+
+
+def settlement_deltas(settlement: Settlement, sign: int = 1) -> dict[BalanceKey, int]:
+    """
+    Return the balance changes a settlement makes.
+
+    The payer's debt goes down and the payee is owed less; ``sign=-1`` returns the
+    changes that undo the settlement.
+    """
+    return merge_deltas(
+        {
+            (
+                settlement.group_id,
+                settlement.payer_id,
+                settlement.currency_id,
+            ): sign * settlement.amount
+        },
+        {
+            (
+                settlement.group_id,
+                settlement.payee_id,
+                settlement.currency_id,
+            ): -sign * settlement.amount
+        },
+    )
+
+
+def merge_deltas(*deltas: dict[BalanceKey, int]) -> dict[BalanceKey, int]:
+    """Add several sets of balance changes together."""
+    merged: dict[BalanceKey, int] = defaultdict(int)
+
+    for changes in deltas:
+        for key, amount in changes.items():
+            merged[key] += amount
+
+    return merged
+
+
+def apply_balance_deltas(deltas: dict[BalanceKey, int]) -> None:
+    """
+    Add balance changes to the ledger with one atomic upsert.
+
+    The increment happens in the database (``amount = amount + excluded.amount``),
+    so concurrent writers never overwrite each other's changes, and rows are
+    written in key order so two transactions touching the same members lock them
+    in the same order. The groups' ledger versions are bumped so anything derived
+    from their balances is recomputed. Must be called inside the transaction
+    making the change.
+    """
+    rows = sorted(
+        ((key, amount) for key, amount in deltas.items() if amount),
+        key=lambda row: tuple(str(part) for part in row[0]),
+    )
+
+    if not rows:
+        return
+
+    # Bumping the version first takes the group row locks before any balance row,
+    # in the same order as rebuild_group_balances, so the two cannot deadlock.
+    Group.objects.filter(pk__in={key[0] for key, _ in rows}).update(
+        ledger_version=F("ledger_version") + 1
+    )
+
+    upsert_increments(
+        Balance,
+        ["group", "member", "currency"],
+        [(key, (amount,)) for key, amount in rows],
+        ["amount"],
+    )
+
+
+def upsert_increments(
+    model: type[Model],
+    key_fields: Sequence[str],
+    rows: Sequence[tuple[tuple, tuple[int, ...]]],
+    increment_fields: Sequence[str],
+    where: str = "",
+) -> None:
+    """
+    Add amounts to counter rows with one ``INSERT ... ON CONFLICT DO UPDATE``.
+
+    Each row is a key, matching ``key_fields``, and the amounts added to
+    ``increment_fields``. Missing rows are inserted and existing rows are
+    incremented in the database, so concurrent writers never lose each other's
+    changes. ``where`` is the predicate of a partial unique index on the key.
+    """
+    meta = model._meta  # noqa: SLF001
+    fields = [meta.get_field(name) for name in ("id", *key_fields)]
+    updated_at = meta.get_field("updated_at").get_db_prep_value(
+        timezone.now(), connection
+    )
+
+    params: list = []
+
+    for key, amounts in rows:
+        params.extend(
+            field.get_db_prep_value(value, connection)
+            for field, value in zip(fields, (uuid.uuid4(), *key), strict=True)
+        )
+        params.extend((*amounts, updated_at))
+
+    quote = connection.ops.quote_name
+    table = quote(meta.db_table)
+    increments = [quote(meta.get_field(name).column) for name in increment_fields]
+    columns = [
+        *(quote(field.column) for field in fields),
+        *increments,
+        quote("updated_at"),
+    ]
+    placeholders = ", ".join(["(" + ", ".join(["%s"] * len(columns)) + ")"] * len(rows))
+    conflict = ", ".join(columns[1 : len(fields)])
+    updates = ", ".join(
+        f"{column} = {table}.{column} + EXCLUDED.{column}" for column in increments
+    )
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {table} ({', '.join(columns)}) VALUES {placeholders} "  # noqa: S608
+            f"ON CONFLICT ({conflict}){f' WHERE {where}' if where else ''} "
+            f"DO UPDATE SET {updates}, updated_at = EXCLUDED.updated_at",
+            params,
+        )
+
+
+def compute_balances(group_id: uuid.UUID | None = None) -> dict[BalanceKey, int]:
+    """
+    Rebuild balances from expenses, shares and settlements with grouped queries.
+
+    Every group's balances are computed unless one group is given.
+    """
+    balances: dict[BalanceKey, int] = defaultdict(int)
+    expenses = Expense.objects.all()
+    shares = ExpenseShare.objects.all()
+    settlements = Settlement.objects.all()
+
+    if group_id is not None:
+        expenses = expenses.filter(group_id=group_id)
+        shares = shares.filter(expense__group_id=group_id)
+        settlements = settlements.filter(group_id=group_id)
+
+    paid = (
+        expenses.values_list("group_id", "paid_by_id", "currency_id")
+        .annotate(total=Sum("amount"))
+        .order_by()
+    )
+
+    for expense_group_id, member_id, currency_id, total in paid:
+        balances[expense_group_id, member_id, currency_id] += total
+
+    owed = (
+        shares.values_list("expense__group_id", "member_id", "expense__currency_id")
+        .annotate(total=Sum("amount"))
+        .order_by()
+    )
+
+    for expense_group_id, member_id, currency_id, total in owed:
+        balances[expense_group_id, member_id, currency_id] -= total
+
+    for member_field, sign in (("payer_id", 1), ("payee_id", -1)):
+        settled = (
+            settlements.values_list("group_id", member_field, "currency_id")
+            .annotate(total=Sum("amount"))
+            .order_by()
+        )
+
+        for settlement_group_id, member_id, currency_id, total in settled:
+            balances[settlement_group_id, member_id, currency_id] += sign * total
+
+    return balances
+
+
+def rebuild_group_balances(group_id: uuid.UUID) -> None:
+    """
+    Replace a group's balances with ones rebuilt from its source rows.
+
+    Used after bulk writes that bypass the incremental ledger. Bumping the
+    group's ledger version first locks the group row, so concurrent expense
+    writes in the group wait for the rebuild.
+    """
+    with transaction.atomic():
+        Group.objects.filter(pk=group_id).update(ledger_version=F("ledger_version") + 1)
+
+        balances = compute_balances(group_id)
+
+        Balance.objects.filter(group_id=group_id).delete()
+        Balance.objects.bulk_create(
+            Balance(
+                group_id=group_id,
+                member_id=member_id,
+                currency_id=currency_id,
+                amount=amount,
+            )
+            for (_, member_id, currency_id), amount in balances.items()
+            if amount
+        )
+
+
+def summarize_user_balances(user: AbstractBaseUser) -> list[dict]:
+    """
+    Return a user's totals per currency across every group they belong to.
+
+    One grouped aggregate over the ledger returns, per currency, what the user is
+    owed, what they owe and their net position, all in minor units.
+    """
+    return list(
+        Balance.objects.filter(member__user=user)
+        .values("currency__code")
+        .annotate(
+            owed=Coalesce(Sum("amount", filter=Q(amount__gt=0)), 0),
+            owe=Coalesce(Abs(Sum("amount", filter=Q(amount__lt=0))), 0),
+            net=Sum("amount"),
+        )
+        .order_by("currency__code")
+    )
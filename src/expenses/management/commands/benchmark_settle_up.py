@@ -0,0 +1,67 @@
+"""Management command to benchmark debt simplification."""
+
+from __future__ import annotations
+
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from expenses.settle_up import simplify_debts
+
+DEFAULT_SIZES = (2, 5, 10, 25, 50, 100, 250, 500)
+
+
+class Command(BaseCommand):
+    """
+    Time settle-up suggestions for groups of increasing size.
+
+    Balances are generated in memory with a fixed seed, so runs are comparable
+    and the database is not touched.
+    """
+
+    help = "Benchmark debt simplification for groups of 2 to 500 members."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add the command's arguments."""
+        parser.add_argument(
+            "--sizes",
+            type=int,
+            nargs="+",
+            default=list(DEFAULT_SIZES),
+            help="Group sizes to benchmark.",
+        )
+        parser.add_argument(
+            "--repeat", type=int, default=50, help="Runs per group size."
+        )
+        parser.add_argument("--seed", type=int, default=0, help="Random seed.")
+
+    def handle(self, *args, **options) -> None:  # noqa: ANN002, ANN003, ARG002
+        """Run the benchmark and report the median time per group size."""
+        rng = random.Random(options["seed"])  # noqa: S311
+
+        self.stdout.write(f"{'members':>8} {'transfers':>10} {'median ms':>10}")
+
+        for size in options["sizes"]:
+            balances = self.generate_balances(rng, size)
+            timings = []
+
+            for _ in range(options["repeat"]):
+                started = time.perf_counter()
+                transfers = simplify_debts(balances)
+                timings.append(time.perf_counter() - started)
+
+            self.stdout.write(
+                f"{size:>8} {len(transfers):>10} "
+                f"{statistics.median(timings) * 1000:>10.3f}"
+            )
+
+    def generate_balances(self, rng: random.Random, size: int) -> dict[int, int]:
+        """Return random balances for ``size`` members that add up to zero."""
+        balances = {
+            member: rng.randint(-100_000, 100_000) for member in range(size - 1)
+        }
+        balances[size - 1] = -sum(balances.values())
+
+        return balances
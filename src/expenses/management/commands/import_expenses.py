@@ -0,0 +1,101 @@
+"""Management command to import expenses from a CSV export of another app."""
+
+from __future__ import annotations
+
+import io
+import sys
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from expenses.importers import (
+    ImportFileError,
+    SplitwiseImporter,
+    parse_member_mappings,
+)
+from groups.models import Group
+
+
+class Command(BaseCommand):
+    """
+    Import expenses into a group from a CSV file in the Splitwise export layout.
+
+    The file is streamed and written in chunks; rows that cannot be imported are
+    reported with their line number and the rest are imported.
+    """
+
+    help = "Import expenses into a group from a Splitwise-style CSV export."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add the command's arguments."""
+        parser.add_argument("group", help="Id of the group to import into.")
+        parser.add_argument("path", help="Path to the CSV file, or - for stdin.")
+        parser.add_argument(
+            "--member",
+            action="append",
+            default=[],
+            metavar="NAME=USERNAME",
+            help="Map a person in the file to a group member's username.",
+        )
+        parser.add_argument(
+            "--created-by", help="Username recorded as the creator of the expenses."
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of expenses written per transaction.",
+        )
+
+    def handle(self, *args, **options) -> None:  # noqa: ANN002, ANN003, ARG002
+        """Import the file and report the result."""
+        try:
+            group = Group.objects.get(pk=options["group"])
+        except (Group.DoesNotExist, ValidationError) as error:
+            message = f"Group {options['group']} does not exist."
+            raise CommandError(message) from error
+
+        created_by = None
+
+        if options["created_by"]:
+            created_by = (
+                get_user_model().objects.filter(username=options["created_by"]).first()
+            )
+
+            if created_by is None:
+                message = f"User {options['created_by']} does not exist."
+                raise CommandError(message)
+
+        try:
+            importer = SplitwiseImporter(
+                group,
+                created_by=created_by,
+                members=parse_member_mappings(options["member"]),
+                batch_size=options["batch_size"],
+            )
+
+            with self.open_input(options["path"]) as file:
+                result = importer.run(file)
+        except ImportFileError as error:
+            raise CommandError(str(error)) from error
+
+        for error in result.errors:
+            self.stderr.write(f"Line {error['line']}: {error['error']}")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{result.imported} expenses imported, {result.skipped} skipped, "
+                f"{result.failed} failed."
+            )
+        )
+
+    def open_input(self, path: str) -> io.TextIOBase:
+        """Open the input file for streaming."""
+        if path == "-":
+            return io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8-sig")
+
+        try:
+            return open(path, encoding="utf-8-sig", newline="")  # noqa: PTH123
+        except OSError as error:
+            raise CommandError(str(error)) from error
@@ -0,0 +1,42 @@
+"""Management command to rebuild the monthly spending rollup."""
+
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from expenses.spending import rebuild_group_spending
+from groups.models import Group
+
+
+class Command(BaseCommand):
+    """
+    Rebuild the monthly spending rollup from expenses.
+
+    Every group is rebuilt in its own transaction, so the command can run while
+    expenses are being written. Use it to backfill the rollup or to repair it
+    after writes that bypassed the expense services.
+    """
+
+    help = "Rebuild the monthly spending rollup from expenses."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add the command's arguments."""
+        parser.add_argument(
+            "--group", action="append", help="Only rebuild this group (repeatable)."
+        )
+
+    def handle(self, *args, **options) -> None:  # noqa: ANN002, ANN003, ARG002
+        """Rebuild the rollup group by group."""
+        groups = Group.objects.order_by("pk")
+
+        if options["group"]:
+            groups = groups.filter(pk__in=options["group"])
+
+        group_ids = list(groups.values_list("pk", flat=True))
+
+        for group_id in group_ids:
+            rebuild_group_spending(group_id)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Spending rebuilt for {len(group_ids)} groups.")
+        )
@@ -0,0 +1,90 @@
+"""Management command to verify the balance ledger against its source rows."""
+
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import transaction
+from django.db.models import F
+
+from expenses.ledger import compute_balances
+from expenses.models import Balance
+from groups.models import Group
+
+
+class Command(BaseCommand):
+    """
+    Rebuild every balance from expenses, shares and settlements and report drift.
+
+    Expected balances are computed with grouped aggregates and compared with the
+    ledger. With ``--fix`` drifted balances are overwritten inside one
+    transaction, and the ledger version of every group they belong to is bumped
+    so cached settle-up suggestions are recomputed; otherwise the command fails
+    when any balance has drifted.
+    """
+
+    help = "Verify the balance ledger against expenses, shares and settlements."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add the command's arguments."""
+        parser.add_argument(
+            "--fix", action="store_true", help="Overwrite drifted balances."
+        )
+
+    def handle(self, *args, **options) -> None:  # noqa: ANN002, ANN003, ARG002
+        """Compare the ledger with the expected balances."""
+        with transaction.atomic():
+            if options["fix"]:
+                # The groups are locked before their balances, as every ledger
+                # write does, so repairing cannot deadlock with those writes
+                list(Group.objects.select_for_update().values_list("pk", flat=True))
+
+            ledger = {
+                (balance.group_id, balance.member_id, balance.currency_id): balance
+                for balance in Balance.objects.select_for_update()
+            }
+            expected = compute_balances()
+
+            drifted = [
+                key
+                for key in ledger.keys() | expected.keys()
+                if (ledger[key].amount if key in ledger else 0) != expected.get(key, 0)
+            ]
+
+            for group_id, member_id, currency_id in drifted:
+                key = (group_id, member_id, currency_id)
+                actual = ledger[key].amount if key in ledger else 0
+
+                self.stderr.write(
+                    f"Group {group_id}, member {member_id}, currency {currency_id}: "
+                    f"ledger has {actual}, expected {expected.get(key, 0)}."
+                )
+
+            if drifted and options["fix"]:
+                Balance.objects.bulk_create(
+                    [
+                        Balance(
+                            group_id=group_id,
+                            member_id=member_id,
+                            currency_id=currency_id,
+                            amount=expected.get((group_id, member_id, currency_id), 0),
+                        )
+                        for group_id, member_id, currency_id in drifted
+                    ],
+                    update_conflicts=True,
+                    unique_fields=["group", "member", "currency"],
+                    update_fields=["amount", "updated_at"],
+                )
+                Group.objects.filter(
+                    pk__in={group_id for group_id, _, _ in drifted}
+                ).update(ledger_version=F("ledger_version") + 1)
+
+        if drifted and not options["fix"]:
+            message = f"{len(drifted)} balances drifted; run with --fix to repair them."
+            raise CommandError(message)
+
+        verb = "repaired" if drifted else "drifted"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{len(ledger)} balances checked, {len(drifted)} {verb}."
+            )
+        )
@@ -0,0 +1,54 @@
+# Generated by Django 5.1.3 on 2026-10-19 06:39
+
+import django.db.models.deletion
+import django.utils.timezone
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('categories', '0002_category_path'),
+        ('currency', '0002_currency_decimal_places_exchangerate'),
+        ('groups', '0005_group_unique_group_title_per_user_case_insensitive_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Expense',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('title', models.CharField(max_length=255)),
+                ('description', models.TextField(blank=True, null=True)),
+                ('amount', models.PositiveBigIntegerField()),
+                ('split_type', models.CharField(choices=[('equal', 'Equal'), ('exact', 'Exact amounts'), ('percentage', 'Percentages'), ('shares', 'Shares')], default='equal', max_length=20)),
+                ('date', models.DateField(default=django.utils.timezone.localdate)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('category', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='expenses', to='categories.category')),
+                ('created_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='created_expenses', to=settings.AUTH_USER_MODEL)),
+                ('currency', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='expenses', to='currency.currency')),
+                ('group', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='expenses', to='groups.group')),
+                ('paid_by', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='paid_expenses', to='groups.groupmember')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ExpenseShare',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('value', models.DecimalField(blank=True, decimal_places=4, max_digits=20, null=True)),
+                ('amount', models.BigIntegerField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('expense', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='shares', to='expenses.expense')),
+                ('member', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='expense_shares', to='groups.groupmember')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('expense', 'member'), name='unique_expense_share_member')],
+            },
+        ),
+    ]
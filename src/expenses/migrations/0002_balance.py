@@ -0,0 +1,31 @@
+# Generated by Django 5.1.3 on 2026-10-19 06:41
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('currency', '0002_currency_decimal_places_exchangerate'),
+        ('expenses', '0001_initial'),
+        ('groups', '0005_group_unique_group_title_per_user_case_insensitive_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Balance',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('amount', models.BigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('currency', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='balances', to='currency.currency')),
+                ('group', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='balances', to='groups.group')),
+                ('member', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='balances', to='groups.groupmember')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('group', 'member', 'currency'), name='unique_balance_per_member_currency')],
+            },
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.1.3 on 2026-10-19 06:47
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('categories', '0002_category_path'),
+        ('currency', '0002_currency_decimal_places_exchangerate'),
+        ('expenses', '0002_balance'),
+        ('groups', '0006_group_ledger_version'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='expense',
+            index=models.Index(fields=['group', '-date', '-id'], name='expense_feed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='expense',
+            index=models.Index(fields=['group', 'category', '-date', '-id'], name='expense_feed_category_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='expense',
+            index=models.Index(fields=['group', 'paid_by', '-date', '-id'], name='expense_feed_paid_by_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='expense',
+            index=models.Index(fields=['-date', '-id'], name='expense_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='expenseshare',
+            index=models.Index(fields=['member', 'expense'], name='expense_share_member_idx'),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.1.3 on 2026-10-19 06:48
+
+import django.db.models.deletion
+import django.utils.timezone
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('currency', '0002_currency_decimal_places_exchangerate'),
+        ('expenses', '0003_expense_feed_indexes'),
+        ('groups', '0006_group_ledger_version'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Settlement',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('amount', models.PositiveBigIntegerField()),
+                ('date', models.DateField(default=django.utils.timezone.localdate)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('created_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='created_settlements', to=settings.AUTH_USER_MODEL)),
+                ('currency', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='settlements', to='currency.currency')),
+                ('group', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='settlements', to='groups.group')),
+                ('payee', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='settlements_received', to='groups.groupmember')),
+                ('payer', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='settlements_paid', to='groups.groupmember')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['group', '-date', '-id'], name='settlement_feed_idx')],
+                'constraints': [models.CheckConstraint(condition=models.Q(('payer', models.F('payee')), _negated=True), name='settlement_payer_is_not_payee'), models.CheckConstraint(condition=models.Q(('amount__gt', 0)), name='settlement_amount_positive')],
+            },
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.1.3 on 2026-10-19 06:53
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('categories', '0002_category_path'),
+        ('currency', '0002_currency_decimal_places_exchangerate'),
+        ('expenses', '0005_recurring_expense'),
+        ('groups', '0006_group_ledger_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MonthlySpending',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('month', models.DateField()),
+                ('amount', models.BigIntegerField(default=0)),
+                ('expense_count', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('category', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='monthly_spending', to='categories.category')),
+                ('currency', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='monthly_spending', to='currency.currency')),
+                ('group', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='monthly_spending', to='groups.group')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['group', 'month'], name='monthly_spending_group_idx')],
+                'constraints': [models.UniqueConstraint(condition=models.Q(('category__isnull', False)), fields=('group', 'category', 'month', 'currency'), name='unique_monthly_spending_per_category'), models.UniqueConstraint(condition=models.Q(('category__isnull', True)), fields=('group', 'month', 'currency'), name='unique_monthly_spending_uncategorised')],
+            },
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 5.1.3 on 2026-10-19 07:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('expenses', '0006_monthly_spending'),
+        ('groups', '0007_version'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='expense',
+            name='paid_by',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.RESTRICT, related_name='paid_expenses', to='groups.groupmember'),
+        ),
+        migrations.AlterField(
+            model_name='expenseshare',
+            name='member',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.RESTRICT, related_name='expense_shares', to='groups.groupmember'),
+        ),
+        migrations.AlterField(
+            model_name='recurringexpense',
+            name='paid_by',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.RESTRICT, related_name='recurring_expenses_paid', to='groups.groupmember'),
+        ),
+        migrations.AlterField(
+            model_name='settlement',
+            name='payee',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.RESTRICT, related_name='settlements_received', to='groups.groupmember'),
+        ),
+        migrations.AlterField(
+            model_name='settlement',
+            name='payer',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.RESTRICT, related_name='settlements_paid', to='groups.groupmember'),
+        ),
+    ]
@@ -0,0 +1,527 @@
+"""Expense models."""
+
+import uuid
+from typing import ClassVar
+
+from django.contrib.auth import get_user_model
+from django.db import models
+from django.utils import timezone
+
+from categories.models import Category
+from currency.models import Currency
+from groups.models import Group, GroupMember
+
+
+class SplitType(models.TextChoices):
+    """Expense split type choices."""
+
+    EQUAL = "equal", "Equal"
+    EXACT = "exact", "Exact amounts"
+    PERCENTAGE = "percentage", "Percentages"
+    SHARES = "shares", "Shares"
+
+
+class Frequency(models.TextChoices):
+    """Recurring expense frequency choices."""
+
+    DAILY = "daily", "Daily"
+    WEEKLY = "weekly", "Weekly"
+    MONTHLY = "monthly", "Monthly"
+    YEARLY = "yearly", "Yearly"
+
+
+class Expense(models.Model):
+    """
+    Model representing an expense paid by one group member and shared by others.
+
+    Attributes:
+        - id: UUID field representing the expense's unique identifier
+        - group: ForeignKey to the group the expense belongs to
+        - title: CharField representing the expense's title
+        - description: TextField representing the expense's description
+        - amount: PositiveBigIntegerField representing the total in minor units
+          of the currency (e.g. cents)
+        - currency: ForeignKey to the expense's currency
+        - category: ForeignKey to the expense's category
+        - paid_by: ForeignKey to the group member who paid
+        - split_type: CharField representing how the amount is split between shares
+        - date: DateField representing when the expense happened
+        - recurring_expense: ForeignKey to the recurring expense that generated it
+        - created_by: ForeignKey to the user who created the expense
+        - created_at: DateTimeField representing when the expense was created
+        - updated_at: DateTimeField representing when the expense was last updated
+
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+
+    group = models.ForeignKey(Group, on_delete=models.CASCADE, related_name="expenses")
+
+    title = models.CharField(max_length=255)
+
+    description = models.TextField(null=True, blank=True)
+
+    amount = models.PositiveBigIntegerField()
+
+    currency = models.ForeignKey(
+        Currency, on_delete=models.PROTECT, related_name="expenses"
+    )
+
+    category = models.ForeignKey(
+        Category,
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name="expenses",
+    )
+
+    paid_by = models.ForeignKey(
+        GroupMember, on_delete=models.RESTRICT, related_name="paid_expenses"
+    )
+
+    split_type = models.CharField(
+        max_length=20, choices=SplitType.choices, default=SplitType.EQUAL
+    )
+
+    date = models.DateField(default=timezone.localdate)
+
+    recurring_expense = models.ForeignKey(
+        "RecurringExpense",
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name="occurrences",
+    )
+
+    created_by = models.ForeignKey(
+        get_user_model(),
+        null=True,
+        on_delete=models.SET_NULL,
+        related_name="created_expenses",
+    )
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        """
+        Meta class for the Expense model.
+
+        Each feed filter has an index led by the group and ending in the feed's
+        ``(date, id)`` ordering, so any page is one index range scan.
+        """
+
+        indexes: ClassVar[list] = [
+            models.Index(fields=["group", "-date", "-id"], name="expense_feed_idx"),
+            models.Index(
+                fields=["group", "category", "-date", "-id"],
+                name="expense_feed_category_idx",
+            ),
+            models.Index(
+                fields=["group", "paid_by", "-date", "-id"],
+                name="expense_feed_paid_by_idx",
+            ),
+            models.Index(fields=["-date", "-id"], name="expense_date_idx"),
+        ]
+
+        constraints: ClassVar[list] = [
+            models.UniqueConstraint(
+                fields=["recurring_expense", "date"],
+                name="unique_recurring_expense_occurrence",
+            )
+        ]
+
+    def __str__(self) -> str:
+        """Return the string representation of the expense."""
+        return self.title
+
+
+class ExpenseShare(models.Model):
+    """
+    Model representing a group member's share of an expense.
+
+    Attributes:
+        - id: UUID field representing the share's unique identifier
+        - expense: ForeignKey to the expense the share belongs to
+        - member: ForeignKey to the group member who owes the share
+        - value: DecimalField representing the split input for the member: the exact
+          amount, percentage or number of shares, depending on the split type
+        - amount: BigIntegerField representing the member's share in minor units
+        - created_at: DateTimeField representing when the share was created
+
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+
+    expense = models.ForeignKey(
+        Expense, on_delete=models.CASCADE, related_name="shares"
+    )
+
+    member = models.ForeignKey(
+        GroupMember, on_delete=models.RESTRICT, related_name="expense_shares"
+    )
+
+    value = models.DecimalField(max_digits=20, decimal_places=4, null=True, blank=True)
+
+    amount = models.BigIntegerField()
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        """Meta class for the ExpenseShare model."""
+
+        constraints: ClassVar[list] = [
+            models.UniqueConstraint(
+                fields=["expense", "member"], name="unique_expense_share_member"
+            )
+        ]
+
+        indexes: ClassVar[list] = [
+            models.Index(fields=["member", "expense"], name="expense_share_member_idx")
+        ]
+
+    def __str__(self) -> str:
+        """Return the string representation of the expense share."""
+        return f"{self.member_id} - {self.amount}"
+
+
+class RecurringExpense(models.Model):
+    """
+    Model representing a template for an expense that repeats on a schedule.
+
+    Attributes:
+        - id: UUID field representing the recurring expense's unique identifier
+        - group: ForeignKey to the group the expenses belong to
+        - title: CharField representing the expenses' title
+        - description: TextField representing the expenses' description
+        - amount: PositiveBigIntegerField representing each expense's total in
+          minor units
+        - currency: ForeignKey to the expenses' currency
+        - category: ForeignKey to the expenses' category
+        - paid_by: ForeignKey to the group member who pays
+        - split_type: CharField representing how the amount is split between shares
+        - frequency: CharField representing how often the expense repeats
+        - interval: PositiveSmallIntegerField representing the number of periods
+          between occurrences
+        - start_date: DateField representing the first occurrence
+        - end_date: DateField representing the last possible occurrence
+        - next_run: DateField representing the next occurrence to generate
+        - is_active: BooleanField representing whether occurrences are generated
+        - created_by: ForeignKey to the user who created the recurring expense
+        - created_at: DateTimeField representing when it was created
+        - updated_at: DateTimeField representing when it was last updated
+
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+
+    group = models.ForeignKey(
+        Group, on_delete=models.CASCADE, related_name="recurring_expenses"
+    )
+
+    title = models.CharField(max_length=255)
+
+    description = models.TextField(null=True, blank=True)
+
+    amount = models.PositiveBigIntegerField()
+
+    currency = models.ForeignKey(
+        Currency, on_delete=models.PROTECT, related_name="recurring_expenses"
+    )
+
+    category = models.ForeignKey(
+        Category,
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name="recurring_expenses",
+    )
+
+    paid_by = models.ForeignKey(
+        GroupMember, on_delete=models.RESTRICT, related_name="recurring_expenses_paid"
+    )
+
+    split_type = models.CharField(
+        max_length=20, choices=SplitType.choices, default=SplitType.EQUAL
+    )
+
+    frequency = models.CharField(
+        max_length=20, choices=Frequency.choices, default=Frequency.MONTHLY
+    )
+
+    interval = models.PositiveSmallIntegerField(default=1)
+
+    start_date = models.DateField(default=timezone.localdate)
+
+    end_date = models.DateField(null=True, blank=True)
+
+    next_run = models.DateField(editable=False)
+
+    is_active = models.BooleanField(default=True)
+
+    created_by = models.ForeignKey(
+        get_user_model(),
+        null=True,
+        on_delete=models.SET_NULL,
+        related_name="created_recurring_expenses",
+    )
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        """Meta class for the RecurringExpense model."""
+
+        indexes: ClassVar[list] = [
+            models.Index(
+                fields=["next_run"],
+                condition=models.Q(is_active=True),
+                name="recurring_expense_due_idx",
+            )
+        ]
+
+    def __str__(self) -> str:
+        """Return the string representation of the recurring expense."""
+        return self.title
+
+
+class RecurringExpenseParticipant(models.Model):
+    """
+    Model representing a group member taking part in a recurring expense.
+
+    Attributes:
+        - id: UUID field representing the participant's unique identifier
+        - recurring_expense: ForeignKey to the recurring expense
+        - member: ForeignKey to the group member taking part
+        - value: DecimalField representing the member's split input
+
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+
+    recurring_expense = models.ForeignKey(
+        RecurringExpense, on_delete=models.CASCADE, related_name="participants"
+    )
+
+    member = models.ForeignKey(
+        GroupMember,
+        on_delete=models.CASCADE,
+        related_name="recurring_expense_participants",
+    )
+
+    value = models.DecimalField(max_digits=20, decimal_places=4, null=True, blank=True)
+
+    class Meta:
+        """Meta class for the RecurringExpenseParticipant model."""
+
+        constraints: ClassVar[list] = [
+            models.UniqueConstraint(
+                fields=["recurring_expense", "member"],
+                name="unique_recurring_expense_participant",
+            )
+        ]
+
+    def __str__(self) -> str:
+        """Return the string representation of the participant."""
+        return f"{self.member_id} - {self.value}"
+
+
+class Settlement(models.Model):
+    """
+    Model representing a payment from one group member to another.
+
+    Attributes:
+        - id: UUID field representing the settlement's unique identifier
+        - group: ForeignKey to the group the settlement belongs to
+        - payer: ForeignKey to the group member who paid
+        - payee: ForeignKey to the group member who was paid
+        - currency: ForeignKey to the settlement's currency
+        - amount: PositiveBigIntegerField representing the payment in minor units
+        - date: DateField representing when the payment was made
+        - created_by: ForeignKey to the user who recorded the settlement
+        - created_at: DateTimeField representing when the settlement was created
+        - updated_at: DateTimeField representing when the settlement was last updated
+
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+
+    group = models.ForeignKey(
+        Group, on_delete=models.CASCADE, related_name="settlements"
+    )
+
+    payer = models.ForeignKey(
+        GroupMember, on_delete=models.RESTRICT, related_name="settlements_paid"
+    )
+
+    payee = models.ForeignKey(
+        GroupMember, on_delete=models.RESTRICT, related_name="settlements_received"
+    )
+
+    currency = models.ForeignKey(
+        Currency, on_delete=models.PROTECT, related_name="settlements"
+    )
+
+    amount = models.PositiveBigIntegerField()
+
+    date = models.DateField(default=timezone.localdate)
+
+    created_by = models.ForeignKey(
+        get_user_model(),
+        null=True,
+        on_delete=models.SET_NULL,
+        related_name="created_settlements",
+    )
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        """Meta class for the Settlement model."""
+
+        constraints: ClassVar[list] = [
+            models.CheckConstraint(
+                condition=~models.Q(payer=models.F("payee")),
+                name="settlement_payer_is_not_payee",
+            ),
+            models.CheckConstraint(
+                condition=models.Q(amount__gt=0), name="settlement_amount_positive"
+            ),
+        ]
+
+        indexes: ClassVar[list] = [
+            models.Index(fields=["group", "-date", "-id"], name="settlement_feed_idx")
+        ]
+
+    def __str__(self) -> str:
+        """Return the string representation of the settlement."""
+        return f"{self.payer_id} -> {self.payee_id} - {self.amount}"
+
+
+class Balance(models.Model):
+    """
+    Model representing a group member's running balance in one currency.
+
+    Balances are maintained incrementally by the expense services in the same
+    transaction as the writes that change them, so reading them never has to
+    sum expenses, shares and settlements.
+
+    Attributes:
+        - id: UUID field representing the balance's unique identifier
+        - group: ForeignKey to the group the balance belongs to
+        - member: ForeignKey to the group member the balance belongs to
+        - currency: ForeignKey to the balance's currency
+        - amount: BigIntegerField representing the net balance in minor units;
+          positive when the member is owed money, negative when they owe it
+        - updated_at: DateTimeField representing when the balance last changed
+
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+
+    group = models.ForeignKey(Group, on_delete=models.CASCADE, related_name="balances")
+
+    member = models.ForeignKey(
+        GroupMember, on_delete=models.CASCADE, related_name="balances"
+    )
+
+    currency = models.ForeignKey(
+        Currency, on_delete=models.PROTECT, related_name="balances"
+    )
+
+    amount = models.BigIntegerField(default=0)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        """Meta class for the Balance model."""
+
+        constraints: ClassVar[list] = [
+            models.UniqueConstraint(
+                fields=["group", "member", "currency"],
+                name="unique_balance_per_member_currency",
+            )
+        ]
+
+    def __str__(self) -> str:
+        """Return the string representation of the balance."""
+        return f"{self.member_id} - {self.amount}"
+
+
+class MonthlySpending(models.Model):
+    """
+    Model representing a group's spending in one category, month and currency.
+
+    Totals are maintained incrementally by the expense services in the same
+    transaction as the writes that change them, so spending charts read a few
+    rollup rows instead of scanning every expense. Expenses without a category
+    are counted in rows without one.
+
+    Attributes:
+        - id: UUID field representing the rollup row's unique identifier
+        - group: ForeignKey to the group the spending belongs to
+        - category: ForeignKey to the expenses' category, if any
+        - month: DateField representing the first day of the month
+        - currency: ForeignKey to the expenses' currency
+        - amount: BigIntegerField representing the total spent in minor units
+        - expense_count: IntegerField representing the number of expenses
+        - updated_at: DateTimeField representing when the totals last changed
+
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+
+    group = models.ForeignKey(
+        Group, on_delete=models.CASCADE, related_name="monthly_spending"
+    )
+
+    category = models.ForeignKey(
+        Category,
+        null=True,
+        blank=True,
+        on_delete=models.CASCADE,
+        related_name="monthly_spending",
+    )
+
+    month = models.DateField()
+
+    currency = models.ForeignKey(
+        Currency, on_delete=models.PROTECT, related_name="monthly_spending"
+    )
+
+    amount = models.BigIntegerField(default=0)
+
+    expense_count = models.IntegerField(default=0)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        """
+        Meta class for the MonthlySpending model.
+
+        Rows with and without a category have separate partial unique indexes,
+        because a unique index treats every NULL category as distinct.
+        """
+
+        constraints: ClassVar[list] = [
+            models.UniqueConstraint(
+                fields=["group", "category", "month", "currency"],
+                condition=models.Q(category__isnull=False),
+                name="unique_monthly_spending_per_category",
+            ),
+            models.UniqueConstraint(
+                fields=["group", "month", "currency"],
+                condition=models.Q(category__isnull=True),
+                name="unique_monthly_spending_uncategorised",
+            ),
+        ]
+        indexes: ClassVar[list] = [
+            models.Index(fields=["group", "month"], name="monthly_spending_group_idx")
+        ]
+
+    def __str__(self) -> str:
+        """Return the string representation of the rollup row."""
+        return f"{self.category_id} - {self.month:%Y-%m} - {self.amount}"
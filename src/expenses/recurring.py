@@ -0,0 +1,294 @@
+"""Scheduling and generation of recurring expenses."""
+
+from __future__ import annotations
+
+import calendar
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import TYPE_CHECKING, Any
+
+from django.db import transaction
+from django.utils import timezone
+
+from expenses.ledger import apply_balance_deltas, expense_deltas, merge_deltas
+from expenses.models import (
+    Expense,
+    ExpenseShare,
+    Frequency,
+    RecurringExpense,
+    RecurringExpenseParticipant,
+)
+from expenses.services import (
+    Participant,
+    Share,
+    build_share_rows,
+    compute_shares,
+)
+from expenses.spending import apply_spending_changes, expense_spending, merge_spending
+from expenses.splits import SplitError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
+# Fields that move a recurring expense's next run when they change
+SCHEDULE_FIELDS = {"frequency", "interval", "start_date", "end_date", "is_active"}
+
+# Upper bound on the occurrences generated for one template in a single run, so a
+# template that has been paused for years cannot produce an unbounded batch
+MAX_OCCURRENCES_PER_RUN = 366
+
+
+def add_months(start: date, months: int) -> date:
+    """Return the date ``months`` after ``start``, clamped to the month's last day."""
+    month_index = start.month - 1 + months
+    year, month = start.year + month_index // 12, month_index % 12 + 1
+
+    return date(year, month, min(start.day, calendar.monthrange(year, month)[1]))
+
+
+def get_occurrence(template: RecurringExpense, index: int) -> date:
+    """
+    Return the date of a recurring expense's ``index``-th occurrence.
+
+    Occurrences are always counted from the start date, so a monthly expense
+    starting on the 31st falls on the last day of shorter months without
+    drifting to the 28th afterwards.
+    """
+    step = index * template.interval
+
+    if template.frequency == Frequency.DAILY:
+        return template.start_date + timedelta(days=step)
+
+    if template.frequency == Frequency.WEEKLY:
+        return template.start_date + timedelta(weeks=step)
+
+    if template.frequency == Frequency.MONTHLY:
+        return add_months(template.start_date, step)
+
+    return add_months(template.start_date, 12 * step)
+
+
+def iter_occurrences(template: RecurringExpense, since: date) -> Iterator[date]:
+    """Yield a recurring expense's occurrences on or after a date, in order."""
+    index = 0
+
+    # Skip close to ``since`` without generating every earlier occurrence
+    if template.frequency in (Frequency.MONTHLY, Frequency.YEARLY):
+        months = (since.year - template.start_date.year) * 12 + (
+            since.month - template.start_date.month
+        )
+        period = template.interval * (
+            12 if template.frequency == Frequency.YEARLY else 1
+        )
+        index = max(0, months // period - 1)
+    else:
+        days = template.interval * (7 if template.frequency == Frequency.WEEKLY else 1)
+        index = max(0, (since - template.start_date).days // days)
+
+    while True:
+        occurrence = get_occurrence(template, index)
+
+        if template.end_date is not None and occurrence > template.end_date:
+            return
+
+        if occurrence >= since:
+            yield occurrence
+
+        index += 1
+
+
+def get_next_run(template: RecurringExpense, after: date) -> date | None:
+    """Return the first occurrence after a date, or None when the schedule ended."""
+    return next(iter_occurrences(template, after + timedelta(days=1)), None)
+
+
+def schedule(template: RecurringExpense) -> None:
+    """Set a recurring expense's next run to its first occurrence from today."""
+    since = max(template.start_date, timezone.localdate())
+    next_run = next(iter_occurrences(template, since), None)
+
+    template.next_run = next_run or template.start_date
+    template.is_active = template.is_active and next_run is not None
+
+
+@transaction.atomic
+def create_recurring_expense(
+    *,
+    shares: Sequence[Share],
+    **fields: Any,  # noqa: ANN401
+) -> RecurringExpense:
+    """Create a recurring expense with its participants, scheduling its first run."""
+    template = RecurringExpense(**fields)
+    schedule(template)
+    template.save()
+
+    RecurringExpenseParticipant.objects.bulk_create(
+        RecurringExpenseParticipant(
+            recurring_expense=template, member=share.member, value=share.value
+        )
+        for share in shares
+    )
+
+    return template
+
+
+@transaction.atomic
+def update_recurring_expense(
+    template: RecurringExpense,
+    *,
+    shares: Sequence[Share] | None = None,
+    **fields: Any,  # noqa: ANN401
+) -> RecurringExpense:
+    """
+    Update a recurring expense, rescheduling it when its schedule changed.
+
+    Occurrences that were already generated are never generated again, so
+    moving the schedule cannot duplicate them.
+    """
+    for field_name, value in fields.items():
+        setattr(template, field_name, value)
+
+    if SCHEDULE_FIELDS & fields.keys():
+        schedule(template)
+
+    template.save()
+
+    if shares is not None:
+        template.participants.all().delete()
+        RecurringExpenseParticipant.objects.bulk_create(
+            RecurringExpenseParticipant(
+                recurring_expense=template, member=share.member, value=share.value
+            )
+            for share in shares
+        )
+
+    return template
+
+
+@dataclass
+class RunResult:
+    """The outcome of a scheduler run."""
+
+    templates: int = 0
+    generated: int = 0
+
+
+def run_due_recurring_expenses(today: date, batch_size: int = 500) -> RunResult:
+    """
+    Generate every occurrence that is due by ``today``.
+
+    Due templates are found with one query on the partial ``next_run`` index and
+    claimed in batches with ``SELECT ... FOR UPDATE SKIP LOCKED``, so concurrent
+    schedulers split the work instead of generating the same occurrences. Each
+    batch is one transaction: occurrences that already exist are skipped, the
+    new expenses and shares are written with two bulk inserts, the balances and
+    spending of every affected group are updated with one write each and the
+    templates' next runs are saved with one bulk update.
+    """
+    result = RunResult()
+
+    while True:
+        with transaction.atomic():
+            templates = list(
+                RecurringExpense.objects.select_for_update(skip_locked=True)
+                .filter(is_active=True, next_run__lte=today)
+                .order_by("next_run")[:batch_size]
+            )
+
+            if not templates:
+                return result
+
+            result.templates += len(templates)
+            result.generated += generate_occurrences(templates, today)
+
+        if len(templates) < batch_size:
+            return result
+
+
+def generate_occurrences(templates: list[RecurringExpense], today: date) -> int:
+    """Create the due occurrences of claimed templates and advance their next runs."""
+    participants: dict[object, list[Participant]] = {}
+
+    for participant in RecurringExpenseParticipant.objects.filter(
+        recurring_expense__in=templates
+    ).select_related("member"):
+        participants.setdefault(participant.recurring_expense_id, []).append(
+            Participant(member=participant.member, value=participant.value)
+        )
+
+    due = {
+        template.pk: list(
+            take_due(iter_occurrences(template, template.next_run), today)
+        )
+        for template in templates
+    }
+
+    existing = set(
+        Expense.objects.filter(
+            recurring_expense__in=templates,
+            date__in={day for days in due.values() for day in days},
+        ).values_list("recurring_expense_id", "date")
+    )
+
+    expenses = []
+    shares = []
+    deltas = []
+
+    for template in templates:
+        try:
+            template_shares = compute_shares(
+                template.split_type, template.amount, participants.get(template.pk, [])
+            )
+        except SplitError:
+            # The template can no longer be split, e.g. its participants left
+            template.is_active = False
+            continue
+
+        for day in due[template.pk]:
+            if (template.pk, day) in existing:
+                continue
+
+            expense = Expense(
+                group_id=template.group_id,
+                title=template.title,
+                description=template.description,
+                amount=template.amount,
+                currency_id=template.currency_id,
+                category_id=template.category_id,
+                paid_by_id=template.paid_by_id,
+                split_type=template.split_type,
+                date=day,
+                recurring_expense=template,
+                created_by_id=template.created_by_id,
+            )
+            expenses.append(expense)
+            shares.extend(build_share_rows(expense, template_shares))
+            deltas.append(
+                expense_deltas(
+                    expense,
+                    [(share.member.pk, share.amount) for share in template_shares],
+                )
+            )
+
+        last = due[template.pk][-1] if due[template.pk] else template.next_run
+        template.next_run = get_next_run(template, last) or last
+        template.is_active = template.next_run > last
+
+    Expense.objects.bulk_create(expenses)
+    ExpenseShare.objects.bulk_create(shares)
+    apply_balance_deltas(merge_deltas(*deltas))
+    apply_spending_changes(
+        merge_spending(*(expense_spending(expense) for expense in expenses))
+    )
+    RecurringExpense.objects.bulk_update(templates, ["next_run", "is_active"])
+
+    return len(expenses)
+
+
+def take_due(occurrences: Iterator[date], today: date) -> Iterator[date]:
+    """Yield the occurrences up to today, at most MAX_OCCURRENCES_PER_RUN of them."""
+    for count, occurrence in enumerate(occurrences):
+        if occurrence > today or count >= MAX_OCCURRENCES_PER_RUN:
+            return
+
+        yield occurrence
@@ -0,0 +1,22 @@
+"""Expenses router."""
+
+from rest_framework import routers
+
+from .views import (
+    BalanceViewSet,
+    ExpenseViewSet,
+    RecurringExpenseViewSet,
+    SettlementViewSet,
+)
+
+expenses_router = routers.DefaultRouter()
+expenses_router.register(prefix="expenses", viewset=ExpenseViewSet, basename="expense")
+expenses_router.register(
+    prefix="recurring-expenses",
+    viewset=RecurringExpenseViewSet,
+    basename="recurring-expense",
+)
+expenses_router.register(
+    prefix="settlements", viewset=SettlementViewSet, basename="settlement"
+)
+expenses_router.register(prefix="balances", viewset=BalanceViewSet, basename="balance")
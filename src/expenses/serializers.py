@@ -0,0 +1,435 @@
+"""Expense serializers."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from django.utils import timezone
+from rest_framework import serializers
+
+from categories.models import Category
+from expenses.importers import ImportFileError, parse_member_mappings
+from expenses.models import (
+    Balance,
+    Expense,
+    ExpenseShare,
+    RecurringExpense,
+    Settlement,
+    SplitType,
+)
+from expenses.recurring import create_recurring_expense, update_recurring_expense
+from expenses.services import (
+    Participant,
+    compute_shares,
+    create_expense,
+    create_settlement,
+    update_expense,
+    update_settlement,
+)
+from expenses.splits import SplitError
+from groups.models import Group, GroupMember
+
+
+class ExpenseShareSerializer(serializers.ModelSerializer):
+    """Expense share serializer."""
+
+    class Meta:
+        """Meta class."""
+
+        model = ExpenseShare
+
+        fields = ("id", "member", "value", "amount")
+
+
+class ParticipantSerializer(serializers.Serializer):
+    """A group member taking part in an expense, with their split input."""
+
+    member = serializers.UUIDField()
+    value = serializers.DecimalField(
+        max_digits=20, decimal_places=4, required=False, allow_null=True, default=None
+    )
+
+
+class ExpenseSerializer(serializers.ModelSerializer):
+    """
+    Expense serializer.
+
+    ``participants`` lists the members sharing the expense with their split input
+    (the exact amount, percentage or number of shares); it may be omitted for an
+    equal split between every group member. The computed ``shares`` are returned.
+    """
+
+    NOT_A_MEMBER_ERROR = "You are not a member of this group."
+    MEMBER_NOT_IN_GROUP_ERROR = "Member {} does not belong to this group."
+    DUPLICATE_MEMBER_ERROR = "Each member can only take part in an expense once."
+    GROUP_CHANGED_ERROR = "An expense cannot be moved to another group."
+
+    shares = ExpenseShareSerializer(many=True, read_only=True)
+
+    participants = ParticipantSerializer(many=True, write_only=True, required=False)
+
+    class Meta:
+        """Meta class."""
+
+        model = Expense
+
+        fields = (
+            "id",
+            "group",
+            "title",
+            "description",
+            "amount",
+            "currency",
+            "category",
+            "paid_by",
+            "split_type",
+            "date",
+            "shares",
+            "participants",
+            "created_by",
+            "created_at",
+            "updated_at",
+        )
+
+        read_only_fields = ("created_by", "created_at", "updated_at")
+
+        extra_kwargs = {  # noqa: RUF012
+            "currency": {"required": False},
+            "amount": {"min_value": 1},
+        }
+
+    def validate(self, attrs: dict[str, Any]) -> dict[str, Any]:
+        """Validate the members taking part and compute every share."""
+        group = attrs.get("group", getattr(self.instance, "group", None))
+
+        if self.instance is not None and group != self.instance.group:
+            raise serializers.ValidationError({"group": self.GROUP_CHANGED_ERROR})
+
+        members = {
+            member.pk: member for member in GroupMember.objects.filter(group=group)
+        }
+        request = self.context.get("request")
+
+        if request and not any(
+            member.user_id == request.user.pk for member in members.values()
+        ):
+            raise serializers.ValidationError({"group": self.NOT_A_MEMBER_ERROR})
+
+        paid_by = attrs.get("paid_by")
+
+        if paid_by is not None and paid_by.pk not in members:
+            raise serializers.ValidationError(
+                {"paid_by": self.MEMBER_NOT_IN_GROUP_ERROR.format(paid_by.pk)}
+            )
+
+        attrs.setdefault("currency", getattr(self.instance, "currency", group.currency))
+
+        participants = self.get_participants(attrs, members)
+
+        if participants is not None or self.instance is None:
+            try:
+                attrs["shares"] = compute_shares(
+                    attrs.get(
+                        "split_type",
+                        getattr(self.instance, "split_type", SplitType.EQUAL),
+                    ),
+                    attrs.get("amount", getattr(self.instance, "amount", 0)),
+                    participants or [],
+                )
+            except SplitError as error:
+                raise serializers.ValidationError(
+                    {"participants": str(error)}
+                ) from error
+
+        return attrs
+
+    def get_participants(
+        self, attrs: dict[str, Any], members: dict[Any, GroupMember]
+    ) -> list[Participant] | None:
+        """
+        Return the participants for the expense, or None to keep the current shares.
+
+        New expenses without participants are split equally between every member,
+        and updates that change how the amount is split re-use the current share
+        inputs unless new participants are given.
+        """
+        participants = attrs.pop("participants", None)
+
+        if participants is None:
+            if self.instance is None:
+                return [Participant(member=member) for member in members.values()]
+
+            if not {"amount", "split_type"} & attrs.keys():
+                return None
+
+            return self.get_current_participants()
+
+        member_ids = [participant["member"] for participant in participants]
+
+        if len(set(member_ids)) != len(member_ids):
+            raise serializers.ValidationError(
+                {"participants": self.DUPLICATE_MEMBER_ERROR}
+            )
+
+        for member_id in member_ids:
+            if member_id not in members:
+                raise serializers.ValidationError(
+                    {"participants": self.MEMBER_NOT_IN_GROUP_ERROR.format(member_id)}
+                )
+
+        return [
+            Participant(
+                member=members[participant["member"]], value=participant["value"]
+            )
+            for participant in participants
+        ]
+
+    def get_current_participants(self) -> list[Participant]:
+        """Return the participants of the instance being updated."""
+        return [
+            Participant(member=share.member, value=share.value)
+            for share in self.instance.shares.select_related("member")
+        ]
+
+    def create(self, validated_data: dict[str, Any]) -> Expense:
+        """Create the expense with its shares."""
+        return create_expense(**validated_data)
+
+    def update(self, instance: Expense, validated_data: dict[str, Any]) -> Expense:
+        """Update the expense, replacing its shares if they changed."""
+        return update_expense(instance, **validated_data)
+
+
+class RecurringExpenseSerializer(ExpenseSerializer):
+    """
+    Recurring expense serializer.
+
+    Participants are validated and split exactly like an expense's, so a
+    template that is accepted always produces valid occurrences.
+    """
+
+    shares = None
+
+    class Meta:
+        """Meta class."""
+
+        model = RecurringExpense
+
+        fields = (
+            "id",
+            "group",
+            "title",
+            "description",
+            "amount",
+            "currency",
+            "category",
+            "paid_by",
+            "split_type",
+            "participants",
+            "frequency",
+            "interval",
+            "start_date",
+            "end_date",
+            "next_run",
+            "is_active",
+            "created_by",
+            "created_at",
+            "updated_at",
+        )
+
+        read_only_fields = ("next_run", "created_by", "created_at", "updated_at")
+
+        extra_kwargs = {  # noqa: RUF012
+            "currency": {"required": False},
+            "amount": {"min_value": 1},
+            "interval": {"min_value": 1},
+        }
+
+    def get_current_participants(self) -> list[Participant]:
+        """Return the participants of the recurring expense being updated."""
+        return [
+            Participant(member=participant.member, value=participant.value)
+            for participant in self.instance.participants.select_related("member")
+        ]
+
+    def to_representation(self, instance: RecurringExpense) -> dict[str, Any]:
+        """Add the participants to the representation."""
+        data = super().to_representation(instance)
+        data["participants"] = ParticipantSerializer(
+            [
+                {"member": participant.member_id, "value": participant.value}
+                for participant in instance.participants.all()
+            ],
+            many=True,
+        ).data
+
+        return data
+
+    def create(self, validated_data: dict[str, Any]) -> RecurringExpense:
+        """Create the recurring expense with its participants."""
+        return create_recurring_expense(**validated_data)
+
+    def update(
+        self, instance: RecurringExpense, validated_data: dict[str, Any]
+    ) -> RecurringExpense:
+        """Update the recurring expense, rescheduling it if needed."""
+        return update_recurring_expense(instance, **validated_data)
+
+
+class SettlementSerializer(serializers.ModelSerializer):
+    """Settlement serializer."""
+
+    SAME_MEMBER_ERROR = "A member cannot pay themselves."
+
+    class Meta:
+        """Meta class."""
+
+        model = Settlement
+
+        fields = (
+            "id",
+            "group",
+            "payer",
+            "payee",
+            "currency",
+            "amount",
+            "date",
+            "created_by",
+            "created_at",
+            "updated_at",
+        )
+
+        read_only_fields = ("created_by", "created_at", "updated_at")
+
+        extra_kwargs = {  # noqa: RUF012
+            "currency": {"required": False},
+            "amount": {"min_value": 1},
+        }
+
+    def validate(self, attrs: dict[str, Any]) -> dict[str, Any]:
+        """Validate that the user, payer and payee all belong to the group."""
+        group = attrs.get("group", getattr(self.instance, "group", None))
+
+        if self.instance is not None and group != self.instance.group:
+            raise serializers.ValidationError(
+                {"group": ExpenseSerializer.GROUP_CHANGED_ERROR}
+            )
+
+        payer = attrs.get("payer", getattr(self.instance, "payer", None))
+        payee = attrs.get("payee", getattr(self.instance, "payee", None))
+
+        if payer == payee:
+            raise serializers.ValidationError({"payee": self.SAME_MEMBER_ERROR})
+
+        request = self.context.get("request")
+        members = GroupMember.objects.filter(group=group)
+
+        if request and not members.filter(user=request.user).exists():
+            raise serializers.ValidationError(
+                {"group": ExpenseSerializer.NOT_A_MEMBER_ERROR}
+            )
+
+        for field_name, member in (("payer", payer), ("payee", payee)):
+            if member.group_id != group.pk:
+                raise serializers.ValidationError(
+                    {
+                        field_name: ExpenseSerializer.MEMBER_NOT_IN_GROUP_ERROR.format(
+                            member.pk
+                        )
+                    }
+                )
+
+        attrs.setdefault("currency", getattr(self.instance, "currency", group.currency))
+
+        return attrs
+
+    def create(self, validated_data: dict[str, Any]) -> Settlement:
+        """Record the settlement and apply it to the balances."""
+        return create_settlement(**validated_data)
+
+    def update(
+        self, instance: Settlement, validated_data: dict[str, Any]
+    ) -> Settlement:
+        """Update the settlement and move its effect on the balances."""
+        return update_settlement(instance, **validated_data)
+
+
+class SettleUpSerializer(serializers.Serializer):
+    """A request to settle every balance of a group."""
+
+    group = serializers.PrimaryKeyRelatedField(queryset=Group.objects.all())
+    ledger_version = serializers.IntegerField(min_value=0, required=False)
+
+
+class BalanceSerializer(serializers.ModelSerializer):
+    """Balance serializer."""
+
+    class Meta:
+        """Meta class."""
+
+        model = Balance
+
+        fields = ("id", "group", "member", "currency", "amount", "updated_at")
+
+
+class ExpenseImportSerializer(serializers.Serializer):
+    """An upload of expenses exported from another app."""
+
+    group = serializers.PrimaryKeyRelatedField(queryset=Group.objects.all())
+    file = serializers.FileField()
+    members = serializers.ListField(
+        child=serializers.CharField(), required=False, default=list
+    )
+
+    def validate_members(self, value: list[str]) -> dict[str, str]:
+        """Parse the NAME=USERNAME mappings of people in the file to members."""
+        try:
+            return parse_member_mappings(value)
+        except ImportFileError as error:
+            raise serializers.ValidationError(str(error)) from error
+
+
+class ExpenseFeedFilterSerializer(serializers.Serializer):
+    """Query parameters filtering the expense feed."""
+
+    DATE_RANGE_ERROR = "date_from must be on or before date_to."
+
+    category = serializers.PrimaryKeyRelatedField(
+        queryset=Category.objects.all(), required=False
+    )
+    paid_by = serializers.UUIDField(required=False)
+    member = serializers.UUIDField(required=False)
+    date_from = serializers.DateField(required=False)
+    date_to = serializers.DateField(required=False)
+
+    def validate(self, attrs: dict[str, Any]) -> dict[str, Any]:
+        """Validate the date range."""
+        if (
+            "date_from" in attrs
+            and "date_to" in attrs
+            and attrs["date_from"] > attrs["date_to"]
+        ):
+            raise serializers.ValidationError({"date_to": self.DATE_RANGE_ERROR})
+
+        return attrs
+
+
+class SpendingFilterSerializer(serializers.Serializer):
+    """Query parameters of the spending analytics, defaulting to this year."""
+
+    DATE_RANGE_ERROR = ExpenseFeedFilterSerializer.DATE_RANGE_ERROR
+
+    category = serializers.PrimaryKeyRelatedField(
+        queryset=Category.objects.all(), required=False
+    )
+    date_from = serializers.DateField(
+        default=lambda: timezone.localdate().replace(month=1, day=1)
+    )
+    date_to = serializers.DateField(default=timezone.localdate)
+
+    def validate(self, attrs: dict[str, Any]) -> dict[str, Any]:
+        """Validate the date range."""
+        if attrs["date_from"] > attrs["date_to"]:
+            raise serializers.ValidationError({"date_to": self.DATE_RANGE_ERROR})
+
+        return attrs
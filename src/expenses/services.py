@@ -0,0 +1,257 @@
+"""Services for writing expenses and settlements with their ledger changes."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from django.db import transaction
+
+from expenses.ledger import (
+    apply_balance_deltas,
+    expense_deltas,
+    merge_deltas,
+    settlement_deltas,
+)
+from expenses.models import Expense, ExpenseShare, Settlement
+from expenses.settle_up import group_transfers
+from expenses.spending import apply_spending_changes, expense_spending, merge_spending
+from expenses.splits import compute_split
+from groups.models import Group
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from decimal import Decimal
+
+    from django.contrib.auth.base_user import AbstractBaseUser
+
+    from groups.models import GroupMember
+
+
+class LedgerChangedError(Exception):
+    """Raised when a group's balances changed since the caller last read them."""
+
+
+@dataclass(frozen=True)
+class Participant:
+    """A group member taking part in an expense, with their split input."""
+
+    member: GroupMember
+    value: Decimal | None = None
+
+
+@dataclass(frozen=True)
+class Share:
+    """A participant's computed share of an expense, in minor units."""
+
+    member: GroupMember
+    value: Decimal | None
+    amount: int
+
+
+def compute_shares(
+    split_type: str, amount: int, participants: Sequence[Participant]
+) -> list[Share]:
+    """
+    Compute every participant's share of an amount.
+
+    Participants are ordered by member id first, so the remainder distribution
+    does not depend on the order the client sent them in.
+    """
+    participants = sorted(
+        participants, key=lambda participant: str(participant.member.pk)
+    )
+    amounts = compute_split(
+        split_type, amount, [participant.value for participant in participants]
+    )
+
+    return [
+        Share(member=participant.member, value=participant.value, amount=share_amount)
+        for participant, share_amount in zip(participants, amounts, strict=True)
+    ]
+
+
+def build_share_rows(expense: Expense, shares: Sequence[Share]) -> list[ExpenseShare]:
+    """Return unsaved ExpenseShare rows for an expense."""
+    return [
+        ExpenseShare(
+            expense=expense, member=share.member, value=share.value, amount=share.amount
+        )
+        for share in shares
+    ]
+
+
+def lock_group(group_id: object) -> None:
+    """
+    Lock a group's row until the end of the transaction.
+
+    Updates and deletes take this lock before reading the rows whose ledger
+    entries they reverse, so two writers of the same expense or settlement
+    cannot both reverse its old state. It is the lock the ledger takes first
+    anyway, so the lock order stays the same.
+    """
+    Group.objects.select_for_update().filter(pk=group_id).exists()
+
+
+@transaction.atomic
+def create_expense(*, shares: Sequence[Share], **fields: Any) -> Expense:  # noqa: ANN401
+    """Create an expense and its shares, and add it to the balances and spending."""
+    expense = Expense.objects.create(**fields)
+    ExpenseShare.objects.bulk_create(build_share_rows(expense, shares))
+
+    apply_balance_deltas(
+        expense_deltas(expense, [(share.member.pk, share.amount) for share in shares])
+    )
+    apply_spending_changes(expense_spending(expense))
+
+    return expense
+
+
+@transaction.atomic
+def update_expense(
+    expense: Expense,
+    *,
+    shares: Sequence[Share] | None = None,
+    **fields: Any,  # noqa: ANN401
+) -> Expense:
+    """
+    Update an expense, replacing its shares when new ones are given.
+
+    The old expense is taken out of the balances and spending and the new one
+    added back with a single write to each. The old expense is re-read under
+    the group's lock, so it is the one the ledger holds.
+    """
+    lock_group(expense.group_id)
+    expense.refresh_from_db()
+
+    current_shares = list(expense.shares.values_list("member_id", "amount"))
+    old_deltas = expense_deltas(expense, current_shares, sign=-1)
+    old_spending = expense_spending(expense, sign=-1)
+
+    for field_name, value in fields.items():
+        setattr(expense, field_name, value)
+
+    expense.save()
+
+    if shares is not None:
+        expense.shares.all().delete()
+        ExpenseShare.objects.bulk_create(build_share_rows(expense, shares))
+        current_shares = [(share.member.pk, share.amount) for share in shares]
+
+    apply_balance_deltas(
+        merge_deltas(old_deltas, expense_deltas(expense, current_shares))
+    )
+    apply_spending_changes(merge_spending(old_spending, expense_spending(expense)))
+
+    return expense
+
+
+@transaction.atomic
+def delete_expense(expense: Expense) -> None:
+    """
+    Delete an expense and its shares, and take it out of balances and spending.
+
+    An expense already deleted by a concurrent request is left alone, so it is
+    only taken out of the balances once.
+    """
+    lock_group(expense.group_id)
+
+    try:
+        expense.refresh_from_db()
+    except Expense.DoesNotExist:
+        return
+
+    current_shares = list(expense.shares.values_list("member_id", "amount"))
+
+    apply_balance_deltas(expense_deltas(expense, current_shares, sign=-1))
+    apply_spending_changes(expense_spending(expense, sign=-1))
+    expense.delete()
+
+
+@transaction.atomic
+def create_settlement(**fields: Any) -> Settlement:  # noqa: ANN401
+    """Record a payment between two members and apply it to their balances."""
+    settlement = Settlement.objects.create(**fields)
+
+    apply_balance_deltas(settlement_deltas(settlement))
+
+    return settlement
+
+
+@transaction.atomic
+def update_settlement(settlement: Settlement, **fields: Any) -> Settlement:  # noqa: ANN401
+    """
+    Update a settlement, moving its effect on the balances in one ledger write.
+
+    The old settlement is re-read under the group's lock, so it is the one the
+    ledger holds.
+    """
+    lock_group(settlement.group_id)
+    settlement.refresh_from_db()
+
+    old_deltas = settlement_deltas(settlement, sign=-1)
+
+    for field_name, value in fields.items():
+        setattr(settlement, field_name, value)
+
+    settlement.save()
+
+    apply_balance_deltas(merge_deltas(old_deltas, settlement_deltas(settlement)))
+
+    return settlement
+
+
+@transaction.atomic
+def delete_settlement(settlement: Settlement) -> None:
+    """
+    Delete a settlement and take it out of the balances.
+
+    A settlement already deleted by a concurrent request is left alone.
+    """
+    lock_group(settlement.group_id)
+
+    try:
+        settlement.refresh_from_db()
+    except Settlement.DoesNotExist:
+        return
+
+    apply_balance_deltas(settlement_deltas(settlement, sign=-1))
+    settlement.delete()
+
+
+@transaction.atomic
+def settle_up_group(
+    group: Group,
+    created_by: AbstractBaseUser | None = None,
+    ledger_version: int | None = None,
+) -> list[Settlement]:
+    """
+    Record every suggested transfer of a group as settlements in one transaction.
+
+    The group row is locked while the suggestions are computed, so they match
+    the balances being settled. When ``ledger_version`` is given, the call fails
+    if the balances changed since the caller read the suggestions at that version.
+    """
+    locked = Group.objects.select_for_update().get(pk=group.pk)
+
+    if ledger_version is not None and locked.ledger_version != ledger_version:
+        message = "The group's balances changed since the suggestions were read."
+        raise LedgerChangedError(message)
+
+    settlements = Settlement.objects.bulk_create(
+        Settlement(
+            group=locked,
+            payer_id=transfer.payer,
+            payee_id=transfer.payee,
+            currency_id=currency_id,
+            amount=transfer.amount,
+            created_by=created_by,
+        )
+        for currency_id, transfer in group_transfers(locked)
+    )
+
+    apply_balance_deltas(
+        merge_deltas(*(settlement_deltas(settlement) for settlement in settlements))
+    )
+
+    return settlements
@@ -0,0 +1,117 @@
+"""Debt simplification for settle-up suggestions."""
+
+from __future__ import annotations
+
+import heapq
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from core.cache import LRUPayloadCache
+from expenses.models import Balance
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Mapping
+
+    from groups.models import Group
+
+# Suggested transfers per group, kept apart from the shared payload cache so
+# that many groups' suggestions cannot evict the reference data.
+settle_up_cache = LRUPayloadCache(max_entries=1024)
+
+
+@dataclass(frozen=True)
+class Transfer:
+    """A payment from one member to another, in minor units."""
+
+    payer: Hashable
+    payee: Hashable
+    amount: int
+
+
+def simplify_debts(balances: Mapping[Hashable, int]) -> list[Transfer]:
+    """
+    Return a short list of transfers that settles every balance.
+
+    Positive balances are owed money and negative balances owe it. The largest
+    debtor repeatedly pays the largest creditor as much as they can, so every
+    transfer settles at least one of them and there are at most ``n - 1``
+    transfers. Both sides are kept in heaps, making this O(n log n); ties are
+    broken by member id so the result is deterministic.
+    """
+    if sum(balances.values()) != 0:
+        message = "Balances must add up to zero."
+        raise ValueError(message)
+
+    creditors = [
+        (-amount, str(member), member)
+        for member, amount in balances.items()
+        if amount > 0
+    ]
+    debtors = [
+        (amount, str(member), member)
+        for member, amount in balances.items()
+        if amount < 0
+    ]
+
+    heapq.heapify(creditors)
+    heapq.heapify(debtors)
+
+    transfers = []
+
+    while creditors and debtors:
+        credit, creditor_key, creditor = heapq.heappop(creditors)
+        debt, debtor_key, debtor = heapq.heappop(debtors)
+        amount = min(-credit, -debt)
+
+        transfers.append(Transfer(payer=debtor, payee=creditor, amount=amount))
+
+        if credit + amount:
+            heapq.heappush(creditors, (credit + amount, creditor_key, creditor))
+
+        if debt + amount:
+            heapq.heappush(debtors, (debt + amount, debtor_key, debtor))
+
+    return transfers
+
+
+def group_transfers(group: Group) -> list[tuple[Hashable, Transfer]]:
+    """Return a group's suggested transfers, with their currency id."""
+    balances: dict[Hashable, dict[Hashable, int]] = {}
+
+    for member_id, currency_id, amount in (
+        Balance.objects.filter(group=group)
+        .exclude(amount=0)
+        .values_list("member_id", "currency_id", "amount")
+    ):
+        balances.setdefault(currency_id, {})[member_id] = amount
+
+    return [
+        (currency_id, transfer)
+        for currency_id in sorted(balances, key=str)
+        for transfer in simplify_debts(balances[currency_id])
+    ]
+
+
+def build_settle_up(group: Group) -> list[dict[str, Any]]:
+    """Return a group's suggested transfers in every currency it has balances in."""
+    return [
+        {
+            "currency": str(currency_id),
+            "payer": str(transfer.payer),
+            "payee": str(transfer.payee),
+            "amount": transfer.amount,
+        }
+        for currency_id, transfer in group_transfers(group)
+    ]
+
+
+def get_settle_up(group: Group) -> list[dict[str, Any]]:
+    """
+    Return a group's suggested transfers from the settle-up cache.
+
+    Entries are keyed on the group's ledger version, so they are only recomputed
+    after the group's balances change.
+    """
+    return settle_up_cache.get_or_build(
+        group.pk, group.ledger_version, lambda: build_settle_up(group)
+    )
@@ -0,0 +1,225 @@
+"""Monthly spending rollups per category, and the analytics read from them."""
+
+from __future__ import annotations
+
+import uuid
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any
+
+from django.db import transaction
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncMonth
+from django.db.models.signals import pre_delete
+from django.dispatch import receiver
+
+from categories.models import PATH_SEPARATOR, Category
+from expenses.ledger import upsert_increments
+from expenses.models import Expense, MonthlySpending
+from groups.models import Group
+
+if TYPE_CHECKING:
+    from datetime import date
+
+    # (group id, category id or None, first day of the month, currency id)
+    SpendingKey = tuple[uuid.UUID, uuid.UUID | None, date, uuid.UUID]
+
+    # (amount in minor units, number of expenses)
+    SpendingChange = tuple[int, int]
+
+
+def expense_spending(
+    expense: Expense, sign: int = 1
+) -> dict[SpendingKey, SpendingChange]:
+    """
+    Return the spending changes an expense makes.
+
+    ``sign=-1`` returns the changes that undo the expense.
+    """
+    return {
+        (
+            expense.group_id,
+            expense.category_id,
+            expense.date.replace(day=1),
+            expense.currency_id,
+        ): (sign * expense.amount, sign)
+    }
+
+
+def merge_spending(
+    *changes: dict[SpendingKey, SpendingChange],
+) -> dict[SpendingKey, SpendingChange]:
+    """Add several sets of spending changes together."""
+    merged: dict[SpendingKey, list[int]] = defaultdict(lambda: [0, 0])
+
+    for change in changes:
+        for key, (amount, count) in change.items():
+            merged[key][0] += amount
+            merged[key][1] += count
+
+    return {key: (amount, count) for key, (amount, count) in merged.items()}
+
+
+def apply_spending_changes(changes: dict[SpendingKey, SpendingChange]) -> None:
+    """
+    Add spending changes to the rollup with atomic upserts.
+
+    Rows with and without a category are upserted separately, as each has its
+    own partial unique index, and in key order so concurrent writers lock rows
+    in the same order. Must be called inside the transaction making the change.
+    """
+    rows = sorted(
+        ((key, change) for key, change in changes.items() if any(change)),
+        key=lambda row: tuple(str(part) for part in row[0]),
+    )
+
+    categorised = [row for row in rows if row[0][1] is not None]
+    uncategorised = [
+        ((group_id, month, currency_id), change)
+        for (group_id, category_id, month, currency_id), change in rows
+        if category_id is None
+    ]
+
+    if categorised:
+        upsert_increments(
+            MonthlySpending,
+            ["group", "category", "month", "currency"],
+            categorised,
+            ["amount", "expense_count"],
+            where="category_id IS NOT NULL",
+        )
+
+    if uncategorised:
+        upsert_increments(
+            MonthlySpending,
+            ["group", "month", "currency"],
+            uncategorised,
+            ["amount", "expense_count"],
+            where="category_id IS NULL",
+        )
+
+
+def rebuild_group_spending(group_id: uuid.UUID) -> None:
+    """
+    Replace a group's spending rollup with one rebuilt from its expenses.
+
+    Used after bulk writes that bypass the incremental rollup. The group row is
+    locked first, like the ledger's rebuild, so concurrent expense writes in the
+    group wait for the rebuild.
+    """
+    with transaction.atomic():
+        Group.objects.select_for_update().filter(pk=group_id).exists()
+
+        totals = (
+            Expense.objects.filter(group_id=group_id)
+            .values_list("category_id", TruncMonth("date"), "currency_id")
+            .annotate(total=Sum("amount"), count=Count("id"))
+            .order_by()
+        )
+
+        MonthlySpending.objects.filter(group_id=group_id).delete()
+        MonthlySpending.objects.bulk_create(
+            MonthlySpending(
+                group_id=group_id,
+                category_id=category_id,
+                month=month,
+                currency_id=currency_id,
+                amount=total,
+                expense_count=count,
+            )
+            for category_id, month, currency_id, total, count in totals
+        )
+
+
+@receiver(pre_delete, sender=Category)
+def move_spending_to_uncategorised(sender, instance, **kwargs) -> None:  # noqa: ANN001, ANN003, ARG001
+    """
+    Move a deleted category's spending into the uncategorised rows.
+
+    The category's expenses lose their category, while its rollup rows are
+    deleted with it; adding their totals to the uncategorised rows first keeps
+    the rollup matching the expenses.
+    """
+    apply_spending_changes(
+        {
+            (row.group_id, None, row.month, row.currency_id): (
+                row.amount,
+                row.expense_count,
+            )
+            for row in MonthlySpending.objects.filter(category=instance)
+        }
+    )
+
+
+def bucket_for(path: str, depth: int) -> uuid.UUID:
+    """Return the category at ``depth`` on a materialized path."""
+    return uuid.UUID(path.split(PATH_SEPARATOR)[depth])
+
+
+def get_spending(
+    group: Group,
+    date_from: date,
+    date_to: date,
+    category: Category | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Return a group's spending per category and month, read from the rollup.
+
+    Subcategories are rolled up along their materialized paths: into their
+    top-level category, or, when ``category`` is given, into that category's
+    direct subcategories, with its own expenses kept under it. Expenses
+    without a category are reported under ``None`` at the top level.
+    """
+    rows = MonthlySpending.objects.filter(
+        group=group,
+        month__gte=date_from.replace(day=1),
+        month__lte=date_to,
+    ).exclude(expense_count=0)
+    depth = 0
+
+    if category is not None:
+        rows = rows.filter(category__path__startswith=category.path)
+        depth = len(category.path_ids)
+
+    totals: dict[tuple[uuid.UUID | None, str], dict[str, Any]] = {}
+
+    for path, month, currency, amount, count in rows.values_list(
+        "category__path", "month", "currency__code", "amount", "expense_count"
+    ).order_by("month"):
+        if path is None:
+            bucket = None
+        elif category is not None and path == category.path:
+            bucket = category.pk
+        else:
+            bucket = bucket_for(path, depth)
+
+        entry = totals.setdefault(
+            (bucket, currency),
+            {"currency": currency, "total": 0, "expense_count": 0, "months": {}},
+        )
+        entry["total"] += amount
+        entry["expense_count"] += count
+        entry["months"][month] = entry["months"].get(month, 0) + amount
+
+    names = dict(
+        Category.objects.filter(
+            pk__in={bucket for bucket, _ in totals if bucket is not None}
+        ).values_list("pk", "name")
+    )
+
+    return [
+        {
+            "category": str(bucket) if bucket is not None else None,
+            "name": names.get(bucket),
+            "currency": entry["currency"],
+            "total": entry["total"],
+            "expense_count": entry["expense_count"],
+            "months": [
+                {"month": month, "amount": amount}
+                for month, amount in entry["months"].items()
+            ],
+        }
+        for (bucket, _), entry in sorted(
+            totals.items(),
+            key=lambda item: (item[1]["currency"], -item[1]["total"]),
+        )
+    ]
@@ -0,0 +1,116 @@
+"""Split engine for dividing an expense between group members in minor units."""
+
+from __future__ import annotations
+
+import math
+from fractions import Fraction
+from typing import TYPE_CHECKING
+
+from expenses.models import SplitType
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from decimal import Decimal
+
+ONE_HUNDRED_PERCENT = 100
+
+
+class SplitError(ValueError):
+    """Raised when an amount cannot be split as requested."""
+
+
+def allocate(total: int, weights: Sequence[Fraction | Decimal | int]) -> list[int]:
+    """
+    Divide ``total`` minor units in proportion to ``weights``.
+
+    Each participant first gets the floor of their exact quota; the units left
+    over are handed out one at a time to the largest fractional remainders, with
+    ties going to the earlier participant. The result always sums to ``total``.
+    """
+    weights = [Fraction(weight) for weight in weights]
+    weight_sum = sum(weights)
+
+    if not weights or any(weight < 0 for weight in weights) or weight_sum <= 0:
+        message = "Split weights must be non-negative and add up to more than zero."
+        raise SplitError(message)
+
+    quotas = [total * weight / weight_sum for weight in weights]
+    amounts = [math.floor(quota) for quota in quotas]
+    remainder = total - sum(amounts)
+
+    by_remainder = sorted(
+        range(len(quotas)), key=lambda index: (amounts[index] - quotas[index], index)
+    )
+
+    for index in by_remainder[:remainder]:
+        amounts[index] += 1
+
+    return amounts
+
+
+def split_equal(total: int, count: int) -> list[int]:
+    """Split ``total`` equally between ``count`` participants."""
+    return allocate(total, [1] * count)
+
+
+def split_exact(total: int, amounts: Sequence[Decimal | int | None]) -> list[int]:
+    """Validate explicit minor-unit amounts that must add up to ``total``."""
+    if any(amount is None or amount < 0 or amount != int(amount) for amount in amounts):
+        message = "Exact amounts must be whole, non-negative numbers of minor units."
+        raise SplitError(message)
+
+    result = [int(amount) for amount in amounts]
+
+    if sum(result) != total:
+        message = f"Exact amounts add up to {sum(result)}, not {total}."
+        raise SplitError(message)
+
+    return result
+
+
+def split_percentage(
+    total: int, percentages: Sequence[Decimal | int | None]
+) -> list[int]:
+    """Split ``total`` by percentages that must add up to 100."""
+    if any(percentage is None for percentage in percentages):
+        message = "Every participant needs a percentage."
+        raise SplitError(message)
+
+    if sum(percentages) != ONE_HUNDRED_PERCENT:
+        message = f"Percentages add up to {sum(percentages)}, not 100."
+        raise SplitError(message)
+
+    return allocate(total, percentages)
+
+
+def split_shares(total: int, shares: Sequence[Decimal | int | None]) -> list[int]:
+    """Split ``total`` in proportion to each participant's number of shares."""
+    if any(share is None for share in shares):
+        message = "Every participant needs a number of shares."
+        raise SplitError(message)
+
+    return allocate(total, shares)
+
+
+def compute_split(
+    split_type: str, total: int, values: Sequence[Decimal | int | None]
+) -> list[int]:
+    """Split ``total`` minor units between participants using a split strategy."""
+    if not values:
+        message = "An expense needs at least one participant."
+        raise SplitError(message)
+
+    if split_type == SplitType.EQUAL:
+        return split_equal(total, len(values))
+
+    if split_type == SplitType.EXACT:
+        return split_exact(total, values)
+
+    if split_type == SplitType.PERCENTAGE:
+        return split_percentage(total, values)
+
+    if split_type == SplitType.SHARES:
+        return split_shares(total, values)
+
+    message = f"Unknown split type {split_type}."
+    raise SplitError(message)
@@ -0,0 +1,50 @@
+"""Test cases for the expenses admin."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from django.urls import reverse
+
+from expenses.models import Balance
+from expenses.tests.test_helpers import create_test_expense
+
+if TYPE_CHECKING:
+    from django.test import Client
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "model_name",
+    ["expense", "settlement", "balance", "monthlyspending"],
+)
+def test_ledger_admins_cannot_add(admin_client: Client, model_name: str) -> None:
+    """Test that rows behind the ledger cannot be added in the admin."""
+    # Act
+    response = admin_client.get(reverse(f"admin:expenses_{model_name}_add"))
+
+    # Assert
+    assert response.status_code == 403  # noqa: PLR2004
+
+
+@pytest.mark.django_db
+def test_expense_admin_is_view_only(admin_client: Client) -> None:
+    """Test that expenses can be viewed but neither changed nor deleted."""
+    # Arrange
+    expense = create_test_expense(amount=1000)
+    balances = dict(Balance.objects.values_list("member_id", "amount"))
+
+    # Act
+    view = admin_client.get(reverse("admin:expenses_expense_change", args=[expense.pk]))
+    change = admin_client.post(
+        reverse("admin:expenses_expense_change", args=[expense.pk]), {"amount": 1}
+    )
+    delete = admin_client.post(
+        reverse("admin:expenses_expense_delete", args=[expense.pk]), {"post": "yes"}
+    )
+
+    # Assert
+    assert view.status_code == 200  # noqa: PLR2004
+    assert change.status_code == delete.status_code == 403  # noqa: PLR2004
+    assert dict(Balance.objects.values_list("member_id", "amount")) == balances
@@ -0,0 +1,111 @@
+"""Test the expenses management commands."""
+
+from io import StringIO
+from pathlib import Path
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from expenses.models import Balance
+from expenses.settle_up import build_settle_up, get_settle_up
+from expenses.tests.test_helpers import create_test_expense, create_test_members
+from groups.tests.groups.test_helpers import create_test_group
+
+
+@pytest.mark.django_db
+def test_verify_balances_no_drift() -> None:
+    """Test that a consistent ledger passes verification."""
+    # Arrange
+    create_test_expense()
+    stdout = StringIO()
+
+    # Act
+    call_command("verify_balances", stdout=stdout)
+
+    # Assert
+    assert "2 balances checked, 0 drifted." in stdout.getvalue()
+
+
+@pytest.mark.django_db
+def test_verify_balances_reports_drift() -> None:
+    """Test that drifted balances are reported and fail the command."""
+    # Arrange
+    expense = create_test_expense(amount=1000)
+    Balance.objects.filter(member=expense.paid_by).update(amount=1)
+
+    # Act & Assert
+    with pytest.raises(CommandError, match="1 balances drifted"):
+        call_command("verify_balances", stdout=StringIO(), stderr=StringIO())
+
+
+@pytest.mark.django_db
+def test_verify_balances_fix() -> None:
+    """Test that --fix rebuilds drifted and missing balances."""
+    # Arrange
+    expense = create_test_expense(amount=1000)
+    Balance.objects.all().delete()
+
+    # Act
+    call_command("verify_balances", "--fix", stdout=StringIO(), stderr=StringIO())
+
+    # Assert
+    assert dict(Balance.objects.values_list("member_id", "amount")) == {
+        expense.paid_by_id: 500,
+        expense.shares.exclude(member=expense.paid_by).get().member_id: -500,
+    }
+
+
+@pytest.mark.django_db
+def test_verify_balances_fix_invalidates_settle_up() -> None:
+    """Test that repaired balances are reflected in the cached settle-up."""
+    # Arrange
+    expense = create_test_expense(amount=1000)
+    group = expense.group
+    Balance.objects.all().delete()
+    group.refresh_from_db()
+    stale_version = group.ledger_version
+    stale = get_settle_up(group)
+
+    # Act
+    call_command("verify_balances", "--fix", stdout=StringIO(), stderr=StringIO())
+
+    # Assert
+    group.refresh_from_db()
+
+    assert stale == []
+    assert group.ledger_version == stale_version + 1
+    assert get_settle_up(group) == build_settle_up(group) != []
+
+
+@pytest.mark.django_db
+def test_import_expenses(tmp_path: Path) -> None:
+    """Test that the import command reports imported and failed rows."""
+    # Arrange
+    group = create_test_group()
+    create_test_members(group, 2)
+    path = tmp_path / "export.csv"
+    path.write_text(
+        "Date,Description,Category,Cost,Currency,member0,member1\n"
+        "2024-03-01,Tea,,4,USD,2,-2\n"
+        "2024-03-02,Coffee,,4,USD,2,-1\n",
+        encoding="utf-8",
+    )
+    stdout = StringIO()
+    stderr = StringIO()
+
+    # Act
+    call_command(
+        "import_expenses", str(group.id), str(path), stdout=stdout, stderr=stderr
+    )
+
+    # Assert
+    assert "1 expenses imported, 0 skipped, 1 failed." in stdout.getvalue()
+    assert "Line 3:" in stderr.getvalue()
+
+
+@pytest.mark.django_db
+def test_import_expenses_unknown_group(tmp_path: Path) -> None:
+    """Test that importing into a missing group fails."""
+    # Act & Assert
+    with pytest.raises(CommandError, match="does not exist"):
+        call_command("import_expenses", "not-a-group", str(tmp_path / "x.csv"))
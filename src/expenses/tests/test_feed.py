@@ -0,0 +1,196 @@
+"""Test cases for the expense feed."""
+
+from __future__ import annotations
+
+from datetime import date
+from typing import TYPE_CHECKING
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+
+from categories.tests.test_helpers import create_test_category
+from expenses.models import Expense
+from expenses.tests.test_helpers import create_test_expense, create_test_members
+from groups.tests.groups.test_helpers import create_test_group
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from django.test import Client
+
+    from groups.models import Group
+
+
+def create_dated_expenses(group: Group, days: list[int]) -> list[Expense]:
+    """Create one expense per day of March 2024, in the given order."""
+    members = create_test_members(group, 2)
+    expenses = []
+
+    for day in days:
+        expense = create_test_expense(group=group, participants=members)
+        Expense.objects.filter(pk=expense.pk).update(date=date(2024, 3, day))
+        expenses.append(expense)
+
+    return expenses
+
+
+def read_feed(client: Client, url: str) -> list[str]:
+    """Follow the feed's cursors from a URL and return every expense id."""
+    ids = []
+
+    while url:
+        response = client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+
+        ids.extend(item["id"] for item in response.json()["results"])
+        url = response.json()["next"]
+
+    return ids
+
+
+@pytest.mark.django_db
+def test_feed_walks_every_page_in_date_and_id_order(client: Client) -> None:
+    """Test that following the cursors returns every expense once, newest first."""
+    # Arrange
+    group = create_test_group()
+    expenses = create_dated_expenses(group, [1, 3, 3, 2, 3, 1, 5])
+    expected = sorted(
+        expenses,
+        key=lambda expense: (Expense.objects.get(pk=expense.pk).date, str(expense.pk)),
+        reverse=True,
+    )
+
+    client.force_login(expenses[0].paid_by.user)
+
+    # Act
+    ids = read_feed(client, f"/api/expenses/?group={group.id}&limit=2")
+
+    # Assert
+    assert ids == [str(expense.pk) for expense in expected]
+
+
+@pytest.mark.django_db
+def test_feed_page_cost_does_not_grow_with_depth(
+    client: Client, django_assert_num_queries: Callable
+) -> None:
+    """Test that a deep page costs the same number of queries as the first."""
+    # Arrange
+    group = create_test_group()
+    expenses = create_dated_expenses(group, list(range(1, 21)))
+
+    client.force_login(expenses[0].paid_by.user)
+
+    first = client.get(f"/api/expenses/?group={group.id}&limit=2").json()
+    url = first["next"]
+
+    for _ in range(5):
+        url = client.get(url).json()["next"]
+
+    # Act
+    # Session, user, the page and its shares
+    with django_assert_num_queries(4):
+        response = client.get(url)
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.json()["results"]) == 2  # noqa: PLR2004
+
+
+@pytest.mark.django_db
+def test_feed_filters(client: Client) -> None:
+    """Test that the feed filters by category tree, payer, member and date."""
+    # Arrange
+    group = create_test_group()
+    first, second, third = create_dated_expenses(group, [1, 2, 3])
+
+    food = create_test_category(name="Food")
+    groceries = create_test_category(name="Groceries")
+    groceries.parent = food
+    groceries.save()
+    Expense.objects.filter(pk=first.pk).update(category=groceries)
+    Expense.objects.filter(pk=second.pk).update(category=food)
+
+    outsider = create_test_members(group, 3)[2]
+    Expense.objects.filter(pk=third.pk).update(paid_by=outsider)
+
+    client.force_login(first.paid_by.user)
+    url = f"/api/expenses/?group={group.id}"
+
+    # Act & Assert
+    assert read_feed(client, f"{url}&category={food.id}") == [
+        str(second.pk),
+        str(first.pk),
+    ]
+    assert read_feed(client, f"{url}&paid_by={outsider.id}") == [str(third.pk)]
+    assert read_feed(client, f"{url}&member={outsider.id}") == [str(third.pk)]
+    assert read_feed(client, f"{url}&date_from=2024-03-02&date_to=2024-03-02") == [
+        str(second.pk)
+    ]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    ("filters", "index"),
+    [
+        ("", "expense_feed_idx"),
+        ("&category={category}", "expense_feed_category_idx"),
+    ],
+)
+def test_feed_page_is_an_index_range_scan(
+    client: Client, filters: str, index: str
+) -> None:
+    """Test that a group's feed pages are read in order from the feed indexes."""
+    # Arrange
+    group = create_test_group()
+    expense = create_dated_expenses(group, [1])[0]
+    category = create_test_category(name="Food")
+
+    client.force_login(expense.paid_by.user)
+
+    with CaptureQueriesContext(connection) as queries:
+        client.get(
+            f"/api/expenses/?group={group.id}{filters.format(category=category.id)}"
+        )
+
+    feed_sql = next(
+        query["sql"]
+        for query in queries.captured_queries
+        if 'FROM "expenses_expense"' in query["sql"] and "ORDER BY" in query["sql"]
+    )
+
+    # Act
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN QUERY PLAN {feed_sql}")
+        plan = " ".join(row[-1] for row in cursor.fetchall())
+
+    # Assert
+    assert f"USING INDEX {index}" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    ("query", "expected_status"),
+    [
+        ("cursor=not-a-cursor", status.HTTP_404_NOT_FOUND),
+        ("cursor=WyJ4IiwgInkiXQ==", status.HTTP_404_NOT_FOUND),
+        ("date_from=yesterday", status.HTTP_400_BAD_REQUEST),
+        ("date_from=2024-03-02&date_to=2024-03-01", status.HTTP_400_BAD_REQUEST),
+    ],
+)
+def test_feed_invalid_parameters(
+    client: Client, query: str, expected_status: int
+) -> None:
+    """Test that invalid cursors and filters are rejected."""
+    # Arrange
+    expense = create_test_expense()
+
+    client.force_login(expense.paid_by.user)
+
+    # Act
+    response = client.get(f"/api/expenses/?{query}")
+
+    # Assert
+    assert response.status_code == expected_status
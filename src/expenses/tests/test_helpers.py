@@ -0,0 +1,97 @@
+"""Helper functions for testing the expenses app."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from core.test_helpers import create_test_user
+from expenses.models import Frequency, RecurringExpense, SplitType
+from expenses.recurring import create_recurring_expense
+from expenses.services import Participant, compute_shares, create_expense
+from groups.tests.groupMembers.test_helpers import create_test_group_member
+from groups.tests.groups.test_helpers import create_test_group
+
+if TYPE_CHECKING:
+    from datetime import date
+
+    from expenses.models import Expense
+    from groups.models import Group, GroupMember
+
+
+def create_test_members(group: Group, count: int) -> list[GroupMember]:
+    """Create ``count`` members in a group."""
+    return [
+        create_test_group_member(
+            user=create_test_user(username=f"member{index}", email=f"m{index}@a.com"),
+            group=group,
+        )
+        for index in range(count)
+    ]
+
+
+def create_test_expense(
+    *,
+    group: Group | None = None,
+    amount: int = 1000,
+    paid_by: GroupMember | None = None,
+    participants: list[GroupMember] | None = None,
+    split_type: SplitType = SplitType.EQUAL,
+    **fields: Any,  # noqa: ANN401
+) -> Expense:
+    """
+    Create a test expense split equally between its participants.
+
+    Any other expense field, such as ``title`` or ``date``, can be given too.
+    """
+    fields.setdefault("title", "Dinner")
+
+    if group is None:
+        group = create_test_group()
+
+    if participants is None:
+        participants = create_test_members(group, 2)
+
+    if paid_by is None:
+        paid_by = participants[0]
+
+    return create_expense(
+        group=group,
+        amount=amount,
+        currency=group.currency,
+        paid_by=paid_by,
+        split_type=split_type,
+        shares=compute_shares(
+            split_type, amount, [Participant(member=member) for member in participants]
+        ),
+        **fields,
+    )
+
+
+def create_test_recurring_expense(
+    group: Group,
+    participants: list[GroupMember],
+    start_date: date,
+    frequency: Frequency = Frequency.DAILY,
+    amount: int = 1000,
+) -> RecurringExpense:
+    """Create a test recurring expense whose first run is its start date."""
+    template = create_recurring_expense(
+        group=group,
+        title="Rent",
+        amount=amount,
+        currency=group.currency,
+        paid_by=participants[0],
+        frequency=frequency,
+        start_date=start_date,
+        shares=compute_shares(
+            SplitType.EQUAL,
+            amount,
+            [Participant(member=member) for member in participants],
+        ),
+    )
+    RecurringExpense.objects.filter(pk=template.pk).update(
+        next_run=start_date, is_active=True
+    )
+    template.refresh_from_db()
+
+    return template
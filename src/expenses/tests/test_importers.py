@@ -0,0 +1,147 @@
+"""Test cases for importing expenses."""
+
+import pytest
+from django.db import DatabaseError
+
+from categories.tests.test_helpers import create_emoji_test_category
+from expenses.importers import ImportFileError, SplitwiseImporter
+from expenses.models import Balance, Expense
+from expenses.tests.test_helpers import create_test_members
+from groups.tests.groups.test_helpers import create_test_group
+
+SPLITWISE_CSV = """Date,Description,Category,Cost,Currency,Alice,member1
+
+2024-03-01,Groceries,Food,30.00,USD,20.00,-20.00
+2024-03-02,Taxi,Transport,12.51,USD,-6.25,6.25
+2024-03-03,Settle,Payment,10.00,USD,10.00,-10.00
+2024-03-04,Bad row,Food,abc,USD,1.00,-1.00
+2024-03-05,Unbalanced,Food,10.00,USD,5.00,-4.00
+2024-03-06,Lunch,Food,10.00,XYZ,5.00,-5.00
+2024-03-07,Overpaid,Food,10.00,USD,15.00,-15.00
+,Total balance,,,USD,23.75,-23.75
+"""
+
+
+@pytest.mark.django_db
+def test_import_splitwise_csv() -> None:
+    """Test that valid rows are imported and invalid ones reported by line."""
+    # Arrange
+    group = create_test_group()
+    alice, bob = create_test_members(group, 2)
+    alice.user.first_name = "Alice"
+    alice.user.save()
+    food = create_emoji_test_category(name="Food", emoji="🍔")
+    group.categories.add(food)
+
+    # Act
+    result = SplitwiseImporter(group, batch_size=1).run(SPLITWISE_CSV.splitlines())
+
+    # Assert
+    assert result.imported == 2  # noqa: PLR2004
+    assert result.skipped == 3  # noqa: PLR2004
+    assert result.failed == 4  # noqa: PLR2004
+    assert [error["line"] for error in result.errors] == [6, 7, 8, 9]
+
+    groceries = Expense.objects.get(title="Groceries")
+
+    assert groceries.amount == 3000  # noqa: PLR2004
+    assert groceries.paid_by == alice
+    assert groceries.category == food
+    assert dict(groceries.shares.values_list("member", "amount")) == {
+        alice.id: 1000,
+        bob.id: 2000,
+    }
+
+    taxi = Expense.objects.get(title="Taxi")
+
+    assert taxi.paid_by == bob
+    assert taxi.category is None
+    assert dict(taxi.shares.values_list("member", "amount")) == {
+        alice.id: 625,
+        bob.id: 626,
+    }
+
+    assert dict(Balance.objects.values_list("member", "amount")) == {
+        alice.id: 1375,
+        bob.id: -1375,
+    }
+
+
+@pytest.mark.django_db
+def test_import_rebuilds_balances_when_a_batch_fails(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that the batches written before a failing one are in the balances."""
+    # Arrange
+    group = create_test_group()
+    alice, bob = create_test_members(group, 2)
+    csv = (
+        "Date,Description,Category,Cost,Currency,member0,member1\n"
+        "2024-03-01,Tea,,4,USD,2,-2\n"
+        "2024-03-02,Cake,,6,USD,3,-3\n"
+    )
+    importer = SplitwiseImporter(group, batch_size=1)
+    write_batch = importer.write_batch
+    calls = []
+
+    def failing_write_batch(batch: list) -> int:
+        calls.append(1)
+
+        if len(calls) > 1:
+            raise DatabaseError
+
+        return write_batch(batch)
+
+    monkeypatch.setattr(importer, "write_batch", failing_write_batch)
+
+    # Act
+    with pytest.raises(DatabaseError):
+        importer.run(csv.splitlines())
+
+    # Assert
+    assert Expense.objects.filter(group=group).count() == 1
+    assert dict(Balance.objects.values_list("member", "amount")) == {
+        alice.id: 200,
+        bob.id: -200,
+    }
+
+
+@pytest.mark.django_db
+def test_import_with_member_mapping() -> None:
+    """Test that people can be mapped to members explicitly."""
+    # Arrange
+    group = create_test_group()
+    create_test_members(group, 2)
+    csv = "Date,Description,Category,Cost,Currency,Al,Bo\n2024-03-01,Tea,,4,USD,2,-2\n"
+
+    # Act
+    result = SplitwiseImporter(group, members={"Al": "member0", "Bo": "member1"}).run(
+        csv.splitlines()
+    )
+
+    # Assert
+    assert result.imported == 1
+
+
+@pytest.mark.django_db
+def test_import_unknown_people() -> None:
+    """Test that a file naming people outside the group is rejected up front."""
+    # Arrange
+    group = create_test_group()
+    create_test_members(group, 1)
+    csv = "Date,Description,Category,Cost,Currency,member0,Zed\n"
+
+    # Act & Assert
+    with pytest.raises(ImportFileError, match="Zed"):
+        SplitwiseImporter(group).run(csv.splitlines())
+
+
+@pytest.mark.django_db
+def test_import_invalid_header() -> None:
+    """Test that a file without the expected columns is rejected."""
+    # Arrange
+    group = create_test_group()
+
+    # Act & Assert
+    with pytest.raises(ImportFileError, match="header"):
+        SplitwiseImporter(group).run(["When,What\n"])
@@ -0,0 +1,162 @@
+"""Test cases for the balance ledger."""
+
+import pytest
+
+from expenses.ledger import apply_balance_deltas, compute_balances
+from expenses.models import Balance, Expense
+from expenses.services import (
+    Participant,
+    compute_shares,
+    delete_expense,
+    update_expense,
+)
+from expenses.tests.test_helpers import create_test_expense, create_test_members
+from groups.tests.groups.test_helpers import create_test_group
+
+
+def get_balances(group_id: object) -> dict:
+    """Return a group's balances by member id."""
+    return dict(
+        Balance.objects.filter(group_id=group_id).values_list("member_id", "amount")
+    )
+
+
+@pytest.mark.django_db
+def test_apply_balance_deltas_accumulates() -> None:
+    """Test that repeated deltas are added to the existing balance."""
+    # Arrange
+    group = create_test_group()
+    member = create_test_members(group, 1)[0]
+    key = (group.id, member.id, group.currency_id)
+
+    # Act
+    apply_balance_deltas({key: 150})
+    apply_balance_deltas({key: -50})
+
+    # Assert
+    assert get_balances(group.id) == {member.id: 100}
+
+
+@pytest.mark.django_db
+def test_create_expense_updates_balances() -> None:
+    """Test that the payer is owed the amount and every participant owes a share."""
+    # Arrange
+    group = create_test_group()
+    members = create_test_members(group, 3)
+
+    # Act
+    create_test_expense(group=group, amount=900, participants=members)
+
+    # Assert
+    assert get_balances(group.id) == {
+        members[0].id: 600,
+        members[1].id: -300,
+        members[2].id: -300,
+    }
+
+
+@pytest.mark.django_db
+def test_update_expense_moves_balances() -> None:
+    """Test that updating an expense replaces its effect on the balances."""
+    # Arrange
+    group = create_test_group()
+    members = create_test_members(group, 2)
+    expense = create_test_expense(group=group, amount=1000, participants=members)
+
+    # Act
+    update_expense(
+        expense,
+        amount=400,
+        paid_by=members[1],
+        shares=compute_shares(
+            expense.split_type, 400, [Participant(member=member) for member in members]
+        ),
+    )
+
+    # Assert
+    assert get_balances(group.id) == {members[0].id: -200, members[1].id: 200}
+
+
+@pytest.mark.django_db
+def test_delete_expense_reverts_balances() -> None:
+    """Test that deleting an expense takes it out of the balances."""
+    # Arrange
+    group = create_test_group()
+    members = create_test_members(group, 2)
+    create_test_expense(group=group, amount=500, participants=members)
+    expense = create_test_expense(group=group, amount=1000, participants=members)
+
+    # Act
+    delete_expense(expense)
+
+    # Assert
+    assert get_balances(group.id) == {members[0].id: 250, members[1].id: -250}
+
+
+@pytest.mark.django_db
+def test_repeated_delete_expense_reverts_once() -> None:
+    """Test that two requests deleting the same expense only revert it once."""
+    # Arrange
+    group = create_test_group()
+    members = create_test_members(group, 2)
+    create_test_expense(group=group, amount=500, participants=members)
+    expense = create_test_expense(group=group, amount=1000, participants=members)
+    # Each request loaded its own copy before either deleted it
+    first, second = (
+        Expense.objects.get(pk=expense.pk),
+        Expense.objects.get(pk=expense.pk),
+    )
+
+    # Act
+    delete_expense(first)
+    delete_expense(second)
+
+    # Assert
+    assert get_balances(group.id) == {members[0].id: 250, members[1].id: -250}
+
+
+@pytest.mark.django_db
+def test_update_stale_expense_reverts_current_state() -> None:
+    """Test that an update reverts the expense as stored, not the caller's copy."""
+    # Arrange
+    group = create_test_group()
+    members = create_test_members(group, 2)
+    expense = create_test_expense(group=group, amount=1000, participants=members)
+    first, second = (
+        Expense.objects.get(pk=expense.pk),
+        Expense.objects.get(pk=expense.pk),
+    )
+
+    def shares(amount: int) -> list:
+        return compute_shares(
+            expense.split_type,
+            amount,
+            [Participant(member=member) for member in members],
+        )
+
+    # Act
+    update_expense(first, amount=400, shares=shares(400))
+    update_expense(second, amount=600, shares=shares(600))
+
+    # Assert
+    assert get_balances(group.id) == {members[0].id: 300, members[1].id: -300}
+
+
+@pytest.mark.django_db
+def test_compute_balances_matches_ledger() -> None:
+    """Test that rebuilding balances from source rows matches the ledger."""
+    # Arrange
+    group = create_test_group()
+    members = create_test_members(group, 3)
+    create_test_expense(group=group, amount=1001, participants=members)
+    create_test_expense(
+        group=group, amount=250, paid_by=members[2], participants=members[1:]
+    )
+
+    # Act
+    balances = compute_balances()
+
+    # Assert
+    assert {key[1]: amount for key, amount in balances.items()} == get_balances(
+        group.id
+    )
@@ -0,0 +1,42 @@
+"""Test cases for the expense models."""
+
+import pytest
+from django.db import IntegrityError
+
+from expenses.models import ExpenseShare
+from expenses.tests.test_helpers import create_test_expense
+
+
+@pytest.mark.django_db
+def test_expense_str() -> None:
+    """Test the string representation of an expense."""
+    # Arrange
+    expense = create_test_expense(title="Groceries")
+
+    # Act & Assert
+    assert str(expense) == "Groceries"
+
+
+@pytest.mark.django_db
+def test_expense_shares_add_up_to_amount() -> None:
+    """Test that an expense's shares add up to its amount."""
+    # Arrange
+    expense = create_test_expense(amount=1001)
+
+    # Act
+    amounts = sorted(expense.shares.values_list("amount", flat=True))
+
+    # Assert
+    assert amounts == [500, 501]
+
+
+@pytest.mark.django_db
+def test_expense_share_member_is_unique_per_expense() -> None:
+    """Test that a member cannot have two shares of the same expense."""
+    # Arrange
+    expense = create_test_expense()
+    share = expense.shares.first()
+
+    # Act & Assert
+    with pytest.raises(IntegrityError):
+        ExpenseShare.objects.create(expense=expense, member=share.member, amount=1)
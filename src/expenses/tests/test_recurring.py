@@ -0,0 +1,235 @@
+"""Test cases for recurring expenses."""
+
+from datetime import date
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+
+from expenses.models import Balance, Expense, Frequency, RecurringExpense
+from expenses.recurring import (
+    get_occurrence,
+    iter_occurrences,
+    run_due_recurring_expenses,
+)
+from expenses.tests.test_helpers import (
+    create_test_members,
+    create_test_recurring_expense,
+)
+from groups.tests.groups.test_helpers import create_test_group
+
+
+def test_monthly_occurrences_clamp_to_month_end() -> None:
+    """Test that monthly occurrences keep the start day where the month allows."""
+    # Arrange
+    template = RecurringExpense(
+        frequency=Frequency.MONTHLY, interval=1, start_date=date(2024, 1, 31)
+    )
+
+    # Act
+    occurrences = [get_occurrence(template, index) for index in range(4)]
+
+    # Assert
+    assert occurrences == [
+        date(2024, 1, 31),
+        date(2024, 2, 29),
+        date(2024, 3, 31),
+        date(2024, 4, 30),
+    ]
+
+
+def test_iter_occurrences_stops_at_end_date() -> None:
+    """Test that occurrences start from a date and stop at the end date."""
+    # Arrange
+    template = RecurringExpense(
+        frequency=Frequency.WEEKLY,
+        interval=2,
+        start_date=date(2024, 1, 1),
+        end_date=date(2024, 3, 1),
+    )
+
+    # Act
+    occurrences = list(iter_occurrences(template, date(2024, 2, 1)))
+
+    # Assert
+    assert occurrences == [date(2024, 2, 12), date(2024, 2, 26)]
+
+
+@pytest.mark.django_db
+def test_run_generates_due_occurrences_once() -> None:
+    """Test that due occurrences are generated once, with their balances."""
+    # Arrange
+    group = create_test_group()
+    members = create_test_members(group, 2)
+    template = create_test_recurring_expense(group, members, date(2024, 3, 1))
+
+    # Act
+    first = run_due_recurring_expenses(date(2024, 3, 3))
+    second = run_due_recurring_expenses(date(2024, 3, 3))
+
+    # Assert
+    assert (first.templates, first.generated) == (1, 3)
+    assert (second.templates, second.generated) == (0, 0)
+    assert sorted(template.occurrences.values_list("date", flat=True)) == [
+        date(2024, 3, 1),
+        date(2024, 3, 2),
+        date(2024, 3, 3),
+    ]
+    assert dict(Balance.objects.values_list("member", "amount")) == {
+        members[0].id: 1500,
+        members[1].id: -1500,
+    }
+
+    template.refresh_from_db()
+
+    assert template.next_run == date(2024, 3, 4)
+
+
+@pytest.mark.django_db
+def test_run_skips_existing_occurrences() -> None:
+    """Test that occurrences which already exist are not generated again."""
+    # Arrange
+    group = create_test_group()
+    members = create_test_members(group, 2)
+    template = create_test_recurring_expense(group, members, date(2024, 3, 1))
+    run_due_recurring_expenses(date(2024, 3, 2))
+    RecurringExpense.objects.filter(pk=template.pk).update(next_run=date(2024, 3, 1))
+
+    # Act
+    result = run_due_recurring_expenses(date(2024, 3, 3))
+
+    # Assert
+    assert result.generated == 1
+    assert template.occurrences.count() == 3  # noqa: PLR2004
+
+
+@pytest.mark.django_db
+def test_run_deactivates_finished_templates() -> None:
+    """Test that a template is deactivated after its last occurrence."""
+    # Arrange
+    group = create_test_group()
+    members = create_test_members(group, 2)
+    template = create_test_recurring_expense(group, members, date(2024, 3, 1))
+    RecurringExpense.objects.filter(pk=template.pk).update(end_date=date(2024, 3, 2))
+
+    # Act
+    result = run_due_recurring_expenses(date(2024, 3, 10))
+
+    # Assert
+    template.refresh_from_db()
+
+    assert result.generated == 2  # noqa: PLR2004
+    assert not template.is_active
+
+
+@pytest.mark.django_db
+def test_run_query_count_does_not_grow_with_templates() -> None:
+    """Test that a batch costs the same queries for 2 or 6 templates."""
+    # Arrange
+    group = create_test_group()
+    members = create_test_members(group, 3)
+    counts = []
+
+    # Act
+    for templates in (2, 6):
+        for _ in range(templates):
+            create_test_recurring_expense(group, members, date(2024, 3, 1))
+
+        with CaptureQueriesContext(connection) as context:
+            run_due_recurring_expenses(date(2024, 3, 1))
+
+        counts.append(len(context.captured_queries))
+
+    # Assert
+    assert counts[0] == counts[1]
+    assert Expense.objects.count() == 8  # noqa: PLR2004
+
+
+@pytest.mark.django_db
+def test_run_recurring_expenses_command() -> None:
+    """Test that the command reports the generated occurrences."""
+    # Arrange
+    group = create_test_group()
+    create_test_recurring_expense(
+        group, create_test_members(group, 2), date(2024, 3, 1)
+    )
+    stdout = StringIO()
+
+    # Act
+    call_command("run_recurring_expenses", "--date", "2024-03-02", stdout=stdout)
+
+    # Assert
+    assert "2 expenses generated from 1 recurring expenses." in stdout.getvalue()
+
+
+@pytest.mark.django_db
+def test_create_recurring_expense(client: Client) -> None:
+    """Test that a recurring expense is validated and scheduled from its start."""
+    # Arrange
+    group = create_test_group()
+    members = create_test_members(group, 2)
+
+    client.force_login(members[0].user)
+
+    # Act
+    response = client.post(
+        "/api/recurring-expenses/",
+        {
+            "group": str(group.id),
+            "title": "Rent",
+            "amount": 100_000,
+            "paid_by": str(members[0].id),
+            "split_type": "shares",
+            "frequency": "monthly",
+            "start_date": "2099-01-31",
+            "participants": [
+                {"member": str(members[0].id), "value": "2"},
+                {"member": str(members[1].id), "value": "1"},
+            ],
+        },
+        "application/json",
+    )
+
+    # Assert
+    assert response.status_code == status.HTTP_201_CREATED
+
+    data = response.json()
+
+    assert data["next_run"] == "2099-01-31"
+    assert data["is_active"] is True
+    assert {participant["value"] for participant in data["participants"]} == {
+        "2.0000",
+        "1.0000",
+    }
+
+
+@pytest.mark.django_db
+def test_create_recurring_expense_invalid_split(client: Client) -> None:
+    """Test that a recurring expense that cannot be split is rejected."""
+    # Arrange
+    group = create_test_group()
+    members = create_test_members(group, 2)
+
+    client.force_login(members[0].user)
+
+    # Act
+    response = client.post(
+        "/api/recurring-expenses/",
+        {
+            "group": str(group.id),
+            "title": "Rent",
+            "amount": 1000,
+            "paid_by": str(members[0].id),
+            "split_type": "percentage",
+            "participants": [{"member": str(members[0].id), "value": "50"}],
+        },
+        "application/json",
+    )
+
+    # Assert
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "participants" in response.json()
@@ -0,0 +1,96 @@
+"""Test cases for debt simplification."""
+
+from collections import defaultdict
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from expenses.settle_up import get_settle_up, simplify_debts
+from expenses.tests.test_helpers import create_test_expense, create_test_members
+from groups.tests.groups.test_helpers import create_test_group
+
+
+def test_simplify_debts_settles_every_balance() -> None:
+    """Test that the transfers bring every balance back to zero."""
+    # Arrange
+    balances = {"a": 700, "b": -300, "c": -250, "d": 150, "e": -300}
+
+    # Act
+    transfers = simplify_debts(balances)
+
+    # Assert
+    settled = defaultdict(int, balances)
+
+    for transfer in transfers:
+        settled[transfer.payer] += transfer.amount
+        settled[transfer.payee] -= transfer.amount
+
+    assert all(amount == 0 for amount in settled.values())
+    assert len(transfers) <= len(balances) - 1
+
+
+def test_simplify_debts_pays_largest_creditor_first() -> None:
+    """Test that the largest debtor pays the largest creditor."""
+    # Act
+    transfers = simplify_debts({"a": 100, "b": 50, "c": -150})
+
+    # Assert
+    assert [(t.payer, t.payee, t.amount) for t in transfers] == [
+        ("c", "a", 100),
+        ("c", "b", 50),
+    ]
+
+
+def test_simplify_debts_rejects_unbalanced_input() -> None:
+    """Test that balances which do not add up to zero are rejected."""
+    # Act & Assert
+    with pytest.raises(ValueError, match="add up to zero"):
+        simplify_debts({"a": 100, "b": -50})
+
+
+@pytest.mark.django_db
+def test_get_settle_up_is_recomputed_when_ledger_changes() -> None:
+    """Test that suggestions are cached until the group's balances change."""
+    # Arrange
+    group = create_test_group()
+    members = create_test_members(group, 2)
+    create_test_expense(group=group, amount=1000, participants=members)
+    group.refresh_from_db()
+
+    first = get_settle_up(group)
+
+    # Act
+    create_test_expense(group=group, amount=1000, participants=members)
+    cached = get_settle_up(group)
+    group.refresh_from_db()
+    recomputed = get_settle_up(group)
+
+    # Assert
+    assert first == [
+        {
+            "currency": str(group.currency_id),
+            "payer": str(members[1].id),
+            "payee": str(members[0].id),
+            "amount": 500,
+        }
+    ]
+    assert cached is first
+    assert recomputed[0]["amount"] == 1000  # noqa: PLR2004
+
+
+def test_benchmark_settle_up() -> None:
+    """Test that the benchmark reports every group size."""
+    # Arrange
+    stdout = StringIO()
+
+    # Act
+    call_command(
+        "benchmark_settle_up", "--sizes", "2", "500", "--repeat", "1", stdout=stdout
+    )
+
+    # Assert
+    lines = stdout.getvalue().splitlines()
+
+    assert len(lines) == 3  # noqa: PLR2004
+    assert lines[2].split()[0] == "500"
@@ -0,0 +1,186 @@
+"""Test cases for settlements."""
+
+import pytest
+from django.test import Client
+from rest_framework import status
+
+from expenses.ledger import compute_balances
+from expenses.models import Balance, Settlement
+from expenses.services import delete_settlement
+from expenses.tests.test_helpers import create_test_expense, create_test_members
+from groups.tests.groups.test_helpers import create_test_group
+
+
+def get_balances(group_id: object) -> dict:
+    """Return a group's balances by member id."""
+    return dict(
+        Balance.objects.filter(group_id=group_id).values_list("member_id", "amount")
+    )
+
+
+@pytest.mark.django_db
+def test_create_settlement_updates_balances(client: Client) -> None:
+    """Test that recording a payment moves both members' balances."""
+    # Arrange
+    group = create_test_group()
+    payee, payer = create_test_members(group, 2)
+    create_test_expense(group=group, amount=1000, participants=[payee, payer])
+
+    client.force_login(payer.user)
+
+    # Act
+    response = client.post(
+        "/api/settlements/",
+        {
+            "group": str(group.id),
+            "payer": str(payer.id),
+            "payee": str(payee.id),
+            "amount": 200,
+        },
+        "application/json",
+    )
+
+    # Assert
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.json()["currency"] == str(group.currency_id)
+    assert get_balances(group.id) == {payee.id: 300, payer.id: -300}
+    assert {key[1]: amount for key, amount in compute_balances().items()} == (
+        get_balances(group.id)
+    )
+
+
+@pytest.mark.django_db
+def test_create_settlement_same_member(client: Client) -> None:
+    """Test that a member cannot pay themselves."""
+    # Arrange
+    group = create_test_group()
+    member = create_test_members(group, 1)[0]
+
+    client.force_login(member.user)
+
+    # Act
+    response = client.post(
+        "/api/settlements/",
+        {
+            "group": str(group.id),
+            "payer": str(member.id),
+            "payee": str(member.id),
+            "amount": 200,
+        },
+        "application/json",
+    )
+
+    # Assert
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "payee" in response.json()
+
+
+@pytest.mark.django_db
+def test_delete_settlement_reverts_balances(client: Client) -> None:
+    """Test that deleting a settlement takes it out of the balances."""
+    # Arrange
+    group = create_test_group()
+    payee, payer = create_test_members(group, 2)
+    create_test_expense(group=group, amount=1000, participants=[payee, payer])
+
+    client.force_login(payer.user)
+    settlement_id = client.post(
+        "/api/settlements/",
+        {
+            "group": str(group.id),
+            "payer": str(payer.id),
+            "payee": str(payee.id),
+            "amount": 500,
+        },
+        "application/json",
+    ).json()["id"]
+
+    # Act
+    response = client.delete(f"/api/settlements/{settlement_id}/")
+
+    # Assert
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+    assert get_balances(group.id) == {payee.id: 500, payer.id: -500}
+
+
+@pytest.mark.django_db
+def test_repeated_delete_settlement_reverts_once(client: Client) -> None:
+    """Test that two requests deleting the same settlement only revert it once."""
+    # Arrange
+    group = create_test_group()
+    payee, payer = create_test_members(group, 2)
+    create_test_expense(group=group, amount=1000, participants=[payee, payer])
+
+    client.force_login(payer.user)
+    settlement_id = client.post(
+        "/api/settlements/",
+        {
+            "group": str(group.id),
+            "payer": str(payer.id),
+            "payee": str(payee.id),
+            "amount": 500,
+        },
+        "application/json",
+    ).json()["id"]
+    first = Settlement.objects.get(pk=settlement_id)
+    second = Settlement.objects.get(pk=settlement_id)
+
+    # Act
+    delete_settlement(first)
+    delete_settlement(second)
+
+    # Assert
+    assert get_balances(group.id) == {payee.id: 500, payer.id: -500}
+
+
+@pytest.mark.django_db
+def test_settle_up_group(client: Client) -> None:
+    """Test that every suggestion is recorded in one request, clearing balances."""
+    # Arrange
+    group = create_test_group()
+    members = create_test_members(group, 3)
+    create_test_expense(group=group, amount=900, participants=members)
+    create_test_expense(
+        group=group, amount=300, paid_by=members[1], participants=members
+    )
+    group.refresh_from_db()
+
+    client.force_login(members[2].user)
+
+    # Act
+    response = client.post(
+        "/api/settlements/settle-up/",
+        {"group": str(group.id), "ledger_version": group.ledger_version},
+        "application/json",
+    )
+
+    # Assert
+    assert response.status_code == status.HTTP_201_CREATED
+    assert len(response.json()) == Settlement.objects.count() == 2  # noqa: PLR2004
+    assert set(get_balances(group.id).values()) == {0}
+
+
+@pytest.mark.django_db
+def test_settle_up_group_stale_ledger_version(client: Client) -> None:
+    """Test that settling up fails when the balances changed since they were read."""
+    # Arrange
+    group = create_test_group()
+    members = create_test_members(group, 2)
+    create_test_expense(group=group, amount=900, participants=members)
+    group.refresh_from_db()
+    stale_version = group.ledger_version
+    create_test_expense(group=group, amount=100, participants=members)
+
+    client.force_login(members[0].user)
+
+    # Act
+    response = client.post(
+        "/api/settlements/settle-up/",
+        {"group": str(group.id), "ledger_version": stale_version},
+        "application/json",
+    )
+
+    # Assert
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "ledger_version" in response.json()
+    assert not Settlement.objects.exists()
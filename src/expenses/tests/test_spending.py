@@ -0,0 +1,248 @@
+"""Test cases for the monthly spending rollup and analytics."""
+
+from __future__ import annotations
+
+from datetime import date
+from io import StringIO
+from typing import TYPE_CHECKING
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+from rest_framework import status
+
+from categories.models import Category
+from categories.tests.test_helpers import create_test_category
+from expenses.models import MonthlySpending
+from expenses.services import delete_expense, update_expense
+from expenses.spending import rebuild_group_spending
+from expenses.tests.test_helpers import create_test_expense, create_test_members
+from groups.tests.groups.test_helpers import create_test_group
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from django.test import Client
+
+    from groups.models import Group
+
+
+def rollup(group: Group) -> set[tuple]:
+    """Return a group's non-empty rollup rows."""
+    return set(
+        MonthlySpending.objects.filter(group=group)
+        .exclude(expense_count=0)
+        .values_list("category_id", "month", "amount", "expense_count")
+    )
+
+
+@pytest.mark.django_db
+def test_expense_writes_maintain_rollup() -> None:
+    """Test that creating, moving and deleting expenses keeps the rollup right."""
+    # Arrange
+    group = create_test_group()
+    members = create_test_members(group, 2)
+    food = create_test_category(name="Food")
+    first = create_test_expense(
+        group=group,
+        amount=1000,
+        participants=members,
+        category=food,
+        date=date(2024, 1, 5),
+    )
+    second = create_test_expense(
+        group=group,
+        amount=500,
+        participants=members,
+        category=food,
+        date=date(2024, 1, 20),
+    )
+
+    # Act
+    update_expense(first, category=None, date=date(2024, 2, 1))
+    delete_expense(second)
+    create_test_expense(
+        group=group, amount=300, participants=members, date=date(2024, 2, 9)
+    )
+
+    # Assert
+    assert rollup(group) == {(None, date(2024, 2, 1), 1300, 2)}
+    assert MonthlySpending.objects.get(category=food).amount == 0
+
+
+@pytest.mark.django_db
+def test_rollup_matches_rebuild() -> None:
+    """Test that the incremental rollup matches one rebuilt from the expenses."""
+    # Arrange
+    group = create_test_group()
+    members = create_test_members(group, 2)
+    food = create_test_category(name="Food")
+
+    for day in (date(2024, 1, 1), date(2024, 1, 31), date(2024, 3, 1)):
+        create_test_expense(
+            group=group, amount=700, participants=members, category=food, date=day
+        )
+        create_test_expense(group=group, amount=100, participants=members, date=day)
+
+    incremental = rollup(group)
+
+    # Act
+    rebuild_group_spending(group.pk)
+
+    # Assert
+    assert rollup(group) == incremental
+    assert len(incremental) == 4  # noqa: PLR2004
+
+
+@pytest.mark.django_db
+def test_deleting_category_moves_spending_to_uncategorised() -> None:
+    """Test that a deleted category's spending is counted as uncategorised."""
+    # Arrange
+    group = create_test_group()
+    members = create_test_members(group, 2)
+    food = create_test_category(name="Food")
+    create_test_expense(
+        group=group,
+        amount=1000,
+        participants=members,
+        category=food,
+        date=date(2024, 1, 5),
+    )
+    create_test_expense(
+        group=group, amount=200, participants=members, date=date(2024, 1, 9)
+    )
+
+    # Act
+    food.delete()
+
+    # Assert
+    assert rollup(group) == {(None, date(2024, 1, 1), 1200, 2)}
+
+
+@pytest.mark.django_db
+def test_spending_rolls_subcategories_up(
+    client: Client, django_assert_num_queries: Callable
+) -> None:
+    """Test that spending is read from the rollup and rolled up to top level."""
+    # Arrange
+    group = create_test_group()
+    members = create_test_members(group, 2)
+    food = create_test_category(name="Food")
+    groceries = Category.objects.create(name="Groceries", parent=food)
+    travel = create_test_category(name="Travel")
+
+    for category, amount, day in (
+        (food, 100, date(2024, 1, 3)),
+        (groceries, 400, date(2024, 1, 10)),
+        (groceries, 500, date(2024, 2, 10)),
+        (travel, 2000, date(2024, 2, 1)),
+        (None, 50, date(2024, 2, 2)),
+        (travel, 9999, date(2023, 12, 31)),
+    ):
+        create_test_expense(
+            group=group,
+            amount=amount,
+            participants=members,
+            category=category,
+            date=day,
+        )
+
+    client.force_login(members[0].user)
+
+    # Act
+    # Session, user, group, the rollup rows and the category names.
+    with django_assert_num_queries(5):
+        response = client.get(
+            "/api/expenses/spending/",
+            {
+                "group": str(group.id),
+                "date_from": "2024-01-01",
+                "date_to": "2024-12-31",
+            },
+        )
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+
+    categories = response.json()["categories"]
+
+    assert [(row["name"], row["total"]) for row in categories] == [
+        ("Travel", 2000),
+        ("Food", 1000),
+        (None, 50),
+    ]
+    assert categories[1]["expense_count"] == 3  # noqa: PLR2004
+    assert categories[1]["months"] == [
+        {"month": "2024-01-01", "amount": 500},
+        {"month": "2024-02-01", "amount": 500},
+    ]
+
+
+@pytest.mark.django_db
+def test_spending_drills_into_category(client: Client) -> None:
+    """Test that a category's spending is split over its direct subcategories."""
+    # Arrange
+    group = create_test_group()
+    members = create_test_members(group, 2)
+    food = create_test_category(name="Food")
+    groceries = Category.objects.create(name="Groceries", parent=food)
+    fruit = Category.objects.create(name="Fruit", parent=groceries)
+    restaurants = Category.objects.create(name="Restaurants", parent=food)
+
+    for category, amount in ((food, 100), (fruit, 200), (restaurants, 300)):
+        create_test_expense(
+            group=group,
+            amount=amount,
+            participants=members,
+            category=category,
+            date=timezone.localdate(),
+        )
+
+    client.force_login(members[0].user)
+
+    # Act
+    response = client.get(
+        "/api/expenses/spending/", {"group": str(group.id), "category": str(food.id)}
+    )
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert [(row["name"], row["total"]) for row in response.json()["categories"]] == [
+        ("Restaurants", 300),
+        ("Groceries", 200),
+        ("Food", 100),
+    ]
+
+
+@pytest.mark.django_db
+def test_spending_requires_membership(client: Client) -> None:
+    """Test that spending of another group is not found."""
+    # Arrange
+    group = create_test_group()
+    outsider = create_test_members(create_test_group(title="Other"), 1)[0]
+
+    client.force_login(outsider.user)
+
+    # Act
+    response = client.get("/api/expenses/spending/", {"group": str(group.id)})
+
+    # Assert
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+def test_rebuild_spending_command() -> None:
+    """Test that the command rebuilds a drifted rollup."""
+    # Arrange
+    group = create_test_group()
+    create_test_expense(group=group, amount=1000, date=date(2024, 1, 5))
+    expected = rollup(group)
+    MonthlySpending.objects.update(amount=1)
+    stdout = StringIO()
+
+    # Act
+    call_command("rebuild_spending", stdout=stdout)
+
+    # Assert
+    assert rollup(group) == expected
+    assert "Spending rebuilt for 1 groups." in stdout.getvalue()
@@ -0,0 +1,72 @@
+"""Tests for the split engine."""
+
+from decimal import Decimal
+
+import pytest
+
+from expenses.models import SplitType
+from expenses.splits import SplitError, allocate, compute_split
+
+
+def test_allocate_distributes_remainder_to_largest_fractions() -> None:
+    """Test that leftover units go to the largest fractional remainders."""
+    # Act
+    amounts = allocate(100, [Decimal("33.3"), Decimal("33.3"), Decimal("33.4")])
+
+    # Assert
+    assert amounts == [33, 33, 34]
+
+
+def test_allocate_breaks_ties_by_position() -> None:
+    """Test that equal remainders go to the earlier participants."""
+    # Act
+    amounts = allocate(100, [1, 1, 1])
+
+    # Assert
+    assert amounts == [34, 33, 33]
+
+
+@pytest.mark.parametrize(
+    ("split_type", "values", "expected"),
+    [
+        (SplitType.EQUAL, [None, None, None], [334, 333, 333]),
+        (SplitType.EXACT, [500, Decimal(250), 250], [500, 250, 250]),
+        (SplitType.PERCENTAGE, [50, 25, 25], [500, 250, 250]),
+        (
+            SplitType.PERCENTAGE,
+            [Decimal("33.33"), Decimal("33.33"), Decimal("33.34")],
+            [333, 333, 334],
+        ),
+        (SplitType.SHARES, [2, 1, 1], [500, 250, 250]),
+        (SplitType.SHARES, [1, 1, 1], [334, 333, 333]),
+    ],
+)
+def test_compute_split(split_type: str, values: list, expected: list[int]) -> None:
+    """Test that every strategy adds up to the total in minor units."""
+    # Act
+    amounts = compute_split(split_type, 1000, values)
+
+    # Assert
+    assert amounts == expected
+    assert sum(amounts) == 1000  # noqa: PLR2004
+
+
+@pytest.mark.parametrize(
+    ("split_type", "values"),
+    [
+        (SplitType.EQUAL, []),
+        (SplitType.EXACT, [500, 400]),
+        (SplitType.EXACT, [Decimal("500.5"), Decimal("499.5")]),
+        (SplitType.EXACT, [None, 1000]),
+        (SplitType.PERCENTAGE, [50, 40]),
+        (SplitType.PERCENTAGE, [None, 100]),
+        (SplitType.SHARES, [0, 0]),
+        (SplitType.SHARES, [-1, 2]),
+        ("unknown", [1]),
+    ],
+)
+def test_compute_split_rejects_invalid_values(split_type: str, values: list) -> None:
+    """Test that invalid split inputs raise a SplitError."""
+    # Act & Assert
+    with pytest.raises(SplitError):
+        compute_split(split_type, 1000, values)
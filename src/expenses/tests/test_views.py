@@ -0,0 +1,508 @@
+"""Test cases for the expense views."""
+
+from __future__ import annotations
+
+from io import StringIO
+from typing import TYPE_CHECKING
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from rest_framework import status
+
+from core.test_helpers import create_test_user
+from currency.tests.test_helpers import create_test_currency, create_test_exchange_rate
+from expenses.models import Balance, Expense, ExpenseShare
+from expenses.tests.test_helpers import create_test_expense, create_test_members
+from groups.tests.groupMembers.test_helpers import create_test_group_member
+from groups.tests.groups.test_helpers import create_test_group
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from django.test import Client
+
+
+@pytest.mark.django_db
+def test_create_expense_equal_split_between_all_members(client: Client) -> None:
+    """Test that an expense without participants is split between every member."""
+    # Arrange
+    group = create_test_group()
+    members = create_test_members(group, 2)
+
+    payload = {
+        "group": str(group.id),
+        "title": "Dinner",
+        "amount": 1000,
+        "paid_by": str(members[0].id),
+    }
+
+    client.force_login(members[0].user)
+
+    # Act
+    response = client.post("/api/expenses/", payload, "application/json")
+    response_data = response.json()
+
+    # Assert
+    assert response.status_code == status.HTTP_201_CREATED
+
+    assert response_data["currency"] == str(group.currency.id)
+    assert response_data["split_type"] == "equal"
+    assert response_data["created_by"] == str(members[0].user.pk)
+    # The group's creator is a member too
+    assert sorted(share["amount"] for share in response_data["shares"]) == [
+        333,
+        333,
+        334,
+    ]
+
+
+@pytest.mark.django_db
+def test_create_expense_percentage_split(client: Client) -> None:
+    """Test that an expense can be split by percentages."""
+    # Arrange
+    group = create_test_group()
+    members = create_test_members(group, 2)
+
+    payload = {
+        "group": str(group.id),
+        "title": "Hotel",
+        "amount": 999,
+        "paid_by": str(members[1].id),
+        "split_type": "percentage",
+        "participants": [
+            {"member": str(members[0].id), "value": "75"},
+            {"member": str(members[1].id), "value": "25"},
+        ],
+    }
+
+    client.force_login(members[0].user)
+
+    # Act
+    response = client.post("/api/expenses/", payload, "application/json")
+
+    # Assert
+    assert response.status_code == status.HTTP_201_CREATED
+
+    shares = {share["member"]: share["amount"] for share in response.json()["shares"]}
+
+    assert shares == {str(members[0].id): 749, str(members[1].id): 250}
+
+
+@pytest.mark.django_db
+def test_create_expense_invalid_split(client: Client) -> None:
+    """Test that exact amounts that do not add up are rejected."""
+    # Arrange
+    group = create_test_group()
+    members = create_test_members(group, 2)
+
+    payload = {
+        "group": str(group.id),
+        "title": "Taxi",
+        "amount": 1000,
+        "paid_by": str(members[0].id),
+        "split_type": "exact",
+        "participants": [
+            {"member": str(members[0].id), "value": "600"},
+            {"member": str(members[1].id), "value": "300"},
+        ],
+    }
+
+    client.force_login(members[0].user)
+
+    # Act
+    response = client.post("/api/expenses/", payload, "application/json")
+
+    # Assert
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "participants" in response.json()
+    assert not Expense.objects.exists()
+
+
+@pytest.mark.django_db
+def test_create_expense_participant_outside_group(client: Client) -> None:
+    """Test that members of another group cannot take part in an expense."""
+    # Arrange
+    group = create_test_group()
+    members = create_test_members(group, 1)
+    other_group = create_test_group(title="Other", created_by=create_test_user("bob"))
+    outsider = create_test_members(other_group, 2)[1]
+
+    payload = {
+        "group": str(group.id),
+        "title": "Taxi",
+        "amount": 1000,
+        "paid_by": str(members[0].id),
+        "participants": [{"member": str(outsider.id)}],
+    }
+
+    client.force_login(members[0].user)
+
+    # Act
+    response = client.post("/api/expenses/", payload, "application/json")
+
+    # Assert
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "participants" in response.json()
+
+
+@pytest.mark.django_db
+def test_create_expense_not_a_member(client: Client) -> None:
+    """Test that users cannot add expenses to groups they do not belong to."""
+    # Arrange
+    group = create_test_group()
+    members = create_test_members(group, 2)
+
+    payload = {
+        "group": str(group.id),
+        "title": "Taxi",
+        "amount": 1000,
+        "paid_by": str(members[0].id),
+    }
+
+    client.force_login(create_test_user(username="outsider", email="o@a.com"))
+
+    # Act
+    response = client.post("/api/expenses/", payload, "application/json")
+
+    # Assert
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "group" in response.json()
+
+
+@pytest.mark.django_db
+def test_create_expense_query_count_does_not_grow_with_participants(
+    client: Client, django_assert_num_queries: Callable
+) -> None:
+    """Test that shares are written in bulk, whatever the number of participants."""
+    # Arrange
+    group = create_test_group()
+    members = create_test_members(group, 30)
+
+    payload = {
+        "group": str(group.id),
+        "title": "Festival tickets",
+        "amount": 300_001,
+        "paid_by": str(members[0].id),
+        "split_type": "shares",
+        "participants": [
+            {"member": str(member.id), "value": str(index % 3 + 1)}
+            for index, member in enumerate(members)
+        ],
+    }
+
+    client.force_login(members[0].user)
+
+    # Act
+    # Session, user, group, payer, currency, members, then the expense insert, one
+    # bulk insert of shares, one balance upsert, the ledger version bump and one
+    # spending upsert inside a savepoint.
+    with django_assert_num_queries(14):
+        response = client.post("/api/expenses/", payload, "application/json")
+
+    # Assert
+    assert response.status_code == status.HTTP_201_CREATED
+    assert ExpenseShare.objects.count() == 30  # noqa: PLR2004
+    assert sum(ExpenseShare.objects.values_list("amount", flat=True)) == 300_001  # noqa: PLR2004
+
+
+@pytest.mark.django_db
+def test_update_expense_amount_recomputes_shares(client: Client) -> None:
+    """Test that changing the amount re-splits it between the same participants."""
+    # Arrange
+    group = create_test_group()
+    members = create_test_members(group, 3)
+    expense = create_test_expense(group=group, participants=members[:2])
+
+    client.force_login(members[0].user)
+
+    # Act
+    response = client.patch(
+        f"/api/expenses/{expense.id}/", {"amount": 301}, "application/json"
+    )
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert sorted(expense.shares.values_list("amount", flat=True)) == [150, 151]
+
+
+@pytest.mark.django_db
+def test_update_expense_cannot_change_group(client: Client) -> None:
+    """Test that an expense cannot be moved to another group."""
+    # Arrange
+    expense = create_test_expense()
+    member = expense.paid_by
+    other_group = create_test_group(title="Other", created_by=member.user)
+
+    client.force_login(member.user)
+
+    # Act
+    response = client.patch(
+        f"/api/expenses/{expense.id}/",
+        {"group": str(other_group.id)},
+        "application/json",
+    )
+
+    # Assert
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "group" in response.json()
+
+
+@pytest.mark.django_db
+def test_list_expenses_only_for_user_groups(client: Client) -> None:
+    """Test that users only see expenses of groups they belong to."""
+    # Arrange
+    expense = create_test_expense()
+    other_group = create_test_group(title="Other", created_by=create_test_user("bob"))
+    create_test_expense(
+        group=other_group,
+        participants=[
+            create_test_members(other_group, 1)[0],
+        ],
+    )
+
+    client.force_login(expense.paid_by.user)
+
+    # Act
+    response = client.get(f"/api/expenses/?group={expense.group_id}")
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert [item["id"] for item in response.json()["results"]] == [str(expense.id)]
+
+
+@pytest.mark.django_db
+def test_list_expenses_invalid_group(client: Client) -> None:
+    """Test that an invalid group filter is rejected."""
+    # Arrange
+    client.force_login(create_test_user())
+
+    # Act
+    response = client.get("/api/expenses/?group=not-a-uuid")
+
+    # Assert
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+def test_delete_expense_removes_shares(client: Client) -> None:
+    """Test that deleting an expense deletes its shares."""
+    # Arrange
+    expense = create_test_expense()
+
+    client.force_login(expense.paid_by.user)
+
+    # Act
+    response = client.delete(f"/api/expenses/{expense.id}/")
+
+    # Assert
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+    assert not ExpenseShare.objects.exists()
+
+
+@pytest.mark.django_db
+def test_list_balances(client: Client, django_assert_num_queries: Callable) -> None:
+    """Test that a group's balances are read straight from the ledger."""
+    # Arrange
+    expense = create_test_expense(amount=1000)
+
+    client.force_login(expense.paid_by.user)
+
+    # Act
+    # Session, user, count and page
+    with django_assert_num_queries(4):
+        response = client.get(f"/api/balances/?group={expense.group_id}")
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert sorted(item["amount"] for item in response.json()["results"]) == [
+        -500,
+        500,
+    ]
+
+
+@pytest.mark.django_db
+def test_settle_up(client: Client) -> None:
+    """Test that settle-up suggestions are returned with a ledger-version ETag."""
+    # Arrange
+    expense = create_test_expense(amount=1000)
+    debtor = expense.shares.exclude(member=expense.paid_by).get().member
+
+    client.force_login(expense.paid_by.user)
+
+    # Act
+    response = client.get(f"/api/balances/settle-up/?group={expense.group_id}")
+    not_modified = client.get(
+        f"/api/balances/settle-up/?group={expense.group_id}",
+        headers={"If-None-Match": response["ETag"]},
+    )
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["transfers"] == [
+        {
+            "currency": str(expense.currency_id),
+            "payer": str(debtor.id),
+            "payee": str(expense.paid_by_id),
+            "amount": 500,
+        }
+    ]
+    assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+@pytest.mark.django_db
+def test_settle_up_changes_after_balance_repair(client: Client) -> None:
+    """Test that repairing the ledger moves the settle-up ETag on."""
+    # Arrange
+    expense = create_test_expense(amount=1000)
+    url = f"/api/balances/settle-up/?group={expense.group_id}"
+    Balance.objects.all().delete()
+
+    client.force_login(expense.paid_by.user)
+    stale = client.get(url)
+
+    # Act
+    call_command("verify_balances", "--fix", stdout=StringIO(), stderr=StringIO())
+    response = client.get(url, headers={"If-None-Match": stale["ETag"]})
+
+    # Assert
+    assert stale.json()["transfers"] == []
+    assert response.status_code == status.HTTP_200_OK
+    assert response["ETag"] != stale["ETag"]
+    assert len(response.json()["transfers"]) == 1
+
+
+@pytest.mark.django_db
+def test_settle_up_requires_membership(client: Client) -> None:
+    """Test that users cannot read settle-up suggestions of other groups."""
+    # Arrange
+    expense = create_test_expense()
+
+    client.force_login(create_test_user(username="outsider", email="o@a.com"))
+
+    # Act
+    response = client.get(f"/api/balances/settle-up/?group={expense.group_id}")
+
+    # Assert
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+def test_balance_summary_across_groups(
+    client: Client, django_assert_num_queries: Callable
+) -> None:
+    """Test that a user's totals across groups come from one grouped aggregate."""
+    # Arrange
+    usd_group = create_test_group()
+    payer, other = create_test_members(usd_group, 2)
+    create_test_expense(group=usd_group, amount=1000, participants=[payer, other])
+
+    eur = create_test_currency(name="Euro", code="EUR", symbol="€")
+    eur_group = create_test_group(title="Paris", currency=eur, created_by=other.user)
+    friend = eur_group.group_members.get(user=other.user)
+    create_test_expense(
+        group=eur_group,
+        amount=600,
+        paid_by=friend,
+        participants=[friend, create_test_group_member(payer.user, eur_group)],
+    )
+
+    client.force_login(payer.user)
+
+    # Act
+    # Session, user and the aggregate
+    with django_assert_num_queries(3):
+        response = client.get("/api/balances/summary/")
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {
+        "currencies": [
+            {"currency": "EUR", "owed": 0, "owe": 300, "net": -300},
+            {"currency": "USD", "owed": 500, "owe": 0, "net": 500},
+        ]
+    }
+
+
+@pytest.mark.django_db
+def test_balance_summary_converted(client: Client) -> None:
+    """Test that per-currency totals can be converted into a home currency."""
+    # Arrange
+    create_test_currency(name="Euro", code="EUR", symbol="€")
+    expense = create_test_expense(amount=1000)
+    create_test_exchange_rate(expense.currency, rate="1.25")
+
+    client.force_login(expense.paid_by.user)
+
+    # Act
+    response = client.get("/api/balances/summary/?currency=eur")
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["total"] == {
+        "currency": "EUR",
+        "owed": 400,
+        "owe": 0,
+        "net": 400,
+    }
+
+
+@pytest.mark.django_db
+def test_balance_summary_unknown_currency(client: Client) -> None:
+    """Test that converting into an unknown currency is rejected."""
+    # Arrange
+    expense = create_test_expense()
+
+    client.force_login(expense.paid_by.user)
+
+    # Act
+    response = client.get("/api/balances/summary/?currency=XYZ")
+
+    # Assert
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+def test_import_expenses_upload(client: Client) -> None:
+    """Test that expenses can be imported from an uploaded CSV export."""
+    # Arrange
+    group = create_test_group()
+    members = create_test_members(group, 2)
+    upload = SimpleUploadedFile(
+        "export.csv",
+        b"Date,Description,Category,Cost,Currency,Al,member1\n"
+        b"2024-03-01,Tea,,4,USD,2,-2\n",
+        content_type="text/csv",
+    )
+
+    client.force_login(members[0].user)
+
+    # Act
+    response = client.post(
+        "/api/expenses/import/",
+        {"group": str(group.id), "file": upload, "members": ["Al=member0"]},
+    )
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"imported": 1, "skipped": 0, "failed": 0, "errors": []}
+    assert Expense.objects.get().paid_by == members[0]
+
+
+@pytest.mark.django_db
+def test_import_expenses_upload_not_a_member(client: Client) -> None:
+    """Test that users cannot import into groups they do not belong to."""
+    # Arrange
+    group = create_test_group()
+    upload = SimpleUploadedFile("export.csv", b"Date\n", content_type="text/csv")
+
+    client.force_login(create_test_user(username="outsider", email="o@a.com"))
+
+    # Act
+    response = client.post(
+        "/api/expenses/import/", {"group": str(group.id), "file": upload}
+    )
+
+    # Assert
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "group" in response.json()
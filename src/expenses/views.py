@@ -0,0 +1,400 @@
+"""Expenses views."""
+
+import io
+import uuid
+from typing import ClassVar
+
+from django.db.models import Exists, OuterRef, Q, QuerySet
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from categories.models import Category
+from core.conditional import etag_matches, make_etag, not_modified_response
+from core.pagination import KeysetPagination
+from currency.conversion import (
+    ExchangeRateNotFoundError,
+    UnknownCurrencyError,
+    convert_amounts,
+)
+from expenses.importers import ImportFileError, SplitwiseImporter
+from expenses.ledger import summarize_user_balances
+from expenses.models import (
+    Balance,
+    Expense,
+    ExpenseShare,
+    RecurringExpense,
+    Settlement,
+)
+from expenses.serializers import (
+    BalanceSerializer,
+    ExpenseFeedFilterSerializer,
+    ExpenseImportSerializer,
+    ExpenseSerializer,
+    RecurringExpenseSerializer,
+    SettlementSerializer,
+    SettleUpSerializer,
+    SpendingFilterSerializer,
+)
+from expenses.services import (
+    LedgerChangedError,
+    delete_expense,
+    delete_settlement,
+    settle_up_group,
+)
+from expenses.settle_up import get_settle_up
+from expenses.spending import get_spending
+from groups.models import Group
+
+
+class GroupScopedMixin:
+    """
+    Restrict a view set to rows of the groups the user belongs to.
+
+    The rows can be narrowed to one group with ``?group=<id>``.
+    """
+
+    INVALID_GROUP_ERROR = "Invalid group id."
+    GROUP_REQUIRED_ERROR = "A group is required."
+
+    def get_group_id(self) -> uuid.UUID | None:
+        """Return the group id passed as ``?group=``, if any."""
+        group_id = self.request.query_params.get("group")
+
+        if not group_id:
+            return None
+
+        try:
+            return uuid.UUID(group_id)
+        except ValueError as error:
+            raise ValidationError({"group": self.INVALID_GROUP_ERROR}) from error
+
+    def get_queryset(self) -> QuerySet:
+        """Get the rows of the user's groups."""
+        queryset = (
+            super().get_queryset().filter(group__group_members__user=self.request.user)
+        )
+
+        group_id = self.get_group_id()
+
+        if group_id:
+            queryset = queryset.filter(group_id=group_id)
+
+        return queryset
+
+
+class ExpenseViewSet(GroupScopedMixin, viewsets.ModelViewSet):
+    """
+    Expense view set.
+
+    The list is a feed ordered newest first by ``(date, id)`` with keyset
+    pagination, filterable by category (including its subcategories), payer,
+    member involvement and date range.
+
+    Within one group (``?group=``) each page is a range scan of an index ending
+    in ``(date, id)``. Without it, the rows of all the user's groups are read and
+    sorted, so clients of large groups should pass the group.
+    """
+
+    queryset = Expense.objects.all().prefetch_related("shares")
+    serializer_class = ExpenseSerializer
+    permission_classes: ClassVar = [IsAuthenticated]
+    pagination_class = KeysetPagination
+    ordering = ("-date", "-id")
+
+    def filter_queryset(self, queryset: QuerySet[Expense]) -> QuerySet[Expense]:
+        """Apply the feed filters given as query parameters."""
+        queryset = super().filter_queryset(queryset)
+
+        if self.action != "list":
+            return queryset
+
+        filters = ExpenseFeedFilterSerializer(data=self.request.query_params)
+        filters.is_valid(raise_exception=True)
+        params = filters.validated_data
+
+        if "category" in params:
+            # The ids are read first so a category without subcategories, the
+            # usual case, is an equality the category index can scan in order
+            category_ids = list(
+                Category.objects.descendants_of(
+                    params["category"], include_self=True
+                ).values_list("pk", flat=True)
+            )
+
+            if len(category_ids) == 1:
+                queryset = queryset.filter(category_id=category_ids[0])
+            else:
+                queryset = queryset.filter(category_id__in=category_ids)
+
+        if "paid_by" in params:
+            queryset = queryset.filter(paid_by_id=params["paid_by"])
+
+        if "member" in params:
+            queryset = queryset.filter(
+                Q(paid_by_id=params["member"])
+                | Exists(
+                    ExpenseShare.objects.filter(
+                        member_id=params["member"], expense=OuterRef("pk")
+                    )
+                )
+            )
+
+        if "date_from" in params:
+            queryset = queryset.filter(date__gte=params["date_from"])
+
+        if "date_to" in params:
+            queryset = queryset.filter(date__lte=params["date_to"])
+
+        return queryset
+
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="import",
+        serializer_class=ExpenseImportSerializer,
+    )
+    def import_expenses(self, request: Request) -> Response:
+        """
+        Import expenses into a group from a Splitwise-style CSV export.
+
+        The upload is streamed from the request's temporary file and written in
+        chunks; rows that cannot be imported are reported with their line number.
+        """
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        group = serializer.validated_data["group"]
+
+        if not group.group_members.filter(user=request.user).exists():
+            raise ValidationError({"group": ExpenseSerializer.NOT_A_MEMBER_ERROR})
+
+        importer = SplitwiseImporter(
+            group,
+            created_by=request.user,
+            members=serializer.validated_data["members"],
+        )
+        upload = serializer.validated_data["file"]
+
+        try:
+            result = importer.run(
+                io.TextIOWrapper(upload.file, encoding="utf-8-sig", newline="")
+            )
+        except ImportFileError as error:
+            raise ValidationError({"file": str(error)}) from error
+
+        return Response(
+            {
+                "imported": result.imported,
+                "skipped": result.skipped,
+                "failed": result.failed,
+                "errors": result.errors,
+            }
+        )
+
+    @action(detail=False, methods=["get"], url_path="spending")
+    def spending(self, request: Request) -> Response:
+        """
+        Return a group's spending per category and month.
+
+        Totals are read from the monthly spending rollup rather than from the
+        expenses, and subcategories are rolled up into their top-level category,
+        or into the direct subcategories of ``?category=<id>``. The range
+        defaults to this year.
+        """
+        group_id = self.get_group_id()
+
+        if group_id is None:
+            raise ValidationError({"group": self.GROUP_REQUIRED_ERROR})
+
+        group = Group.objects.filter(
+            pk=group_id, group_members__user=request.user
+        ).first()
+
+        if group is None:
+            raise NotFound
+
+        filters = SpendingFilterSerializer(data=request.query_params)
+        filters.is_valid(raise_exception=True)
+        params = filters.validated_data
+
+        return Response(
+            {
+                "group": str(group.pk),
+                "date_from": params["date_from"],
+                "date_to": params["date_to"],
+                "categories": get_spending(
+                    group,
+                    params["date_from"],
+                    params["date_to"],
+                    category=params.get("category"),
+                ),
+            }
+        )
+
+    def perform_create(self, serializer: ExpenseSerializer) -> None:
+        """Perform the create action."""
+        serializer.save(created_by=self.request.user)
+
+    def perform_destroy(self, instance: Expense) -> None:
+        """Perform the destroy action."""
+        delete_expense(instance)
+
+
+class RecurringExpenseViewSet(GroupScopedMixin, viewsets.ModelViewSet):
+    """Recurring expense view set."""
+
+    queryset = (
+        RecurringExpense.objects.all()
+        .prefetch_related("participants")
+        .order_by("next_run", "id")
+    )
+    serializer_class = RecurringExpenseSerializer
+    permission_classes: ClassVar = [IsAuthenticated]
+
+    def perform_create(self, serializer: RecurringExpenseSerializer) -> None:
+        """Perform the create action."""
+        serializer.save(created_by=self.request.user)
+
+
+class SettlementViewSet(GroupScopedMixin, viewsets.ModelViewSet):
+    """Settlement view set, listed newest first with keyset pagination."""
+
+    queryset = Settlement.objects.all()
+    serializer_class = SettlementSerializer
+    permission_classes: ClassVar = [IsAuthenticated]
+    pagination_class = KeysetPagination
+    ordering = ("-date", "-id")
+
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="settle-up",
+        serializer_class=SettleUpSerializer,
+    )
+    def settle_up(self, request: Request) -> Response:
+        """
+        Record every settle-up suggestion of a group in one request.
+
+        Pass the ``ledger_version`` the suggestions were read at to make sure the
+        balances have not changed in the meantime.
+        """
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        group = serializer.validated_data["group"]
+
+        if not group.group_members.filter(user=request.user).exists():
+            raise ValidationError({"group": ExpenseSerializer.NOT_A_MEMBER_ERROR})
+
+        try:
+            settlements = settle_up_group(
+                group,
+                created_by=request.user,
+                ledger_version=serializer.validated_data.get("ledger_version"),
+            )
+        except LedgerChangedError as error:
+            raise ValidationError({"ledger_version": str(error)}) from error
+
+        return Response(
+            SettlementSerializer(settlements, many=True).data,
+            status=status.HTTP_201_CREATED,
+        )
+
+    def perform_create(self, serializer: SettlementSerializer) -> None:
+        """Perform the create action."""
+        serializer.save(created_by=self.request.user)
+
+    def perform_destroy(self, instance: Settlement) -> None:
+        """Perform the destroy action."""
+        delete_settlement(instance)
+
+
+class BalanceViewSet(GroupScopedMixin, viewsets.ReadOnlyModelViewSet):
+    """Balance view set, reading the ledger maintained by the expense services."""
+
+    queryset = Balance.objects.all().order_by("group", "currency", "-amount")
+    serializer_class = BalanceSerializer
+    permission_classes: ClassVar = [IsAuthenticated]
+
+    @action(detail=False, methods=["get"], url_path="settle-up")
+    def settle_up(self, request: Request) -> Response:
+        """
+        Return the fewest transfers that settle a group's balances.
+
+        The suggestions are cached on the group's ledger version, which is also
+        the response's ETag version, so repeated reads are answered with a 304.
+        """
+        group_id = self.get_group_id()
+
+        if group_id is None:
+            raise ValidationError({"group": self.GROUP_REQUIRED_ERROR})
+
+        group = Group.objects.filter(
+            pk=group_id, group_members__user=request.user
+        ).first()
+
+        if group is None:
+            raise NotFound
+
+        etag = make_etag(str(group.ledger_version), "settle-up", group.pk)
+
+        if etag_matches(request.headers.get("If-None-Match"), etag):
+            return not_modified_response(etag)
+
+        return Response(
+            {
+                "group": str(group.pk),
+                "ledger_version": group.ledger_version,
+                "transfers": get_settle_up(group),
+            },
+            headers={"ETag": etag},
+        )
+
+    @action(detail=False, methods=["get"], url_path="summary")
+    def summary(self, request: Request) -> Response:
+        """
+        Return what the user owes and is owed across all of their groups.
+
+        Totals are per currency; with ``?currency=<code>`` they are also converted
+        into that currency and added up.
+        """
+        totals = [
+            {
+                "currency": row["currency__code"],
+                "owed": row["owed"],
+                "owe": row["owe"],
+                "net": row["net"],
+            }
+            for row in summarize_user_balances(request.user)
+        ]
+
+        data: dict = {"currencies": totals}
+        to_currency = request.query_params.get("currency")
+
+        if to_currency:
+            data["total"] = self.convert_totals(totals, to_currency.upper())
+
+        return Response(data)
+
+    def convert_totals(self, totals: list[dict], to_currency: str) -> dict:
+        """Convert per-currency totals into one currency in a single batch."""
+        codes = [total["currency"] for total in totals]
+
+        try:
+            converted = convert_amounts(
+                [total["owed"] for total in totals]
+                + [total["owe"] for total in totals],
+                codes + codes,
+                to_currency,
+            )
+        except (UnknownCurrencyError, ExchangeRateNotFoundError) as error:
+            raise ValidationError({"currency": str(error)}) from error
+
+        owed = sum(converted[: len(totals)])
+        owe = sum(converted[len(totals) :])
+
+        return {"currency": to_currency, "owed": owed, "owe": owe, "net": owed - owe}
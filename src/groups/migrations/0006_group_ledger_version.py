@@ -0,0 +1,18 @@
+# Generated by Django 5.1.3 on 2026-10-19 06:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('groups', '0005_group_unique_group_title_per_user_case_insensitive_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='group',
+            name='ledger_version',
+            field=models.PositiveBigIntegerField(default=0, editable=False),
+        ),
+    ]
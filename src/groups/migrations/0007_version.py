@@ -0,0 +1,23 @@
+# Generated by Django 5.1.3 on 2026-10-19 06:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('groups', '0006_group_ledger_version'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='group',
+            name='version',
+            field=models.PositiveIntegerField(default=1, editable=False),
+        ),
+        migrations.AddField(
+            model_name='groupmember',
+            name='version',
+            field=models.PositiveIntegerField(default=1, editable=False),
+        ),
+    ]
@@ -9,6 +9,7 @@ from django.db.models.signals import post_save
 from django.dispatch import receiver
 
 from categories.models import Category
+from core.models import VersionedModelMixin
 from currency.models import Currency
 
 
@@ -20,7 +21,7 @@ class GroupMemberRole(models.TextChoices):
     OWNER = "owner", "Owner"
 
 
-class Group(models.Model):
+class Group(VersionedModelMixin, models.Model):
     """
     Model representing a group.
 
@@ -34,6 +35,10 @@ class Group(models.Model):
         - categories: ManyToManyField to the group's categories
         - created_by: ForeignKey to the user who created the group
         - updated_by: ForeignKey to the user who last updated the group
+        - ledger_version: PositiveBigIntegerField bumped whenever the group's
+          balances change
+        - version: PositiveIntegerField bumped on every save, used for ETags and
+          optimistic concurrency with If-Match
         - created_at: DateTimeField representing when the group was created
         - updated_at: DateTimeField representing when the group was last updated
 
@@ -73,6 +78,10 @@ class Group(models.Model):
         related_name="updated_groups",
     )
 
+    ledger_version = models.PositiveBigIntegerField(default=0, editable=False)
+
+    version = models.PositiveIntegerField(default=1, editable=False)
+
     created_at = models.DateTimeField(auto_now_add=True)
 
     updated_at = models.DateTimeField(auto_now=True)
@@ -93,7 +102,7 @@ class Group(models.Model):
         return self.title
 
 
-class GroupMember(models.Model):
+class GroupMember(VersionedModelMixin, models.Model):
     """
     Model representing a group member.
 
@@ -102,6 +111,8 @@ class GroupMember(models.Model):
         - user: ForeignKey to the group member's user
         - group: ForeignKey to the group the member belongs to
         - role: CharField representing the group member's role
+        - version: PositiveIntegerField bumped on every save, used for ETags and
+          optimistic concurrency with If-Match
         - created_at: DateTimeField representing when the group member was created
         - updated_at: DateTimeField representing when the group member was last updated
 
@@ -121,6 +132,8 @@ class GroupMember(models.Model):
         max_length=50, choices=GroupMemberRole.choices, default=GroupMemberRole.MEMBER
     )
 
+    version = models.PositiveIntegerField(default=1, editable=False)
+
     created_at = models.DateTimeField(auto_now_add=True)
 
     updated_at = models.DateTimeField(auto_now=True)
@@ -1,15 +1,32 @@
 """Group serializers."""
 
+from typing import ClassVar
+
 from rest_framework import serializers
 
+from categories.serializers import CategorySerializer
+from core.serializers import DynamicFieldsMixin
+from currency.serializers import CurrencySerializer
 from groups.models import Group, GroupMember
+from users.serializers import UserSerializer
+
 
+class GroupSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    """
+    Group serializer.
 
-class GroupSerializer(serializers.ModelSerializer):
-    """Group serializer."""
+    Supports ``?fields=`` to trim the response and ``?expand=`` to inline the
+    currency, categories and creator.
+    """
 
     DUPLICATE_TITLE_ERROR = "A group with this title already exists for this user."
 
+    expandable_fields: ClassVar = {
+        "currency": (CurrencySerializer, {}),
+        "categories": (CategorySerializer, {"many": True}),
+        "created_by": (UserSerializer, {}),
+    }
+
     def validate_title(self, value: str) -> str:
         """Validate that the title is unique for the current user."""
         request = self.context.get("request")
@@ -40,11 +57,18 @@ class GroupSerializer(serializers.ModelSerializer):
             "categories",
             "created_by",
             "updated_by",
+            "version",
             "created_at",
             "updated_at",
         )
 
-        read_only_fields = ("created_by", "updated_by", "created_at", "updated_at")
+        read_only_fields = (
+            "created_by",
+            "updated_by",
+            "version",
+            "created_at",
+            "updated_at",
+        )
 
 
 class GroupMemberSerializer(serializers.ModelSerializer):
@@ -55,4 +79,4 @@ class GroupMemberSerializer(serializers.ModelSerializer):
 
         model = GroupMember
 
-        fields = ("id", "user", "group", "role", "created_at", "updated_at")
+        fields = ("id", "user", "group", "role", "version", "created_at", "updated_at")
@@ -5,7 +5,8 @@ from django.test import Client
 from rest_framework import status
 
 from core.test_helpers import create_test_user
-from groups.models import GroupMemberRole
+from expenses.tests.test_helpers import create_test_expense
+from groups.models import GroupMember, GroupMemberRole
 from groups.tests.groupMembers.test_helpers import create_test_group_member
 from groups.tests.groups.test_helpers import create_test_group
 
@@ -296,6 +297,38 @@ class TestEditGroupMemberView:
         # Assert
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
+    @pytest.mark.django_db
+    def test_edit_group_member_stale_etag_fails(self, client: Client) -> None:
+        """Test that editing a group member from an outdated copy fails."""
+        # Arrange
+        user = create_test_user(username="testuser1", email="testuser1@email.com")
+        group = create_test_group()
+        group_member = create_test_group_member(user=user, group=group)
+
+        client.force_login(user)
+
+        etag = client.get(f"/api/group-members/{group_member.id}/")["ETag"]
+        client.patch(
+            f"/api/group-members/{group_member.id}/",
+            {"role": GroupMemberRole.ADMIN},
+            "application/json",
+            HTTP_IF_MATCH=etag,
+        )
+
+        # Act
+        response = client.patch(
+            f"/api/group-members/{group_member.id}/",
+            {"role": GroupMemberRole.MEMBER},
+            "application/json",
+            HTTP_IF_MATCH=etag,
+        )
+
+        # Assert
+        group_member.refresh_from_db()
+
+        assert response.status_code == status.HTTP_412_PRECONDITION_FAILED
+        assert group_member.role == GroupMemberRole.ADMIN
+
 
 class TestRetrieveGroupMemberView:
     """Test retrieve group member view."""
@@ -433,3 +466,25 @@ class TestDeleteGroupMemberView:
 
         # Assert
         assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    @pytest.mark.django_db
+    def test_delete_group_member_with_shares_fails(self, client: Client) -> None:
+        """Test that a member who shares in expenses cannot be removed."""
+        # Arrange
+        user = create_test_user(username="testuser1", email="testuser1@email.com")
+        group = create_test_group()
+        group_member = create_test_group_member(user=user, group=group)
+        create_test_expense(group=group, participants=[group_member])
+
+        client.force_login(user)
+
+        # Act
+        response = client.delete(f"/api/group-members/{group_member.id}/")
+
+        # Assert
+        assert response.status_code == status.HTTP_409_CONFLICT
+        assert response.json()["detail"] == (
+            "This member has expenses or settlements in the group and cannot be "
+            "removed."
+        )
+        assert GroupMember.objects.filter(id=group_member.id).exists()
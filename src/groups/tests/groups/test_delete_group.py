@@ -9,6 +9,9 @@ from rest_framework import status
 from categories.tests.test_helpers import create_emoji_test_category
 from core.test_helpers import create_test_image, create_test_user
 from currency.tests.test_helpers import create_test_currency
+from expenses.models import Expense, ExpenseShare, Settlement
+from expenses.services import create_settlement
+from expenses.tests.test_helpers import create_test_expense
 from groups.models import Group
 from groups.tests.groups.test_helpers import create_test_group
 
@@ -92,3 +95,32 @@ def test_not_found_fails(client: Client) -> None:
     assert response.status_code == status.HTTP_404_NOT_FOUND
 
     assert Group.objects.count() == 0
+
+
+@pytest.mark.django_db
+def test_delete_group_with_expenses_success(client: Client) -> None:
+    """Test that a group is deleted with its expenses, shares and settlements."""
+    # Arrange
+    user = create_test_user()
+    group = create_test_group(created_by=user)
+    expense = create_test_expense(group=group)
+    payer, payee = expense.shares.values_list("member", flat=True)
+    create_settlement(
+        group=group,
+        payer_id=payer,
+        payee_id=payee,
+        amount=500,
+        currency=group.currency,
+    )
+
+    client.force_login(user)
+
+    # Act
+    response = client.delete(f"/api/groups/{group.id}/")
+
+    # Assert
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+    assert not Group.objects.filter(id=group.id).exists()
+    assert not Expense.objects.exists()
+    assert not ExpenseShare.objects.exists()
+    assert not Settlement.objects.exists()
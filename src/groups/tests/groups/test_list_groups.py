@@ -1,5 +1,7 @@
 """Test list groups."""
 
+from collections.abc import Callable
+
 import pytest
 from django.test import Client
 from rest_framework import status
@@ -345,3 +347,96 @@ def test_list_groups_with_and_without_categories_success(client: Client) -> None
     assert results[1]["updated_by"] is None
     assert results[1]["created_at"]
     assert results[1]["updated_at"]
+
+
+@pytest.mark.django_db
+def test_list_not_modified(client: Client) -> None:
+    """Test that listing groups with a matching ETag returns 304."""
+    # Arrange
+    user = create_test_user()
+    create_test_group(created_by=user)
+
+    client.force_login(user)
+    etag = client.get("/api/groups/")["ETag"]
+
+    # Act
+    response = client.get("/api/groups/", headers={"If-None-Match": etag})
+
+    # Assert
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response["ETag"] == etag
+
+
+@pytest.mark.django_db
+def test_list_modified_after_update(client: Client) -> None:
+    """Test that the groups list ETag changes once a group is updated."""
+    # Arrange
+    user = create_test_user()
+    group = create_test_group(created_by=user)
+
+    client.force_login(user)
+    etag = client.get("/api/groups/")["ETag"]
+
+    group.title = "Lads sesh 🍻"
+    group.save()
+
+    # Act
+    response = client.get("/api/groups/", headers={"If-None-Match": etag})
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["results"][0]["title"] == "Lads sesh 🍻"
+
+
+@pytest.mark.django_db
+def test_list_expand_constant_queries(
+    client: Client, django_assert_num_queries: Callable
+) -> None:
+    """Test that expanding related fields does not add queries per group."""
+    # Arrange
+    user = create_test_user()
+    category = create_emoji_test_category(name="Trip", emoji="🛫")
+
+    for index in range(5):
+        owner = create_test_user(
+            username=f"user_{index}", email=f"user_{index}@email.com"
+        )
+        group = create_test_group(title=f"Group {index}", created_by=owner)
+        group.categories.add(category)
+
+    client.force_login(user)
+
+    # Act
+    # session, user, count, page of groups (joined with currency and creator),
+    # and one prefetch for the categories; expanded lists are not tagged.
+    with django_assert_num_queries(5):
+        response = client.get("/api/groups/?expand=currency,categories,created_by")
+
+    response_data = response.json()
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response_data["results"]) == 5  # noqa: PLR2004
+
+    for result in response_data["results"]:
+        assert result["currency"]["code"] == "USD"
+        assert result["categories"][0]["name"] == "Trip"
+        assert result["created_by"]["username"].startswith("user_")
+
+
+@pytest.mark.django_db
+def test_list_sparse_fields_success(client: Client) -> None:
+    """Test that listed groups only contain the requested fields."""
+    # Arrange
+    user = create_test_user()
+    group = create_test_group(created_by=user)
+
+    client.force_login(user)
+
+    # Act
+    response = client.get("/api/groups/?fields=id,title")
+    response_data = response.json()
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert response_data["results"] == [{"id": str(group.id), "title": group.title}]
@@ -1,5 +1,7 @@
 """Test retrieve group."""
 
+from collections.abc import Callable
+
 import pytest
 from django.test import Client
 from rest_framework import status
@@ -129,3 +131,117 @@ def test_nonexistent_group_id_fails(client: Client) -> None:
 
     # Assert
     assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+def test_retrieve_not_modified(
+    client: Client, django_assert_max_num_queries: Callable
+) -> None:
+    """Test that a matching If-None-Match returns 304 without serializing the group."""
+    # Arrange
+    user = create_test_user()
+    group = create_test_group(created_by=user)
+
+    client.force_login(user)
+    response = client.get(f"/api/groups/{group.id}/")
+    etag = response["ETag"]
+
+    # Act
+    with django_assert_max_num_queries(3):
+        response = client.get(
+            f"/api/groups/{group.id}/", headers={"If-None-Match": etag}
+        )
+
+    # Assert
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response["ETag"] == etag
+
+
+@pytest.mark.django_db
+def test_retrieve_etag_varies_with_query_string(client: Client) -> None:
+    """Test that different representations of a group have different ETags."""
+    # Arrange
+    user = create_test_user()
+    group = create_test_group(created_by=user)
+
+    client.force_login(user)
+
+    # Act
+    plain_etag = client.get(f"/api/groups/{group.id}/")["ETag"]
+    other_etag = client.get(f"/api/groups/{group.id}/?format=json")["ETag"]
+
+    # Assert
+    assert plain_etag != other_etag
+
+
+@pytest.mark.django_db
+def test_retrieve_sparse_fields_success(client: Client) -> None:
+    """Test that only the requested fields are returned."""
+    # Arrange
+    user = create_test_user()
+    group = create_test_group(created_by=user)
+
+    client.force_login(user)
+
+    # Act
+    response = client.get(f"/api/groups/{group.id}/?fields=id,title")
+    response_data = response.json()
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert response_data == {"id": str(group.id), "title": group.title}
+
+
+@pytest.mark.django_db
+def test_retrieve_expand_success(client: Client) -> None:
+    """Test that expanded related fields are inlined."""
+    # Arrange
+    user = create_test_user()
+    currency = create_test_currency()
+    category = create_emoji_test_category(name="Trip", emoji="🛫")
+
+    group = create_test_group(currency=currency, created_by=user)
+    group.categories.add(category)
+
+    client.force_login(user)
+
+    # Act
+    response = client.get(
+        f"/api/groups/{group.id}/?expand=currency,categories,created_by"
+    )
+    response_data = response.json()
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert response_data["currency"]["code"] == currency.code
+    assert response_data["currency"]["symbol"] == currency.symbol
+    assert response_data["categories"][0]["name"] == "Trip"
+    assert response_data["created_by"]["id"] == str(user.pk)
+    assert response_data["created_by"]["username"] == user.username
+    assert response_data["updated_by"] is None
+
+
+@pytest.mark.django_db
+def test_retrieve_expand_not_conditional(client: Client) -> None:
+    """Test that an expanded group is not answered with a 304 from a stale ETag."""
+    # Arrange
+    user = create_test_user()
+    currency = create_test_currency()
+    group = create_test_group(currency=currency, created_by=user)
+
+    client.force_login(user)
+    plain_etag = client.get(f"/api/groups/{group.id}/")["ETag"]
+
+    currency.symbol = "€"
+    currency.save()
+
+    # Act
+    response = client.get(
+        f"/api/groups/{group.id}/?expand=currency",
+        headers={"If-None-Match": plain_etag},
+    )
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert "ETag" not in response
+    assert response.json()["currency"]["symbol"] == "€"
@@ -512,3 +512,156 @@ def test_update_group_malformed_category_id_fails(client: Client) -> None:
     # Assert
     assert response.status_code == status.HTTP_400_BAD_REQUEST
     assert response_data["categories"][0] == "“not-a-uuid” is not a valid UUID."
+
+
+@pytest.mark.django_db
+def test_patch_with_current_etag_success(client: Client) -> None:
+    """Test that an update sent with the current ETag succeeds and bumps it."""
+    # Arrange
+    user = create_test_user()
+    group = create_test_group(created_by=user)
+
+    client.force_login(user)
+
+    etag = client.get(f"/api/groups/{group.id}/")["ETag"]
+
+    # Act
+    response = client.patch(
+        f"/api/groups/{group.id}/",
+        {"title": "Edited"},
+        "application/json",
+        HTTP_IF_MATCH=etag,
+    )
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["version"] == 2  # noqa: PLR2004
+    assert response["ETag"] != etag
+    assert response["ETag"] == client.get(f"/api/groups/{group.id}/")["ETag"]
+
+
+@pytest.mark.django_db
+def test_patch_with_stale_etag_fails(client: Client) -> None:
+    """Test that an update based on an outdated copy is rejected with a 412."""
+    # Arrange
+    user = create_test_user()
+    group = create_test_group(created_by=user)
+
+    client.force_login(user)
+
+    etag = client.get(f"/api/groups/{group.id}/")["ETag"]
+    client.patch(f"/api/groups/{group.id}/", {"title": "First"}, "application/json")
+
+    # Act
+    response = client.patch(
+        f"/api/groups/{group.id}/",
+        {"title": "Second"},
+        "application/json",
+        HTTP_IF_MATCH=etag,
+    )
+
+    # Assert
+    group.refresh_from_db()
+
+    assert response.status_code == status.HTTP_412_PRECONDITION_FAILED
+    assert group.title == "First"
+    assert group.version == 2  # noqa: PLR2004
+
+
+@pytest.mark.django_db
+def test_patch_after_direct_save_fails(client: Client) -> None:
+    """Test that a change saved outside the API, as the admin does, moves the ETag."""
+    # Arrange
+    user = create_test_user()
+    group = create_test_group(created_by=user)
+
+    client.force_login(user)
+
+    etag = client.get(f"/api/groups/{group.id}/")["ETag"]
+    group.title = "Edited in the admin"
+    group.save()
+
+    # Act
+    response = client.patch(
+        f"/api/groups/{group.id}/",
+        {"title": "Edited"},
+        "application/json",
+        HTTP_IF_MATCH=etag,
+    )
+
+    # Assert
+    assert group.version == 2  # noqa: PLR2004
+    assert response.status_code == status.HTTP_412_PRECONDITION_FAILED
+    assert client.get(f"/api/groups/{group.id}/")["ETag"] != etag
+
+
+@pytest.mark.django_db
+def test_patch_with_weak_etag_fails(client: Client) -> None:
+    """Test that If-Match uses the strong comparison, so weak tags never match."""
+    # Arrange
+    user = create_test_user()
+    group = create_test_group(created_by=user)
+
+    client.force_login(user)
+
+    etag = client.get(f"/api/groups/{group.id}/")["ETag"]
+
+    # Act
+    response = client.patch(
+        f"/api/groups/{group.id}/",
+        {"title": "Edited"},
+        "application/json",
+        HTTP_IF_MATCH=f"W/{etag}",
+    )
+
+    # Assert
+    assert response.status_code == status.HTTP_412_PRECONDITION_FAILED
+
+
+@pytest.mark.django_db
+def test_patch_invalid_keeps_version(client: Client) -> None:
+    """Test that an update failing validation does not bump the version."""
+    # Arrange
+    user = create_test_user()
+    group = create_test_group(created_by=user)
+
+    client.force_login(user)
+
+    # Act
+    response = client.patch(
+        f"/api/groups/{group.id}/",
+        {"currency": "not-a-currency"},
+        "application/json",
+        HTTP_IF_MATCH='"1-abc"',
+    )
+
+    # Assert
+    group.refresh_from_db()
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert group.version == 1
+
+
+@pytest.mark.django_db
+def test_patch_ignores_expand(client: Client) -> None:
+    """Test that ?expand= does not make related fields read-only on writes."""
+    # Arrange
+    user = create_test_user()
+    group = create_test_group(created_by=user)
+    currency = create_test_currency(name="Euro", code="EUR", symbol="€")
+
+    client.force_login(user)
+
+    # Act
+    response = client.patch(
+        f"/api/groups/{group.id}/?expand=currency",
+        {"currency": str(currency.id)},
+        "application/json",
+    )
+
+    # Assert
+    group.refresh_from_db()
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["currency"] == str(currency.id)
+    assert group.currency == currency
@@ -2,21 +2,64 @@
 
 from typing import ClassVar
 
-from rest_framework import permissions, viewsets
+from django.db.models import QuerySet, RestrictedError
+from rest_framework import permissions, status, viewsets
+from rest_framework.exceptions import APIException
 from rest_framework.permissions import IsAuthenticated
 
+from core.concurrency import OptimisticConcurrencyMixin
+from core.idempotency import IdempotentCreateMixin
+from core.replicas import ReplicaReadMixin
 from groups.models import Group, GroupMember
 from groups.permissions import IsGroupAdminOrOwner, IsGroupOwner
 from groups.serializers import GroupMemberSerializer, GroupSerializer
 
 
-class GroupViewSet(viewsets.ModelViewSet):
-    """Group view set."""
+class MemberHasActivityError(APIException):
+    """Raised when removing a member who paid or shares in expenses or settlements."""
+
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = (
+        "This member has expenses or settlements in the group and cannot be removed."
+    )
+    default_code = "member_has_activity"
+
+
+class GroupViewSet(
+    ReplicaReadMixin,
+    IdempotentCreateMixin,
+    OptimisticConcurrencyMixin,
+    viewsets.ModelViewSet,
+):
+    """Group view set, with If-Match checked against the group's version."""
 
     queryset = Group.objects.all().order_by("title")
     serializer_class = GroupSerializer
     permission_classes: ClassVar = [IsAuthenticated]
 
+    def get_queryset(self) -> QuerySet[Group]:
+        """
+        Get the queryset, preloading the related fields a list response needs.
+
+        Single objects are left lazy so a conditional retrieve answered with a 304
+        does not pay for prefetching.
+        """
+        queryset = super().get_queryset()
+
+        if self.action == "list":
+            return GroupSerializer.get_eager_queryset(queryset, self.request)
+
+        return queryset
+
+    def has_conditional_response(self) -> bool:
+        """
+        Tag only unexpanded responses.
+
+        The ETag versions the group row alone, so it cannot tell when an
+        expanded currency, category or user changed.
+        """
+        return not GroupSerializer.get_expanded_fields(self.request)
+
     def get_permissions(self) -> list[permissions.BasePermission]:
         """Get the permissions for the view."""
         if self.action == "destroy":
@@ -36,9 +79,26 @@ class GroupViewSet(viewsets.ModelViewSet):
         serializer.save(updated_by=self.request.user)
 
 
-class GroupMemberViewSet(viewsets.ModelViewSet):
-    """Group member view set."""
+class GroupMemberViewSet(
+    ReplicaReadMixin,
+    IdempotentCreateMixin,
+    OptimisticConcurrencyMixin,
+    viewsets.ModelViewSet,
+):
+    """Group member view set, with If-Match checked against the member's version."""
 
     queryset = GroupMember.objects.all()
 
     serializer_class = GroupMemberSerializer
+
+    def perform_destroy(self, instance: GroupMember) -> None:
+        """
+        Delete the member, unless the group's expenses or settlements refer to it.
+
+        Removing them would change the other members' balances, so the member
+        stays until they are deleted.
+        """
+        try:
+            instance.delete()
+        except RestrictedError as error:
+            raise MemberHasActivityError from error
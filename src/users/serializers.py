@@ -0,0 +1,16 @@
+"""User serializers."""
+
+from rest_framework import serializers
+
+from users.models import User
+
+
+class UserSerializer(serializers.ModelSerializer):
+    """User serializer."""
+
+    class Meta:
+        """Meta class."""
+
+        model = User
+
+        fields = ("id", "username", "first_name", "last_name")